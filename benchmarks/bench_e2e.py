@@ -0,0 +1,192 @@
+"""End-to-end benchmark through the MCP tool layer against a fake Amadeus
+
+Starts `benchmarks.fake_amadeus` in a subprocess, points the server at it and
+drives `search_flights` / `search_cities` over an in-memory MCP client session
+(the real protocol, tool dispatch and serialization path) at `--concurrency`.
+Reports p50/p95/p99 latency per tool, requests/second, errors and the upstream
+calls the fake server received; with --metrics, also the server's per-stage
+breakdown from the metrics://server resource. Fully offline.
+
+    python -m benchmarks.bench_e2e [--requests 400] [--concurrency 16] [--distinct 20]
+                                   [--latency-ms 150] [--error-rate 0.01] [--throttle-rate 0.02]
+                                   [--offers 250] [--no-cache] [--metrics]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+
+from benchmarks.payloads import AIRPORTS, ROOT_DIR, prepare_environment
+
+# Cities missing from the bundled index, so they reach the (fake) Amadeus endpoint
+UNKNOWN_CITIES = ["Atlantis", "Gotham", "Springfield", "Zootopia", "Wakanda"]
+KNOWN_CITIES = ["Lisbon", "Paris", "Madrid", "Sao Paulo", "London"]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_fake_amadeus(args: argparse.Namespace, port: int) -> subprocess.Popen:
+    command = [
+        sys.executable, "-m", "benchmarks.fake_amadeus",
+        "--port", str(port),
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate),
+        "--throttle-rate", str(args.throttle_rate),
+        "--offers", str(args.offers)
+    ]
+    process = subprocess.Popen(command, cwd=ROOT_DIR)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return process
+        time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("fake Amadeus server did not start")
+
+
+def configure_server(args: argparse.Namespace, port: int):
+    """Environment for the server under test, set before it is imported"""
+    prepare_environment()
+    os.environ.update({
+        "AMADEUS_API_BASE": f"http://127.0.0.1:{port}",
+        "FLIGHT_CACHE_ENABLED": "false" if args.no_cache else "true",
+        "PERSISTENT_CACHE_ENABLED": "false",
+        "MCP_FLIGHT_WARMUP": "false",
+        "METRICS_ENABLED": "true" if args.metrics else "false",
+        # The production default (10/s, the Amadeus test quota) would dominate the measurement
+        "AMADEUS_FLIGHTS_RATE_LIMIT": str(args.rate_limit),
+        "AMADEUS_FLIGHTS_BURST": str(max(1, int(args.rate_limit // 10))),
+        "AMADEUS_LOCATIONS_RATE_LIMIT": str(args.rate_limit),
+        "AMADEUS_LOCATIONS_BURST": str(max(1, int(args.rate_limit // 10)))
+    })
+
+
+def build_workload(args: argparse.Namespace) -> list[tuple[str, dict]]:
+    rng = random.Random(args.seed)
+    routes = []
+    while len(routes) < args.distinct:
+        origin, destination = rng.sample(AIRPORTS, 2)
+        day = rng.randint(1, 28)
+        routes.append({
+            "origin_location_code": origin,
+            "destination_location_code": destination,
+            "departure_date": f"2026-03-{day:02d}",
+            "return_date": f"2026-04-{day:02d}",
+            "max_results": args.offers
+        })
+    
+    workload = []
+    for _ in range(args.requests):
+        if rng.random() < args.cities_share:
+            workload.append(("search_cities", {"keyword": rng.choice(UNKNOWN_CITIES + KNOWN_CITIES)}))
+        else:
+            workload.append(("search_flights", rng.choice(routes)))
+    return workload
+
+
+async def drive(server, workload: list[tuple[str, dict]], concurrency: int) -> tuple[dict, int, float, dict]:
+    from mcp.shared.memory import create_connected_server_and_client_session
+    
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in workload:
+        queue.put_nowait(item)
+    
+    async with create_connected_server_and_client_session(server._mcp_server) as client:
+        async def worker():
+            nonlocal errors
+            while not queue.empty():
+                tool, arguments = queue.get_nowait()
+                started = time.perf_counter()
+                result = await client.call_tool(tool, arguments)
+                latencies[tool].append(time.perf_counter() - started)
+                if result.isError or "error" in json.loads(result.content[0].text):
+                    errors += 1
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        
+        resource = await client.read_resource("metrics://server")
+        metrics = json.loads(resource.contents[0].text)
+    return latencies, errors, elapsed, metrics
+
+
+def upstream_stats(port: int) -> dict:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stats") as response:
+        return json.load(response)
+
+
+def percentile(values: list[float], q: int) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--distinct", type=int, default=20, help="distinct flight searches in the workload")
+    parser.add_argument("--cities-share", type=float, default=0.2, help="share of search_cities calls")
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--offers", type=int, default=250)
+    parser.add_argument("--rate-limit", type=float, default=200.0, help="client-side requests/second per endpoint")
+    parser.add_argument("--no-cache", action="store_true", help="disable the in-memory flight cache")
+    parser.add_argument("--metrics", action="store_true", help="record and print the server's per-stage timings")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    
+    port = free_port()
+    fake = start_fake_amadeus(args, port)
+    try:
+        configure_server(args, port)
+        import mcp_server
+        server = mcp_server.create_server(lifespan=mcp_server.lifespan)
+        # Retries against injected failures are expected; keep the report readable
+        logging.getLogger().setLevel(logging.ERROR)
+        
+        latencies, errors, elapsed, metrics = asyncio.run(drive(server, build_workload(args), args.concurrency))
+        upstream = upstream_stats(port)
+    finally:
+        fake.terminate()
+        fake.wait(timeout=10)
+    
+    total = sum(len(values) for values in latencies.values())
+    print(f"requests: {total}, concurrency: {args.concurrency}, distinct searches: {args.distinct}, "
+          f"cache: {'off' if args.no_cache else 'on'}, upstream latency: {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms")
+    print(f"{'tool':<16} {'calls':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for tool, values in sorted(latencies.items()):
+        print(f"{tool:<16} {len(values):>6} {percentile(values, 50) * 1000:>8.1f} "
+              f"{percentile(values, 95) * 1000:>8.1f} {percentile(values, 99) * 1000:>8.1f}")
+    print(f"throughput: {total / elapsed:.1f} requests/s over {elapsed:.2f}s, tool errors: {errors}")
+    print("upstream calls: " + ", ".join(f"{key}={value}" for key, value in sorted(upstream.items())))
+    
+    if metrics.get("enabled"):
+        print(f"\n{'server stage':<58} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for stage, summary in metrics["stages"].items():
+            print(f"{stage:<58} {summary['count']:>6} {summary['p50'] * 1000:>8.2f} "
+                  f"{summary['p95'] * 1000:>8.2f} {summary['p99'] * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
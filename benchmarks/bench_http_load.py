@@ -0,0 +1,107 @@
+"""Load test for the streamable HTTP transport
+
+Starts `mcp_server.py --transport streamable-http` with `--workers` processes
+and opens `--sessions` concurrent MCP client sessions, each initializing and
+calling `search_cities` `--calls` times. City lookups are answered by the
+local IATA index, so the run is offline and measures the MCP serving path
+(HTTP, session handling, tool dispatch, JSON) rather than Amadeus.
+
+    python -m benchmarks.bench_http_load [--workers 1] [--sessions 32] [--calls 20]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.payloads import ROOT_DIR, prepare_environment
+
+prepare_environment()
+
+from mcp import ClientSession  # noqa: E402
+from mcp.client.streamable_http import streamablehttp_client  # noqa: E402
+
+KEYWORDS = ["LIS", "Paris", "Sao Paulo", "MAD", "Londn", "New York", "Rome", "FRA"]
+
+
+def start_server(workers: int, port: int, cache_dir: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "PERSISTENT_CACHE_PATH": os.path.join(cache_dir, "cache.sqlite3")
+    }
+    return subprocess.Popen(
+        [sys.executable, str(ROOT_DIR / "mcp_server.py"), "--transport", "streamable-http",
+         "--port", str(port), "--workers", str(workers)],
+        env=env
+    )
+
+
+def wait_for_port(port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError(f"server did not listen on port {port} within {timeout}s")
+
+
+async def run_session(url: str, session_id: int, calls: int, latencies: list[float]):
+    async with streamablehttp_client(url) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            for i in range(calls):
+                keyword = KEYWORDS[(session_id + i) % len(KEYWORDS)]
+                started = time.perf_counter()
+                result = await session.call_tool("search_cities", {"keyword": keyword})
+                latencies.append(time.perf_counter() - started)
+                if result.isError:
+                    raise RuntimeError(f"search_cities failed: {result.content}")
+
+
+async def run_load(url: str, sessions: int, calls: int) -> dict:
+    latencies: list[float] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(run_session(url, i, calls, latencies) for i in range(sessions)))
+    elapsed = time.perf_counter() - started
+    
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "calls": len(latencies),
+        "elapsed": elapsed,
+        "calls_per_second": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+        "p99_ms": quantiles[98] * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        server = start_server(args.workers, args.port, cache_dir)
+        try:
+            wait_for_port(args.port)
+            result = asyncio.run(run_load(f"http://127.0.0.1:{args.port}/mcp", args.sessions, args.calls))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+    
+    print(f"workers: {args.workers}, sessions: {args.sessions}, calls/session: {args.calls}")
+    print(f"{'calls':>7} {'seconds':>8} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    print(f"{result['calls']:>7} {result['elapsed']:>8.2f} {result['calls_per_second']:>9.1f} "
+          f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
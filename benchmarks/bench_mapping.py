@@ -0,0 +1,78 @@
+"""Micro-benchmark for mapping flight-offers payloads to entities
+
+Compares the original per-segment mapping (fresh `LocationCode` per airport,
+uncached regex and timestamp parsing) with `FlightOfferMapper`, reporting
+offers/second and allocations measured with tracemalloc.
+
+    python -m benchmarks.bench_mapping [--offers 250] [--repeat 50] [--payload recorded.json]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.payloads import generate_payload, load_payload, prepare_environment
+
+prepare_environment()
+
+from benchmarks.legacy import legacy_map_response  # noqa: E402
+from src.infrastructure.gateways.flight_offer_mapper import FlightOfferMapper, parse_timestamp  # noqa: E402
+
+
+def measure(name: str, map_fn, payload: dict, repeat: int) -> dict:
+    offers = len(payload["data"])
+    map_fn(payload)  # warm-up (fills interning and parse caches, as in a running server)
+    
+    gc.collect()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        map_fn(payload)
+    elapsed = time.perf_counter() - started
+    
+    gc.collect()
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    result = map_fn(payload)
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, "filename") if stat.count_diff > 0)
+    del result
+    
+    return {
+        "name": name,
+        "offers_per_second": offers * repeat / elapsed,
+        "ms_per_payload": elapsed / repeat * 1000,
+        "retained_bytes_per_offer": current / offers,
+        "peak_bytes": peak,
+        "allocated_blocks": blocks
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--offers", type=int, default=250, help="offers per generated payload (Amadeus max is 250)")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--payload", help="recorded flight-offers response to use instead of a generated one")
+    args = parser.parse_args()
+    
+    payload = load_payload(args.payload) if args.payload else generate_payload(args.offers)
+    segments = sum(len(it["segments"]) for offer in payload["data"] for it in offer["itineraries"])
+    print(f"payload: {len(payload['data'])} offers, {segments} segments")
+    
+    mapper = FlightOfferMapper()
+    results = [
+        measure("legacy", legacy_map_response, payload, args.repeat),
+        measure("fast-path", mapper.map_response, payload, args.repeat)
+    ]
+    
+    print(f"{'mapper':<10} {'offers/s':>12} {'ms/payload':>11} {'bytes/offer':>12} {'peak bytes':>11} {'blocks':>8}")
+    for r in results:
+        print(f"{r['name']:<10} {r['offers_per_second']:>12,.0f} {r['ms_per_payload']:>11.2f} "
+              f"{r['retained_bytes_per_offer']:>12,.0f} {r['peak_bytes']:>11,} {r['allocated_blocks']:>8,}")
+    print(f"speedup: {results[1]['offers_per_second'] / results[0]['offers_per_second']:.2f}x, "
+          f"timestamp cache: {parse_timestamp.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Memory benchmark: retained bytes per cached offer and peak memory per response
+
+Maps several payloads and keeps every resulting offer alive, as the offer
+cache and batch results do, then reports bytes per offer for the original
+dict-backed dataclasses and for the slotted, interned and pooled entities.
+It also reports the peak memory of turning one raw response body into
+entities, decoded whole versus streamed in network-sized chunks.
+
+    python -m benchmarks.bench_memory [--payloads 20] [--offers 250] [--chunk-size 65536]
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from benchmarks.payloads import generate_payload, prepare_environment
+
+prepare_environment()
+
+from benchmarks.legacy import legacy_map_response  # noqa: E402
+from src.infrastructure.external.json_stream import JsonArrayStream  # noqa: E402
+from src.infrastructure.gateways.flight_offer_mapper import FlightOfferMapper  # noqa: E402
+
+
+def retained_bytes(map_fn, payloads: list[dict]) -> tuple[int, int]:
+    """Returns (bytes retained by the mapped offers, number of offers)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = [map_fn(payload) for payload in payloads]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, sum(len(offers) for offers in results)
+
+
+def peak_bytes(decode_fn, body: bytes) -> tuple[int, int]:
+    """Returns (peak bytes allocated while turning `body` into offers, number of offers)"""
+    gc.collect()
+    tracemalloc.start()
+    offers = decode_fn(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, len(offers)
+
+
+def decode_whole(mapper: FlightOfferMapper):
+    return lambda body: mapper.map_response(json.loads(body))
+
+
+def decode_streamed(mapper: FlightOfferMapper, chunk_size: int):
+    def decode(body: bytes) -> list:
+        stream = JsonArrayStream("data")
+        segment_pool: dict = {}
+        offers = []
+        for start in range(0, len(body), chunk_size):
+            offers.extend(mapper.map_offer(item, segment_pool) for item in stream.feed(body[start:start + chunk_size]))
+        offers.extend(mapper.map_offer(item, segment_pool) for item in stream.close())
+        return offers
+    return decode
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payloads", type=int, default=20, help="number of distinct searches kept in memory")
+    parser.add_argument("--offers", type=int, default=250)
+    parser.add_argument("--chunk-size", type=int, default=65536, help="network chunk size of the streamed decode")
+    args = parser.parse_args()
+    
+    payloads = [generate_payload(args.offers, seed=seed) for seed in range(args.payloads)]
+    mapper = FlightOfferMapper()
+    # Warm the process-wide LocationCode and timestamp caches, as in a running server
+    mapper.map_response(payloads[0])
+    
+    legacy_bytes, offers = retained_bytes(legacy_map_response, payloads)
+    compact_bytes, _ = retained_bytes(mapper.map_response, payloads)
+    
+    print(f"{offers:,} offers kept alive across {len(payloads)} searches")
+    print(f"{'representation':<24} {'total MiB':>10} {'bytes/offer':>12}")
+    print(f"{'dict dataclasses':<24} {legacy_bytes / 2**20:>10.2f} {legacy_bytes / offers:>12,.0f}")
+    print(f"{'slotted + interned':<24} {compact_bytes / 2**20:>10.2f} {compact_bytes / offers:>12,.0f}")
+    print(f"reduction: {1 - compact_bytes / legacy_bytes:.0%}")
+    
+    # The raw body is allocated before tracing, as the HTTP client would hold it
+    body = json.dumps(payloads[0]).encode()
+    whole_peak, offers = peak_bytes(decode_whole(mapper), body)
+    streamed_peak, _ = peak_bytes(decode_streamed(mapper, args.chunk_size), body)
+    print(f"\npeak memory mapping one {len(body) / 2**20:.2f} MiB response ({offers} offers)")
+    print(f"{'decode':<24} {'peak MiB':>10}")
+    print(f"{'json.loads + map':<24} {whole_peak / 2**20:>10.2f}")
+    print(f"{'streamed + map':<24} {streamed_peak / 2**20:>10.2f}")
+    print(f"reduction: {1 - streamed_peak / whole_peak:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Micro-benchmark for the size and encode time of search_flights output
+
+Builds a page of `--offers` offer DTOs from a generated payload and encodes it
+as the tool used to return it (a dict pretty-printed by FastMCP) and in each
+output format: full objects, projected fields, the columnar table and a size
+budget. Reports payload bytes and encode time, with orjson and with the
+standard library encoder.
+
+    python -m benchmarks.bench_output [--offers 250] [--max-bytes 8192] [--repeat 50]
+"""
+import argparse
+import time
+from dataclasses import asdict
+
+import pydantic_core
+
+from benchmarks.payloads import generate_payload, prepare_environment
+
+prepare_environment()
+
+from src.application.dto.flight_dto import FlightResultPageDTO  # noqa: E402
+from src.application.services.flight_application_service import FlightApplicationService  # noqa: E402
+from src.infrastructure.gateways.flight_offer_mapper import FlightOfferMapper  # noqa: E402
+from src.presentation.mcp import serialization  # noqa: E402
+from src.presentation.mcp.serialization import encode_flight_page  # noqa: E402
+
+# Fields an assistant typically needs to compare offers
+SUMMARY_FIELDS = ["price", "currency", "airline", "departure_time", "arrival_time", "duration", "is_direct"]
+
+
+def build_page(offers: int) -> FlightResultPageDTO:
+    flights = FlightOfferMapper().map_response(generate_payload(offers))
+    service = FlightApplicationService(flight_search_service=None)
+    return FlightResultPageDTO(
+        flights=[service._map_flight_to_dto(flight) for flight in flights],
+        cursor="bench-cursor",
+        total=len(flights),
+        offset=0,
+        next_offset=None
+    )
+
+
+def legacy_encode(page: FlightResultPageDTO) -> str:
+    """What FastMCP sent for the former `-> dict` return value"""
+    return pydantic_core.to_json(asdict(page), fallback=str, indent=2).decode()
+
+
+def measure(fn, repeat: int) -> tuple[int, float]:
+    size = len(fn().encode())
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return size, (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--offers", type=int, default=250)
+    parser.add_argument("--max-bytes", type=int, default=8192, help="size budget of the budgeted cases")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    page = build_page(args.offers)
+    cases = [
+        ("objects", {}),
+        ("objects, summary fields", {"fields": SUMMARY_FIELDS}),
+        ("table", {"output_format": "table"}),
+        ("table, summary fields", {"output_format": "table", "fields": SUMMARY_FIELDS}),
+        (f"table, {args.max_bytes} byte budget", {"output_format": "table", "fields": SUMMARY_FIELDS, "max_bytes": args.max_bytes})
+    ]
+
+    legacy_size, legacy_ms = measure(lambda: legacy_encode(page), args.repeat)
+    orjson_available = serialization._load_orjson() is not None
+    print(f"offers: {len(page.flights)}, orjson: {'yes' if orjson_available else 'no'}")
+    print(f"{'format':<34} {'bytes':>9} {'vs legacy':>10} {'orjson ms':>10} {'json ms':>9}")
+    print(f"{'legacy dict (indent=2)':<34} {legacy_size:>9,} {'':>10} {legacy_ms:>10.2f} {'':>9}")
+    for name, options in cases:
+        encode = lambda: encode_flight_page(page, **options)  # noqa: E731
+        size, fast_ms = measure(encode, args.repeat) if orjson_available else (None, None)
+
+        # Same case with the standard library encoder
+        serialization._orjson, serialization._orjson_checked = None, True
+        stdlib_size, stdlib_ms = measure(encode, args.repeat)
+        serialization._orjson_checked = False
+
+        fast = f"{fast_ms:>10.2f}" if fast_ms is not None else f"{'-':>10}"
+        print(f"{name:<34} {stdlib_size:>9,} {stdlib_size / legacy_size:>10.0%} {fast} {stdlib_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
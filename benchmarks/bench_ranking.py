@@ -0,0 +1,76 @@
+"""Micro-benchmark for ranking large offer sets
+
+Maps a generated payload, replicates it to `--offers` offers and compares the
+original full `sorted()` best-value ranking with `RankingEngine` (NumPy when
+installed, pure Python otherwise), for a full ranking, top-k selection and the
+Pareto front.
+
+    python -m benchmarks.bench_ranking [--offers 10000] [--top-k 20] [--repeat 20]
+"""
+import argparse
+import time
+from dataclasses import replace
+
+from benchmarks.payloads import generate_payload, prepare_environment
+
+prepare_environment()
+
+from src.domain.services import ranking  # noqa: E402
+from src.domain.services.ranking import RankingEngine  # noqa: E402
+from src.domain.vo.ranking_options import RankingOptions  # noqa: E402
+from src.infrastructure.gateways.flight_offer_mapper import FlightOfferMapper  # noqa: E402
+
+
+def legacy_rank(flights):
+    return sorted(flights, key=lambda f: (not f.is_direct, f.price))
+
+
+def build_offers(count: int) -> list:
+    base = FlightOfferMapper().map_response(generate_payload(250))
+    return [replace(base[i % len(base)], id=str(i), price=base[i % len(base)].price + (i // len(base)) * 0.01)
+            for i in range(count)]
+
+
+def measure(fn, repeat: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--offers", type=int, default=10000)
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    
+    flights = build_offers(args.offers)
+    engine = RankingEngine()
+    python_engine = RankingEngine(vectorize=False)
+    weighted = RankingOptions(sort_by="weighted", weights={"price": 0.6, "duration": 0.3, "stops": 0.1})
+    pareto = RankingOptions(sort_by="price", result_mode="pareto")
+    
+    assert [f.id for f in engine.rank(flights)] == [f.id for f in legacy_rank(flights)]
+    assert [f.id for f in engine.rank(flights, top_k=args.top_k)] == [f.id for f in legacy_rank(flights)[:args.top_k]]
+    
+    cases = [
+        ("legacy sorted", lambda: legacy_rank(flights)),
+        ("legacy sorted top-k", lambda: legacy_rank(flights)[:args.top_k]),
+        ("engine best_value", lambda: engine.rank(flights)),
+        ("engine top-k", lambda: engine.rank(flights, top_k=args.top_k)),
+        ("engine weighted top-k", lambda: engine.rank(flights, weighted, args.top_k)),
+        ("python weighted top-k", lambda: python_engine.rank(flights, weighted, args.top_k)),
+        ("engine pareto", lambda: engine.rank(flights, pareto))
+    ]
+    
+    print(f"offers: {len(flights)}, top-k: {args.top_k}, pareto front: {len(engine.rank(flights, pareto))}, "
+          f"numpy: {'yes' if ranking.load_numpy() is not None else 'no'}")
+    print(f"{'ranking':<24} {'ms':>9}")
+    for name, fn in cases:
+        print(f"{name:<24} {measure(fn, args.repeat):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Startup benchmark for the stdio server
+
+Measures, over `--runs` fresh processes:
+- import time of `mcp_server` (and of the project modules alone, excluding mcp),
+- time from spawning `mcp_server.py` to the `initialize` response,
+- latency of the first tool call (`search_cities`, answered from the local index),
+  sent `--idle` seconds after the handshake as an agent would.
+
+    python -m benchmarks.bench_startup [--runs 5] [--idle 1.0] [--warmup]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.payloads import ROOT_DIR, prepare_environment
+
+prepare_environment()
+
+from mcp import ClientSession, StdioServerParameters  # noqa: E402
+from mcp.client.stdio import stdio_client  # noqa: E402
+
+
+def import_time(preload: str = "") -> float:
+    """Seconds to import `mcp_server` in a fresh interpreter, after importing `preload`"""
+    code = (
+        f"import time\n{preload}\n"
+        "started = time.perf_counter()\n"
+        "import mcp_server\n"
+        "print(time.perf_counter() - started)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, env=os.environ,
+                            check=True, capture_output=True, text=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+async def first_response(env: dict, idle: float) -> tuple[float, float]:
+    params = StdioServerParameters(command=sys.executable, args=[str(ROOT_DIR / "mcp_server.py")], env=env)
+    started = time.perf_counter()
+    async with stdio_client(params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            initialized = time.perf_counter() - started
+            await asyncio.sleep(idle)
+            called = time.perf_counter()
+            await session.call_tool("search_cities", {"keyword": "Lisbon"})
+            latency = time.perf_counter() - called
+    return initialized, latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--idle", type=float, default=1.0, help="seconds between the handshake and the first call")
+    parser.add_argument("--warmup", action="store_true", help="start the server with MCP_FLIGHT_WARMUP=true")
+    args = parser.parse_args()
+    
+    # Offline: the warm-up token request fails fast against a closed local port
+    env = {
+        **os.environ,
+        "MCP_FLIGHT_WARMUP": "true" if args.warmup else "false",
+        "AMADEUS_API_BASE": os.environ.get("AMADEUS_API_BASE", "http://127.0.0.1:9")
+    }
+    
+    imports = [import_time() for _ in range(args.runs)]
+    project = [import_time("import mcp.server.fastmcp") for _ in range(args.runs)]
+    responses = [asyncio.run(first_response(env, args.idle)) for _ in range(args.runs)]
+    
+    print(f"runs: {args.runs}, warm-up: {'on' if args.warmup else 'off'} (medians)")
+    print(f"{'import mcp_server':<32} {statistics.median(imports) * 1000:>8.0f} ms")
+    print(f"{'  of which project modules':<32} {statistics.median(project) * 1000:>8.0f} ms")
+    print(f"{'spawn -> initialize':<32} {statistics.median(r[0] for r in responses) * 1000:>8.0f} ms")
+    print(f"{'first tool call latency':<32} {statistics.median(r[1] for r in responses) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Local stand-in for the Amadeus endpoints used by the server
+
+Implements the OAuth token, `/v2/shopping/flight-offers` and
+`/v1/reference-data/locations/cities` endpoints with configurable latency,
+error rate, 429 rate and payload size, and counts every call by endpoint and
+status (`GET /_stats`, `POST /_reset`). Fully offline.
+
+    python -m benchmarks.fake_amadeus [--port 8766] [--latency-ms 150] [--error-rate 0.01]
+                                      [--throttle-rate 0.02] [--offers 250]
+"""
+import argparse
+import asyncio
+import json
+import random
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from benchmarks.payloads import generate_payload
+
+TOKEN_LIFETIME = 1799
+
+
+@dataclass
+class FakeOptions:
+    """Behaviour of the fake server"""
+    latency_ms: float = 150.0
+    jitter_ms: float = 50.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: float = 0.2
+    offers: int = 250
+    seed: int = 7
+
+
+@lru_cache(maxsize=256)
+def flight_offers_body(origin: str, destination: str, departure_date: str, offers: int) -> bytes:
+    """Encoded flight-offers response, deterministic per route and date"""
+    seed = zlib.crc32(f"{origin}{destination}{departure_date}".encode())
+    return json.dumps(generate_payload(offers, seed=seed, origin=origin, destination=destination)).encode()
+
+
+def cities_body(keyword: str) -> dict:
+    """Locations response with one city and one airport named after the keyword"""
+    code = "".join(ch for ch in keyword.upper() if ch.isalpha())[:3].ljust(3, "X")
+    return {
+        "meta": {"count": 1},
+        "data": [{
+            "type": "location",
+            "subType": "city",
+            "name": keyword.upper(),
+            "iataCode": code,
+            "address": {"countryCode": "XX", "stateCode": "XX-1"},
+            "geoCode": {"latitude": 10.0, "longitude": 20.0},
+            "relationships": [{"id": f"{code[:2]}A", "type": "Airport", "href": ""}]
+        }],
+        "included": {"airports": {
+            f"{code[:2]}A": {
+                "name": f"{keyword.upper()} AIRPORT",
+                "iataCode": f"{code[:2]}A",
+                "subType": "AIRPORT",
+                "geoCode": {"latitude": 10.0, "longitude": 20.0},
+                "address": {"countryCode": "XX"}
+            }
+        }}
+    }
+
+
+def create_app(options: FakeOptions) -> Starlette:
+    """Starlette application emulating the Amadeus API"""
+    calls: Counter = Counter()
+    rng = random.Random(options.seed)
+    
+    async def simulate(endpoint: str) -> Response | None:
+        """Applies latency, then maybe a 429 or 500 instead of the real response"""
+        delay = max(0.0, options.latency_ms + rng.uniform(-options.jitter_ms, options.jitter_ms)) / 1000
+        await asyncio.sleep(delay)
+        
+        roll = rng.random()
+        if roll < options.throttle_rate:
+            calls[f"{endpoint} 429"] += 1
+            return JSONResponse(
+                {"errors": [{"status": 429, "code": 38194, "title": "Too many requests"}]},
+                status_code=429,
+                headers={"Retry-After": str(options.retry_after)}
+            )
+        if roll < options.throttle_rate + options.error_rate:
+            calls[f"{endpoint} 500"] += 1
+            return JSONResponse({"errors": [{"status": 500, "code": 141, "title": "SYSTEM ERROR HAS OCCURRED"}]}, status_code=500)
+        calls[f"{endpoint} 200"] += 1
+        return None
+    
+    async def token(request: Request) -> Response:
+        calls["token 200"] += 1
+        return JSONResponse({"type": "amadeusOAuth2Token", "access_token": f"fake-{rng.getrandbits(32):08x}", "expires_in": TOKEN_LIFETIME})
+    
+    async def flight_offers(request: Request) -> Response:
+        failure = await simulate("flight-offers")
+        if failure is not None:
+            return failure
+        query = request.query_params
+        offers = min(int(query.get("max", options.offers)), options.offers)
+        body = flight_offers_body(query["originLocationCode"], query["destinationLocationCode"], query["departureDate"], offers)
+        return Response(body, media_type="application/json")
+    
+    async def cities(request: Request) -> Response:
+        failure = await simulate("cities")
+        if failure is not None:
+            return failure
+        return JSONResponse(cities_body(request.query_params.get("keyword", "")))
+    
+    async def stats(request: Request) -> Response:
+        return JSONResponse(dict(calls))
+    
+    async def reset(request: Request) -> Response:
+        calls.clear()
+        return JSONResponse({})
+    
+    return Starlette(routes=[
+        Route("/v1/security/oauth2/token", token, methods=["POST"]),
+        Route("/v2/shopping/flight-offers", flight_offers),
+        Route("/v1/reference-data/locations/cities", cities),
+        Route("/_stats", stats),
+        Route("/_reset", reset, methods=["POST"])
+    ])
+
+
+def parse_options(argv: list[str] | None = None) -> tuple[FakeOptions, int]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=FakeOptions.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=FakeOptions.jitter_ms)
+    parser.add_argument("--error-rate", type=float, default=FakeOptions.error_rate, help="share of 500 responses")
+    parser.add_argument("--throttle-rate", type=float, default=FakeOptions.throttle_rate, help="share of 429 responses")
+    parser.add_argument("--retry-after", type=float, default=FakeOptions.retry_after)
+    parser.add_argument("--offers", type=int, default=FakeOptions.offers, help="maximum offers per flight-offers response")
+    args = parser.parse_args(argv)
+    options = FakeOptions(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        offers=args.offers
+    )
+    return options, args.port
+
+
+def main(argv: list[str] | None = None):
+    import uvicorn
+    
+    options, port = parse_options(argv)
+    uvicorn.run(create_app(options), host="127.0.0.1", port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Pre-optimization entities and mapping loop, kept as the benchmark baseline"""
+import re
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class LegacyLocationCode:
+    """IATA location code validated with an uncompiled regex per instance"""
+    code: str
+    
+    def __post_init__(self):
+        if not bool(re.match(r'^[A-Z]{3}$', self.code)):
+            raise ValueError(f"Invalid IATA code: {self.code}")
+
+
+@dataclass
+class LegacyFlightSegment:
+    """Flight segment with a per-instance __dict__"""
+    departure: LegacyLocationCode
+    arrival: LegacyLocationCode
+    departure_time: datetime
+    arrival_time: datetime
+    carrier_code: str
+    flight_number: str
+    aircraft: str | None = None
+    duration: str | None = None
+
+
+@dataclass
+class LegacyFlightOffer:
+    """Flight offer with a per-instance __dict__"""
+    id: str
+    segments: list[LegacyFlightSegment]
+    price: float
+    currency: str
+    seats_available: int
+    travel_class: str
+    validating_airline_codes: list[str]
+    instant_ticketing_required: bool = False
+    non_homogeneous: bool = False
+    one_way: bool = False
+    last_ticketing_date: str | None = None
+
+
+def legacy_map_response(response: dict) -> list[LegacyFlightOffer]:
+    """The original gateway mapping loop"""
+    offers = []
+    for offer_data in response.get("data", []):
+        segments = []
+        for itinerary in offer_data.get("itineraries", []):
+            for segment_data in itinerary.get("segments", []):
+                segments.append(LegacyFlightSegment(
+                    departure=LegacyLocationCode(segment_data["departure"]["iataCode"]),
+                    arrival=LegacyLocationCode(segment_data["arrival"]["iataCode"]),
+                    departure_time=datetime.fromisoformat(segment_data["departure"]["at"].replace("Z", "+00:00")),
+                    arrival_time=datetime.fromisoformat(segment_data["arrival"]["at"].replace("Z", "+00:00")),
+                    carrier_code=segment_data["carrierCode"],
+                    flight_number=segment_data["number"],
+                    aircraft=segment_data.get("aircraft", {}).get("code"),
+                    duration=segment_data.get("duration")
+                ))
+        price_data = offer_data["price"]
+        offers.append(LegacyFlightOffer(
+            id=offer_data["id"],
+            segments=segments,
+            price=float(price_data["total"]),
+            currency=price_data["currency"],
+            seats_available=offer_data.get("numberOfBookableSeats", 0),
+            travel_class=offer_data.get("travelerPricings", [{}])[0].get("fareDetailsBySegment", [{}])[0].get("class", ""),
+            validating_airline_codes=offer_data.get("validatingAirlineCodes", []),
+            instant_ticketing_required=offer_data.get("instantTicketingRequired", False),
+            non_homogeneous=offer_data.get("nonHomogeneous", False),
+            one_way=offer_data.get("oneWay", False),
+            last_ticketing_date=offer_data.get("lastTicketingDate")
+        ))
+    return offers
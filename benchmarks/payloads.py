@@ -0,0 +1,133 @@
+"""Amadeus flight-offers payloads for benchmarks
+
+Payloads are either loaded from a recorded response (`--payload file.json`) or
+generated deterministically with the same shape and field density as a real
+`/v2/shopping/flight-offers` response: round trips with 1-3 segments per
+itinerary, per-segment fare details and full price breakdowns. As in real
+responses, offers combine a limited set of outbound and inbound itineraries,
+so the same flights repeat across many offers.
+"""
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+
+AIRPORTS = ["GRU", "GIG", "LIS", "OPO", "MAD", "BCN", "CDG", "ORY", "LHR", "FCO", "AMS", "FRA", "MUC", "ZRH", "JFK", "MIA"]
+CARRIERS = ["TP", "IB", "LA", "AF", "KL", "LH", "BA", "UX", "AZ", "G3"]
+AIRCRAFT = ["320", "321", "32N", "332", "333", "339", "359", "388", "737", "789"]
+
+
+def prepare_environment():
+    """Makes `src` importable and provides dummy credentials for offline runs"""
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+    os.environ.setdefault("AMADEUS_API_KEY", "benchmark")
+    os.environ.setdefault("AMADEUS_API_SECRET", "benchmark")
+    # Keep the user's price watches and query log away from a fake upstream
+    os.environ.setdefault("PRICE_WATCH_ENABLED", "false")
+    os.environ.setdefault("QUERY_LOG_ENABLED", "false")
+
+
+def load_payload(path: str | Path) -> dict:
+    """Loads a recorded flight-offers response"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def generate_payload(offers: int = 250, seed: int = 42, origin: str = "GRU", destination: str = "LIS") -> dict:
+    """Generates a flight-offers response with `offers` round-trip offers"""
+    rng = random.Random(seed)
+    base_day = datetime(2026, 3, 1)
+    options = max(1, int(offers ** 0.5) * 2)
+    outbounds = [_itinerary(rng, origin, destination, base_day) for _ in range(options)]
+    inbounds = [_itinerary(rng, destination, origin, base_day + timedelta(days=7)) for _ in range(options)]
+    data = []
+    
+    for index in range(offers):
+        outbound = json.loads(json.dumps(rng.choice(outbounds)))
+        inbound = json.loads(json.dumps(rng.choice(inbounds)))
+        segments = outbound["segments"] + inbound["segments"]
+        total = round(rng.uniform(350, 2500), 2)
+        carrier = segments[0]["carrierCode"]
+        
+        data.append({
+            "type": "flight-offer",
+            "id": str(index + 1),
+            "source": "GDS",
+            "instantTicketingRequired": False,
+            "nonHomogeneous": False,
+            "oneWay": False,
+            "lastTicketingDate": "2026-02-20",
+            "lastTicketingDateTime": "2026-02-20",
+            "numberOfBookableSeats": rng.randint(1, 9),
+            "itineraries": [outbound, inbound],
+            "price": {
+                "currency": "EUR",
+                "total": f"{total:.2f}",
+                "base": f"{total * 0.7:.2f}",
+                "fees": [{"amount": "0.00", "type": "SUPPLIER"}, {"amount": "0.00", "type": "TICKETING"}],
+                "grandTotal": f"{total:.2f}"
+            },
+            "pricingOptions": {"fareType": ["PUBLISHED"], "includedCheckedBagsOnly": True},
+            "validatingAirlineCodes": [carrier],
+            "travelerPricings": [{
+                "travelerId": "1",
+                "fareOption": "STANDARD",
+                "travelerType": "ADULT",
+                "price": {"currency": "EUR", "total": f"{total:.2f}", "base": f"{total * 0.7:.2f}"},
+                "fareDetailsBySegment": [
+                    {
+                        "segmentId": segment["id"],
+                        "cabin": "ECONOMY",
+                        "fareBasis": "OLOWBR",
+                        "brandedFare": "LIGHT",
+                        "class": "O",
+                        "includedCheckedBags": {"quantity": 0}
+                    }
+                    for segment in segments
+                ]
+            }]
+        })
+    
+    return {
+        "meta": {"count": len(data), "links": {"self": "https://test.api.amadeus.com/v2/shopping/flight-offers"}},
+        "data": data,
+        "dictionaries": {
+            "locations": {code: {"cityCode": code, "countryCode": "XX"} for code in AIRPORTS},
+            "aircraft": {code: f"AIRCRAFT {code}" for code in AIRCRAFT},
+            "currencies": {"EUR": "EURO"},
+            "carriers": {code: f"CARRIER {code}" for code in CARRIERS}
+        }
+    }
+
+
+def _itinerary(rng: random.Random, origin: str, destination: str, day: datetime) -> dict:
+    stops = rng.choice([0, 1, 1, 2])
+    hubs = rng.sample([code for code in AIRPORTS if code not in (origin, destination)], stops)
+    path = [origin, *hubs, destination]
+    departure = day + timedelta(hours=rng.randint(6, 22), minutes=rng.choice([0, 15, 30, 45]))
+    segments = []
+    
+    for leg, (start, end) in enumerate(zip(path, path[1:])):
+        hours = rng.randint(1, 11)
+        arrival = departure + timedelta(hours=hours, minutes=rng.choice([0, 20, 40]))
+        carrier = rng.choice(CARRIERS)
+        segments.append({
+            "departure": {"iataCode": start, "terminal": str(rng.randint(1, 3)), "at": departure.isoformat()},
+            "arrival": {"iataCode": end, "terminal": str(rng.randint(1, 3)), "at": arrival.isoformat()},
+            "carrierCode": carrier,
+            "number": str(rng.randint(10, 9999)),
+            "aircraft": {"code": rng.choice(AIRCRAFT)},
+            "operating": {"carrierCode": carrier},
+            "duration": f"PT{hours}H{(arrival - departure).seconds // 60 % 60}M",
+            "id": str(rng.randint(1, 10_000)),
+            "numberOfStops": 0,
+            "blacklistedInEU": False
+        })
+        departure = arrival + timedelta(hours=rng.randint(1, 4))
+    
+    return {"duration": f"PT{len(segments) * 6}H", "segments": segments}
@@ -4,7 +4,10 @@ MCP Flight Server - Main entry point
 """
 import sys
 import os
+import argparse
+import asyncio
 import logging
+from contextlib import asynccontextmanager, nullcontext
 from pathlib import Path
 from mcp.server.fastmcp import FastMCP
 
@@ -20,27 +23,171 @@ os.environ["PYTHONPATH"] = str(src_dir) + ":" + os.environ.get("PYTHONPATH", "")
 from src.presentation.mcp.tools import register_tools  
 from src.presentation.mcp.prompts import register_prompts
 from src.presentation.mcp.resources import register_resources
+from src.infrastructure.container import container
+from src.infrastructure.config.settings import (
+    CacheWarmingConfig,
+    ObservabilityConfig,
+    PriceWatchConfig,
+    ServerConfig
+)
+
+TRANSPORTS = ("stdio", "streamable-http", "sse")
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Manages resources shared across the server lifetime"""
+    async with managed_container(metrics_exporter=True):
+        yield
+
+
+@asynccontextmanager
+async def managed_container(metrics_exporter: bool = False):
+    """Optionally warms the container up in the background and releases it on exit
+    
+    The price watch scheduler and the cache warmer run for the lifetime of the
+    container. With `metrics_exporter`, Prometheus metrics are also served on
+    METRICS_PORT.
+    """
+    # Only the sections needed here are read; the full configuration, credentials
+    # included, is built when the first tool call needs it
+    warmup = asyncio.create_task(container.warm_up()) if ServerConfig.from_env().warmup else None
+    if PriceWatchConfig.from_env().enabled:
+        container.price_watch_scheduler.start()
+    if CacheWarmingConfig.from_env().enabled and container.cache_warmer is not None:
+        container.cache_warmer.start()
+    exporter = None
+    observability = ObservabilityConfig.from_env()
+    if metrics_exporter and observability.metrics_enabled and observability.metrics_port:
+        from src.infrastructure.metrics.exporter import start_prometheus_exporter
+        try:
+            exporter = await start_prometheus_exporter(container.metrics, observability.metrics_host, observability.metrics_port)
+        except OSError as e:
+            logger.error("Cannot serve metrics on port %s: %s", observability.metrics_port, str(e))
+    try:
+        yield
+    finally:
+        if exporter is not None:
+            exporter.close()
+        if warmup is not None:
+            warmup.cancel()
+            await asyncio.gather(warmup, return_exceptions=True)
+        await container.aclose()
+
+
+def create_server(**settings) -> FastMCP:
+    """Creates the MCP server with all components registered"""
+    mcp = FastMCP("flight", **settings)
+    
+    # Register components
+    register_tools(mcp)
+    register_prompts(mcp)
+    register_resources(mcp)
+    return mcp
+
+
+def create_http_app():
+    """ASGI application for the HTTP transports (uvicorn factory, one per worker)
+    
+    FastMCP runs its lifespan once per session (once per request when stateless),
+    so shared resources are released with the ASGI application instead.
+    """
+    server = ServerConfig.from_env()
+    mcp = create_server(host=server.host, port=server.port, stateless_http=server.stateless_http)
+    if ObservabilityConfig.from_env().metrics_enabled:
+        register_metrics_route(mcp)
+    
+    if server.transport == "sse":
+        app = mcp.sse_app()
+        session_manager = nullcontext
+    else:
+        app = mcp.streamable_http_app()
+        session_manager = mcp.session_manager.run
+    
+    @asynccontextmanager
+    async def app_lifespan(app):
+        async with session_manager(), managed_container():
+            yield
+    
+    app.router.lifespan_context = app_lifespan
+    return app
+
+
+def register_metrics_route(mcp: FastMCP):
+    """Serves this worker's metrics in the Prometheus text format at /metrics"""
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from src.infrastructure.metrics.exporter import PROMETHEUS_CONTENT_TYPE
+    
+    @mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+    async def metrics(request: Request) -> Response:
+        return Response(container.metrics.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Command line options, defaulting to the MCP_* environment variables"""
+    server = ServerConfig.from_env()
+    parser = argparse.ArgumentParser(description="MCP Flight Server")
+    parser.add_argument("--transport", choices=TRANSPORTS, default=server.transport)
+    parser.add_argument("--host", default=server.host)
+    parser.add_argument("--port", type=int, default=server.port)
+    parser.add_argument("--workers", type=int, default=server.workers)
+    args = parser.parse_args(argv)
+    if args.transport not in TRANSPORTS:
+        parser.error(f"invalid transport: {args.transport} (choose from {', '.join(TRANSPORTS)})")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+
+def serve_http(args: argparse.Namespace):
+    """Serves the HTTP transport with uvicorn, optionally with several workers"""
+    import uvicorn
+    
+    if args.transport == "sse" and args.workers > 1:
+        raise SystemExit("The SSE transport keeps sessions in memory; use --transport streamable-http for several workers")
+    
+    # Workers are separate processes that rebuild their configuration from the environment
+    os.environ["MCP_TRANSPORT"] = args.transport
+    os.environ["MCP_HOST"] = args.host
+    os.environ["MCP_PORT"] = str(args.port)
+    os.environ["MCP_WORKERS"] = str(args.workers)
+    if args.workers > 1 and "PERSISTENT_CACHE_ENABLED" not in os.environ:
+        # Token, cached searches and result cursors are shared through SQLite
+        os.environ["PERSISTENT_CACHE_ENABLED"] = "true"
+        logger.warning("Persistent cache enabled to share state between %s workers", args.workers)
+    
+    uvicorn.run(
+        "mcp_server:create_http_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level="warning"
+    )
+
 
 def main():
     """Runs the MCP server"""
     
     # Configure logging
     logging.basicConfig(
-        level=logging.ERROR,
+        level=ObservabilityConfig.from_env().log_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         stream=sys.stderr
     )
     
-    # Initialize MCP server
-    mcp = FastMCP("flight")
-    
-    # Register components
-    register_tools(mcp)
-    register_prompts(mcp)
-    register_resources(mcp)
-    
-    # Run server
-    mcp.run(transport='stdio')
+    args = parse_args()
+    if args.transport == "stdio":
+        # Initialize MCP server
+        mcp = create_server(lifespan=lifespan)
+        
+        # Run server
+        mcp.run(transport='stdio')
+    else:
+        serve_http(args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class FareCalendarRequestDTO:
+    """DTO for flexible-date fare calendar request"""
+    origin_location_code: str
+    destination_location_code: str
+    start_date: str
+    end_date: str
+    adults: int = 1
+    min_stay_days: int | None = None
+    max_stay_days: int | None = None
+    children: int | None = None
+    infants: int | None = None
+    travel_class: str | None = None
+    non_stop: bool | None = None
+    currency_code: str | None = None
+    max_price: int | None = None
+    offers_per_day: int | None = None
+
+
+@dataclass
+class FareCalendarCellDTO:
+    """DTO for the cheapest offer of one calendar cell"""
+    departure_date: str
+    return_date: str | None
+    price: float
+    currency: str
+    offer_id: str
+    airline: str
+    is_direct: bool
+    duration: str
+
+
+@dataclass
+class FareCalendarDTO:
+    """DTO for a date x price matrix
+    
+    `prices[i][j]` is the cheapest price departing on `departure_dates[i]` and
+    staying `stay_days[j]` days (a single column for one-way searches).
+    """
+    departure_dates: list[str]
+    stay_days: list[int]
+    prices: list[list[float | None]]
+    cheapest: FareCalendarCellDTO | None = None
+    cells: list[FareCalendarCellDTO] = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 
 
@@ -19,6 +19,12 @@ class FlightSearchRequestDTO:
     currency_code: str | None = None
     max_price: int | None = None
     max_results: int | None = None
+    sort_by: str = "best_value"
+    weights: dict[str, float] | None = None
+    departure_window: str | None = None
+    result_mode: str = "all"
+    pareto_criteria: list[str] | None = None
+    page_size: int | None = None
 
 
 @dataclass
@@ -37,3 +43,66 @@ class FlightOfferDTO:
     is_direct: bool
     seats_available: int
     travel_class: str
+
+
+@dataclass
+class ResultPageRequestDTO:
+    """DTO for reading a page of a stored search result
+    
+    Ranking fields left as None keep the ranking of the original search.
+    """
+    cursor: str
+    offset: int = 0
+    limit: int = 20
+    sort_by: str | None = None
+    weights: dict[str, float] | None = None
+    departure_window: str | None = None
+    result_mode: str | None = None
+    pareto_criteria: list[str] | None = None
+
+
+@dataclass
+class FlightResultPageDTO:
+    """DTO for one page of a stored search result"""
+    flights: list[FlightOfferDTO]
+    cursor: str | None
+    total: int
+    offset: int
+    next_offset: int | None
+
+
+@dataclass
+class BatchFlightSearchRequestDTO:
+    """DTO for a route-matrix search (every origin x every destination)"""
+    origin_location_codes: list[str]
+    destination_location_codes: list[str]
+    departure_date: str
+    adults: int = 1
+    return_date: str | None = None
+    children: int | None = None
+    infants: int | None = None
+    travel_class: str | None = None
+    included_airline_codes: str | None = None
+    excluded_airline_codes: str | None = None
+    non_stop: bool | None = None
+    currency_code: str | None = None
+    max_price: int | None = None
+    max_results_per_pair: int | None = None
+    max_ranked_results: int = 10
+
+
+@dataclass
+class RoutePairResultDTO:
+    """DTO for the outcome of one origin/destination pair"""
+    origin: str
+    destination: str
+    best: FlightOfferDTO | None = None
+    offers: list[FlightOfferDTO] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass
+class BatchFlightSearchResultDTO:
+    """DTO for a route-matrix search result"""
+    pairs: list[RoutePairResultDTO]
+    ranking: list[FlightOfferDTO]
@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class WatchRouteRequestDTO:
+    """DTO for creating a price watch"""
+    origin_location_code: str
+    destination_location_code: str
+    departure_date: str
+    adults: int = 1
+    return_date: str | None = None
+    children: int | None = None
+    infants: int | None = None
+    travel_class: str | None = None
+    non_stop: bool | None = None
+    currency_code: str | None = None
+    max_price: int | None = None
+    interval_minutes: int | None = None
+
+
+@dataclass
+class PriceChangeDTO:
+    """DTO for one check of a watched route, relative to the previous check
+    
+    Offers are keyed by itinerary ("LA8084 2026-11-02T08:00 / TP82 ..."), and
+    `price_changes` lists offers still present at a different price.
+    """
+    checked_at: str
+    min_price: float | None
+    min_price_delta: float | None
+    currency: str | None
+    offers: int
+    new_offers: dict[str, float] = field(default_factory=dict)
+    removed_offers: dict[str, float] = field(default_factory=dict)
+    price_changes: list[dict] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass
+class PriceWatchDTO:
+    """DTO for a price watch and its latest check"""
+    watch_id: str
+    route: str
+    departure_date: str
+    return_date: str | None
+    interval_minutes: float
+    status: str
+    checks: int
+    created_at: str
+    last_checked_at: str | None
+    next_check_at: str | None
+    min_price: float | None
+    currency: str | None
+    last_error: str | None = None
+    last_check: PriceChangeDTO | None = None
+
+
+@dataclass
+class PriceHistoryDTO:
+    """DTO for the check history of a watch, newest first"""
+    watch: PriceWatchDTO
+    checks: list[PriceChangeDTO]
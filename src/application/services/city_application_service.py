@@ -1,4 +1,5 @@
 from typing import List
+from src.domain.exceptions.flight_exceptions import InvalidSearchParametersException
 from src.domain.gateways.city_gateway import CityGateway
 from src.domain.vo.search_params import CitySearchParams
 from src.application.dto.city_dto import CitySearchRequestDTO, CityDTO
@@ -12,12 +13,15 @@ class CityApplicationService:
     
     async def search_cities(self, request: CitySearchRequestDTO) -> List[CityDTO]:
         """Searches cities and returns DTOs"""
-        params = CitySearchParams(
-            keyword=request.keyword,
-            country_code=request.country_code,
-            max_results=request.max_results,
-            include="AIRPORTS" if request.include_airports else None
-        )
+        try:
+            params = CitySearchParams(
+                keyword=request.keyword,
+                country_code=request.country_code,
+                max_results=request.max_results,
+                include="AIRPORTS" if request.include_airports else None
+            )
+        except ValueError as e:
+            raise InvalidSearchParametersException(str(e)) from e
         
         cities = await self._city_gateway.search_cities(params)
         
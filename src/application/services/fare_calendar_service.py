@@ -0,0 +1,149 @@
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from typing import List
+from src.domain.entities.flight import FlightOffer
+from src.domain.exceptions.flight_exceptions import InvalidSearchParametersException
+from src.domain.services.flight_search_service import FlightSearchService, SearchOutcome
+from src.domain.vo.location_code import LocationCode
+from src.domain.vo.ranking_options import RankingOptions, SORT_PRICE
+from src.domain.vo.search_params import FlightSearchParams
+from src.application.services.progress import ProgressCallback
+from src.application.dto.fare_calendar_dto import (
+    FareCalendarRequestDTO,
+    FareCalendarCellDTO,
+    FareCalendarDTO
+)
+
+# Upper bound of per-day searches a single calendar may fan out to
+MAX_CALENDAR_SEARCHES = 62
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_OFFERS_PER_DAY = 10
+
+
+class FareCalendarApplicationService:
+    """Application service for flexible-date fare calendars"""
+    
+    def __init__(self, flight_search_service: FlightSearchService, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self._flight_search_service = flight_search_service
+        self._max_concurrency = max_concurrency
+    
+    async def search_calendar(self, request: FareCalendarRequestDTO, progress: ProgressCallback | None = None) -> FareCalendarDTO:
+        """Searches every departure date (and stay length) in the window concurrently
+        
+        `progress` receives each cell's cheapest offer as soon as it is known.
+        """
+        departure_dates = self._date_range(request.start_date, request.end_date)
+        stay_days = self._stay_range(request.min_stay_days, request.max_stay_days)
+        columns = stay_days or [None]
+        
+        if len(departure_dates) * len(columns) > MAX_CALENDAR_SEARCHES:
+            raise InvalidSearchParametersException(
+                f"Calendar window too large: at most {MAX_CALENDAR_SEARCHES} date combinations per request"
+            )
+        
+        params_list = [self._build_params(request, departure, stay) for departure in departure_dates for stay in columns]
+        completed = 0
+        
+        async def report(outcome: SearchOutcome):
+            nonlocal completed
+            completed += 1
+            cell = self._cheapest_cell(outcome)
+            message = f"{outcome.params.departure_date.isoformat()}"
+            if outcome.params.return_date:
+                message += f" -> {outcome.params.return_date.isoformat()}"
+            message += f": {cell.price} {cell.currency}" if cell else (f": {outcome.error}" if outcome.error else ": no offers")
+            await progress(completed, len(params_list), message, asdict(cell) if cell else None)
+        
+        outcomes = await self._flight_search_service.search_many(
+            params_list,
+            max_concurrency=self._max_concurrency,
+            on_outcome=report if progress else None,
+            # Each cell only needs its cheapest offer
+            ranking=RankingOptions(sort_by=SORT_PRICE),
+            top_k=1
+        )
+        
+        calendar = FareCalendarDTO(
+            departure_dates=[day.isoformat() for day in departure_dates],
+            stay_days=stay_days,
+            prices=[]
+        )
+        for row_index in range(len(departure_dates)):
+            row = []
+            for outcome in outcomes[row_index * len(columns):(row_index + 1) * len(columns)]:
+                cell = self._cheapest_cell(outcome)
+                row.append(cell.price if cell else None)
+                if cell:
+                    calendar.cells.append(cell)
+                if outcome.error:
+                    calendar.errors.append({
+                        "departure_date": outcome.params.departure_date.isoformat(),
+                        "return_date": outcome.params.return_date.isoformat() if outcome.params.return_date else None,
+                        "error": str(outcome.error)
+                    })
+            calendar.prices.append(row)
+        
+        if calendar.cells:
+            calendar.cheapest = min(calendar.cells, key=lambda c: c.price)
+        
+        return calendar
+    
+    def _cheapest_cell(self, outcome: SearchOutcome) -> FareCalendarCellDTO | None:
+        """Picks the cheapest offer of one cell"""
+        cheapest = min(outcome.flights, key=lambda f: f.price, default=None)
+        return self._map_cell(outcome.params, cheapest) if cheapest else None
+    
+    @staticmethod
+    def _build_params(request: FareCalendarRequestDTO, departure: date, stay: int | None) -> FlightSearchParams:
+        try:
+            return FlightSearchParams(
+                origin=LocationCode(request.origin_location_code),
+                destination=LocationCode(request.destination_location_code),
+                departure_date=departure,
+                adults=request.adults,
+                return_date=departure + timedelta(days=stay) if stay is not None else None,
+                children=request.children,
+                infants=request.infants,
+                travel_class=request.travel_class,
+                non_stop=request.non_stop,
+                currency_code=request.currency_code,
+                max_price=request.max_price,
+                max_results=request.offers_per_day or DEFAULT_OFFERS_PER_DAY
+            )
+        except ValueError as e:
+            raise InvalidSearchParametersException(str(e)) from e
+    
+    @staticmethod
+    def _date_range(start: str, end: str) -> List[date]:
+        try:
+            start_date = datetime.fromisoformat(start).date()
+            end_date = datetime.fromisoformat(end).date()
+        except ValueError as e:
+            raise InvalidSearchParametersException(str(e)) from e
+        if end_date < start_date:
+            raise InvalidSearchParametersException("end_date must not be before start_date")
+        return [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    
+    @staticmethod
+    def _stay_range(min_stay: int | None, max_stay: int | None) -> List[int]:
+        if min_stay is None and max_stay is None:
+            return []
+        low = min_stay if min_stay is not None else max_stay
+        high = max_stay if max_stay is not None else min_stay
+        if low < 0 or high < low:
+            raise InvalidSearchParametersException("Invalid stay range")
+        return list(range(low, high + 1))
+    
+    @staticmethod
+    def _map_cell(params: FlightSearchParams, flight: FlightOffer) -> FareCalendarCellDTO:
+        """Maps the cheapest offer of a cell to DTO"""
+        return FareCalendarCellDTO(
+            departure_date=params.departure_date.isoformat(),
+            return_date=params.return_date.isoformat() if params.return_date else None,
+            price=flight.price,
+            currency=flight.currency,
+            offer_id=flight.id,
+            airline=flight.segments[0].carrier_code if flight.segments else "",
+            is_direct=flight.is_direct,
+            duration=flight.total_duration
+        )
@@ -1,23 +1,214 @@
 from typing import List
+from dataclasses import asdict
 from datetime import datetime
-from src.domain.services.flight_search_service import FlightSearchService
+from src.domain.exceptions.flight_exceptions import InvalidSearchParametersException, ResultSetNotFoundException
+from src.domain.gateways.query_log import QueryLog
+from src.domain.gateways.result_store import ResultStore
+from src.domain.services.flight_search_service import FlightSearchService, SearchOutcome
 from src.domain.vo.search_params import FlightSearchParams
+from src.domain.vo.ranking_options import RankingOptions, DEFAULT_PARETO_CRITERIA
 from src.domain.vo.location_code import LocationCode
-from src.application.dto.flight_dto import FlightSearchRequestDTO, FlightOfferDTO
+from src.application.services.progress import ProgressCallback
+from src.application.dto.flight_dto import (
+    FlightSearchRequestDTO,
+    FlightOfferDTO,
+    FlightResultPageDTO,
+    ResultPageRequestDTO,
+    BatchFlightSearchRequestDTO,
+    BatchFlightSearchResultDTO,
+    RoutePairResultDTO
+)
+
+# Upper bound of origin x destination pairs per batch
+MAX_BATCH_PAIRS = 36
+BATCH_MAX_CONCURRENCY = 4
+MAX_PAGE_SIZE = 250
 
 
 class FlightApplicationService:
     """Application service for flights"""
     
-    def __init__(self, flight_search_service: FlightSearchService):
+    def __init__(
+        self,
+        flight_search_service: FlightSearchService,
+        result_store: ResultStore | None = None,
+        query_log: QueryLog | None = None
+    ):
         self._flight_search_service = flight_search_service
+        self._result_store = result_store
+        self._query_log = query_log
     
-    async def search_flights(self, request: FlightSearchRequestDTO) -> List[FlightOfferDTO]:
-        """Searches flights and returns DTOs"""
+    async def search_flights(self, request: FlightSearchRequestDTO, progress: ProgressCallback | None = None) -> FlightResultPageDTO:
+        """Searches flights and returns the first page of DTOs
+        
+        The full result is stored server-side (when a result store is configured)
+        so further pages or re-ranked views are served by `get_results`.
+        """
         # Converts DTO to Value Object
-        params = FlightSearchParams(
-            origin=LocationCode(request.origin_location_code),
-            destination=LocationCode(request.destination_location_code),
+        try:
+            params = FlightSearchParams(
+                origin=LocationCode(request.origin_location_code),
+                destination=LocationCode(request.destination_location_code),
+                departure_date=datetime.fromisoformat(request.departure_date).date(),
+                adults=request.adults,
+                return_date=datetime.fromisoformat(request.return_date).date() if request.return_date else None,
+                children=request.children,
+                infants=request.infants,
+                travel_class=request.travel_class,
+                included_airline_codes=request.included_airline_codes,
+                excluded_airline_codes=request.excluded_airline_codes,
+                non_stop=request.non_stop,
+                currency_code=request.currency_code,
+                max_price=request.max_price,
+                max_results=request.max_results
+            )
+            ranking = RankingOptions(
+                sort_by=request.sort_by,
+                weights=request.weights or {},
+                departure_window=RankingOptions.parse_window(request.departure_window),
+                result_mode=request.result_mode,
+                pareto_criteria=tuple(request.pareto_criteria or DEFAULT_PARETO_CRITERIA)
+            )
+        except ValueError as e:
+            raise InvalidSearchParametersException(str(e)) from e
+        
+        if request.page_size is not None and request.page_size < 1:
+            raise InvalidSearchParametersException("Page size must be at least 1")
+        
+        if progress:
+            await progress(0, 1, f"Searching {params.origin} -> {params.destination}", None)
+        
+        # Searches flights using domain service; the unranked offers are stored so
+        # get_results can re-rank them, including offers a Pareto front leaves out.
+        # Keeping them all is why this path does not stream into a top-k selection
+        flights = await self._flight_search_service.search_flights(params)
+        if self._query_log is not None:
+            self._query_log.record(params)
+        ranked = self._flight_search_service.rank_flights(flights, ranking)
+        
+        cursor = None
+        if self._result_store is not None:
+            cursor = (await self._result_store.save(params, flights, ranking)).cursor
+        
+        # Converts entities to DTOs
+        page = self._build_page(ranked, cursor, 0, request.page_size or len(ranked))
+        
+        if progress:
+            best = asdict(page.flights[0]) if page.flights else None
+            await progress(1, 1, f"Found {page.total} offers", best)
+        return page
+    
+    async def get_results(self, request: ResultPageRequestDTO) -> FlightResultPageDTO:
+        """Serves a page, optionally re-ranked, of a stored search without calling the API"""
+        if request.offset < 0:
+            raise InvalidSearchParametersException("Offset must not be negative")
+        if not 1 <= request.limit <= MAX_PAGE_SIZE:
+            raise InvalidSearchParametersException(f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+        
+        result_set = await self._result_store.load(request.cursor) if self._result_store else None
+        if result_set is None:
+            raise ResultSetNotFoundException(f"Unknown or expired cursor: {request.cursor}. Run the search again")
+        
+        stored = result_set.ranking
+        try:
+            ranking = RankingOptions(
+                sort_by=request.sort_by or stored.sort_by,
+                weights=request.weights if request.weights is not None else stored.weights,
+                departure_window=(
+                    RankingOptions.parse_window(request.departure_window)
+                    if request.departure_window is not None else stored.departure_window
+                ),
+                result_mode=request.result_mode or stored.result_mode,
+                pareto_criteria=tuple(request.pareto_criteria) if request.pareto_criteria else stored.pareto_criteria
+            )
+        except ValueError as e:
+            raise InvalidSearchParametersException(str(e)) from e
+        
+        ranked = self._flight_search_service.rank_flights(result_set.flights, ranking)
+        return self._build_page(ranked, result_set.cursor, request.offset, request.limit)
+    
+    def _build_page(self, flights, cursor: str | None, offset: int, limit: int) -> FlightResultPageDTO:
+        """Slices a ranked result into a page of DTOs"""
+        end = offset + limit
+        return FlightResultPageDTO(
+            flights=[self._map_flight_to_dto(flight) for flight in flights[offset:end]],
+            cursor=cursor,
+            total=len(flights),
+            offset=offset,
+            next_offset=end if end < len(flights) and cursor else None
+        )
+    
+    async def search_route_matrix(
+        self,
+        request: BatchFlightSearchRequestDTO,
+        progress: ProgressCallback | None = None
+    ) -> BatchFlightSearchResultDTO:
+        """Searches every origin x destination pair concurrently
+        
+        `progress` receives each pair's best offer as soon as its search finishes.
+        """
+        origins = dict.fromkeys(code.strip().upper() for code in request.origin_location_codes)
+        destinations = dict.fromkeys(code.strip().upper() for code in request.destination_location_codes)
+        pairs = [(origin, destination) for origin in origins for destination in destinations]
+        if not pairs:
+            raise InvalidSearchParametersException("At least one origin and one destination are required")
+        if len(pairs) > MAX_BATCH_PAIRS:
+            raise InvalidSearchParametersException(f"Too many route pairs: at most {MAX_BATCH_PAIRS} per batch")
+        
+        results: dict[tuple[str, str], RoutePairResultDTO] = {}
+        searchable = []
+        for origin, destination in pairs:
+            results[(origin, destination)] = RoutePairResultDTO(origin=origin, destination=destination)
+            if origin == destination:
+                results[(origin, destination)].error = "Origin and destination are the same"
+                continue
+            try:
+                searchable.append(self._build_pair_params(request, origin, destination))
+            except ValueError as e:
+                results[(origin, destination)].error = str(e)
+        
+        completed = 0
+        
+        async def report(outcome: SearchOutcome):
+            nonlocal completed
+            completed += 1
+            route = f"{outcome.params.origin} -> {outcome.params.destination}"
+            best = self._map_flight_to_dto(outcome.flights[0]) if outcome.flights else None
+            if best:
+                message = f"{route}: {best.price} {best.currency}"
+            else:
+                message = f"{route}: {outcome.error or 'no offers'}"
+            await progress(completed, len(searchable), message, asdict(best) if best else None)
+        
+        outcomes = await self._flight_search_service.search_many(
+            searchable,
+            max_concurrency=BATCH_MAX_CONCURRENCY,
+            on_outcome=report if progress else None
+        )
+        
+        all_flights = []
+        for outcome in outcomes:
+            pair = results[(str(outcome.params.origin), str(outcome.params.destination))]
+            if outcome.error:
+                pair.error = str(outcome.error)
+                continue
+            if self._query_log is not None:
+                self._query_log.record(outcome.params)
+            pair.offers = [self._map_flight_to_dto(flight) for flight in outcome.flights]
+            pair.best = pair.offers[0] if pair.offers else None
+            all_flights.extend(outcome.flights)
+        
+        ranking = self._flight_search_service.rank_flights(all_flights, top_k=request.max_ranked_results)
+        return BatchFlightSearchResultDTO(
+            pairs=list(results.values()),
+            ranking=[self._map_flight_to_dto(flight) for flight in ranking]
+        )
+    
+    def _build_pair_params(self, request: BatchFlightSearchRequestDTO, origin: str, destination: str) -> FlightSearchParams:
+        """Applies the batch's shared parameter template to one route pair"""
+        return FlightSearchParams(
+            origin=LocationCode(origin),
+            destination=LocationCode(destination),
             departure_date=datetime.fromisoformat(request.departure_date).date(),
             adults=request.adults,
             return_date=datetime.fromisoformat(request.return_date).date() if request.return_date else None,
@@ -29,14 +220,8 @@ class FlightApplicationService:
             non_stop=request.non_stop,
             currency_code=request.currency_code,
             max_price=request.max_price,
-            max_results=request.max_results
+            max_results=request.max_results_per_pair
         )
-        
-        # Searches flights using domain service
-        flights = await self._flight_search_service.search_best_flights(params)
-        
-        # Converts entities to DTOs
-        return [self._map_flight_to_dto(flight) for flight in flights]
     
     def _map_flight_to_dto(self, flight) -> FlightOfferDTO:
         """Maps entity to DTO"""
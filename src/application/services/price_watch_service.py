@@ -0,0 +1,254 @@
+import asyncio
+import logging
+import random
+import secrets
+import time
+from datetime import date, datetime, timezone
+from typing import Callable
+from src.domain.entities.price_watch import PriceWatch, PricePoint
+from src.domain.exceptions.flight_exceptions import (
+    FlightDomainException,
+    InvalidSearchParametersException,
+    WatchNotFoundException
+)
+from src.domain.gateways.watch_store import WatchStore
+from src.domain.services.flight_search_service import FlightSearchService
+from src.domain.services.price_diff import snapshot_offers, diff_snapshots
+from src.domain.vo.location_code import LocationCode
+from src.domain.vo.ranking_options import RankingOptions, SORT_PRICE
+from src.domain.vo.search_params import FlightSearchParams
+from src.application.services.request_budget import RequestBudget
+from src.application.dto.price_watch_dto import (
+    WatchRouteRequestDTO,
+    PriceChangeDTO,
+    PriceWatchDTO,
+    PriceHistoryDTO
+)
+
+logger = logging.getLogger(__name__)
+
+# Offers requested per check; the cheapest `tracked_offers` of them are compared
+WATCH_MAX_RESULTS = 50
+# How long a claimed watch is hidden from other schedulers while it is checked
+CHECK_LEASE_SECONDS = 300.0
+MAX_HISTORY_LIMIT = 500
+
+
+class PriceWatchApplicationService:
+    """Application service for price watches
+    
+    Each check searches the route, keeps the cheapest `tracked_offers` offers
+    and stores only their difference from the previous check. Checks spend the
+    shared request budget; a watch whose check does not fit is left due and
+    picked up by `run_due` once the budget refills.
+    """
+    
+    def __init__(
+        self,
+        flight_search_service: FlightSearchService,
+        store: WatchStore,
+        budget: RequestBudget,
+        default_interval: float = 3600.0,
+        min_interval: float = 600.0,
+        jitter: float = 0.1,
+        tracked_offers: int = 20,
+        max_watches: int = 50,
+        max_concurrency: int = 2,
+        clock: Callable[[], float] = time.time
+    ):
+        self._flight_search_service = flight_search_service
+        self._store = store
+        self._budget = budget
+        self._default_interval = default_interval
+        self._min_interval = min_interval
+        self._jitter = jitter
+        self._tracked_offers = tracked_offers
+        self._max_watches = max_watches
+        self._max_concurrency = max_concurrency
+        self._clock = clock
+        self.checks = 0
+        self.failures = 0
+    
+    async def watch_route(self, request: WatchRouteRequestDTO) -> PriceWatchDTO:
+        """Creates a watch and, budget permitting, takes its first snapshot right away"""
+        params = self._build_params(request)
+        if params.departure_date < date.today():
+            raise InvalidSearchParametersException("departure_date must not be in the past")
+        
+        interval = request.interval_minutes * 60 if request.interval_minutes is not None else self._default_interval
+        if interval < self._min_interval:
+            raise InvalidSearchParametersException(f"interval_minutes must be at least {self._min_interval / 60:g}")
+        if len(await self._store.list_all()) >= self._max_watches:
+            raise InvalidSearchParametersException(f"Too many price watches: at most {self._max_watches}. Remove one with unwatch_route")
+        
+        now = self._clock()
+        check_now = self._budget.try_acquire()
+        watch = PriceWatch(
+            id=secrets.token_urlsafe(8),
+            params=params,
+            interval=interval,
+            created_at=now,
+            # Leased while the first check runs; otherwise due as soon as the budget allows
+            next_check_at=now + CHECK_LEASE_SECONDS if check_now else now
+        )
+        await self._store.add(watch)
+        
+        point = await self._check(watch) if check_now else None
+        return self._map_watch(watch, point)
+    
+    async def unwatch_route(self, watch_id: str):
+        """Deletes a watch and its history"""
+        if not await self._store.remove(watch_id):
+            raise WatchNotFoundException(f"Unknown price watch: {watch_id}")
+    
+    async def list_watches(self) -> list[PriceWatchDTO]:
+        """Returns every watch with its latest check"""
+        watches = await self._store.list_all()
+        latest = await asyncio.gather(*(self._store.history(watch.id, 1) for watch in watches))
+        return [self._map_watch(watch, points[0] if points else None) for watch, points in zip(watches, latest)]
+    
+    async def get_price_history(self, watch_id: str, limit: int = 20, changes_only: bool = False) -> PriceHistoryDTO:
+        """Returns the latest checks of a watch, newest first, without searching
+        
+        With `changes_only`, checks that found no new, removed or repriced
+        offers are left out.
+        """
+        if not 1 <= limit <= MAX_HISTORY_LIMIT:
+            raise InvalidSearchParametersException(f"Limit must be between 1 and {MAX_HISTORY_LIMIT}")
+        
+        watch = await self._store.get(watch_id)
+        if watch is None:
+            raise WatchNotFoundException(f"Unknown price watch: {watch_id}")
+        
+        points = await self._store.history(watch_id, MAX_HISTORY_LIMIT if changes_only else limit)
+        if changes_only:
+            points = [point for point in points if point.changed or point.error][:limit]
+        return PriceHistoryDTO(
+            watch=self._map_watch(watch, points[0] if points else None),
+            checks=[self._map_point(point) for point in points]
+        )
+    
+    async def run_due(self) -> float | None:
+        """Checks the watches that are due, as far as the budget allows
+        
+        Returns the seconds until the next watch is due (or the budget
+        refills), or None when there is nothing to watch.
+        """
+        while True:
+            available = self._budget.available()
+            if available == 0:
+                break
+            due = await self._store.claim_due(self._clock(), min(available, self._max_concurrency), CHECK_LEASE_SECONDS)
+            if not due:
+                break
+            checks = [watch for watch in due if self._budget.try_acquire()]
+            await asyncio.gather(*(self._check(watch) for watch in checks))
+        
+        next_due = await self._store.next_due()
+        if next_due is None:
+            return None
+        return max(next_due - self._clock(), self._budget.wait_time())
+    
+    def stats(self) -> dict:
+        return {"checks": self.checks, "failures": self.failures, "budget": self._budget.stats()}
+    
+    async def _check(self, watch: PriceWatch) -> PricePoint:
+        """Searches a watched route and records the difference from its last snapshot"""
+        try:
+            flights = await self._flight_search_service.search_top_flights(
+                watch.params,
+                ranking=RankingOptions(sort_by=SORT_PRICE),
+                top_k=self._tracked_offers
+            )
+        except FlightDomainException as e:
+            logger.warning("Price watch %s check failed: %s", watch.id, str(e))
+            self.failures += 1
+            watch.failures += 1
+            watch.last_error = str(e)
+            point = PricePoint(
+                checked_at=self._clock(),
+                min_price=watch.min_price,
+                previous_min_price=watch.min_price,
+                currency=watch.currency,
+                offers=len(watch.snapshot),
+                error=str(e)
+            )
+        else:
+            snapshot = snapshot_offers(flights)
+            currency = flights[0].currency if flights else watch.currency
+            point = diff_snapshots(watch.snapshot, snapshot, self._clock(), currency)
+            watch.snapshot = snapshot
+            watch.currency = currency
+            watch.last_error = None
+        
+        self.checks += 1
+        watch.checks += 1
+        watch.last_checked_at = point.checked_at
+        watch.next_check_at = point.checked_at + watch.interval * random.uniform(1 - self._jitter, 1 + self._jitter)
+        await self._store.record(watch, point)
+        return point
+    
+    def _build_params(self, request: WatchRouteRequestDTO) -> FlightSearchParams:
+        try:
+            return FlightSearchParams(
+                origin=LocationCode(request.origin_location_code.strip().upper()),
+                destination=LocationCode(request.destination_location_code.strip().upper()),
+                departure_date=datetime.fromisoformat(request.departure_date).date(),
+                adults=request.adults,
+                return_date=datetime.fromisoformat(request.return_date).date() if request.return_date else None,
+                children=request.children,
+                infants=request.infants,
+                travel_class=request.travel_class,
+                non_stop=request.non_stop,
+                currency_code=request.currency_code,
+                max_price=request.max_price,
+                max_results=max(WATCH_MAX_RESULTS, self._tracked_offers)
+            )
+        except ValueError as e:
+            raise InvalidSearchParametersException(str(e)) from e
+    
+    @classmethod
+    def _map_watch(cls, watch: PriceWatch, point: PricePoint | None) -> PriceWatchDTO:
+        """Maps a watch entity to DTO"""
+        params = watch.params
+        return PriceWatchDTO(
+            watch_id=watch.id,
+            route=f"{params.origin}-{params.destination}",
+            departure_date=params.departure_date.isoformat(),
+            return_date=params.return_date.isoformat() if params.return_date else None,
+            interval_minutes=round(watch.interval / 60, 1),
+            status="active" if params.departure_date >= date.today() else "expired",
+            checks=watch.checks,
+            created_at=_timestamp(watch.created_at),
+            last_checked_at=_timestamp(watch.last_checked_at),
+            next_check_at=_timestamp(watch.next_check_at) if params.departure_date >= date.today() else None,
+            min_price=watch.min_price,
+            currency=watch.currency,
+            last_error=watch.last_error,
+            last_check=cls._map_point(point) if point else None
+        )
+    
+    @staticmethod
+    def _map_point(point: PricePoint) -> PriceChangeDTO:
+        """Maps a stored check to DTO"""
+        delta = None
+        if point.min_price is not None and point.previous_min_price is not None:
+            delta = round(point.min_price - point.previous_min_price, 2)
+        return PriceChangeDTO(
+            checked_at=_timestamp(point.checked_at),
+            min_price=point.min_price,
+            min_price_delta=delta,
+            currency=point.currency,
+            offers=point.offers,
+            new_offers=point.new_offers,
+            removed_offers=point.removed_offers,
+            price_changes=[
+                {"offer": signature, "old": old, "new": new, "delta": round(new - old, 2)}
+                for signature, (old, new) in sorted(point.price_changes.items(), key=lambda item: item[1][1] - item[1][0])
+            ],
+            error=point.error
+        )
+
+
+def _timestamp(value: float | None) -> str | None:
+    return datetime.fromtimestamp(value, timezone.utc).isoformat(timespec="seconds") if value is not None else None
@@ -0,0 +1,4 @@
+from typing import Awaitable, Callable
+
+# Receives (completed, total, message, partial result) as sub-searches finish
+ProgressCallback = Callable[[int, int, str, dict | None], Awaitable[None]]
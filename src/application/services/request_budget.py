@@ -0,0 +1,52 @@
+import math
+import time
+from typing import Callable
+
+
+class RequestBudget:
+    """Non-blocking token bucket capping background upstream requests per hour
+    
+    Background jobs spend tokens before searching and skip or postpone their
+    work when none are left, so they never compete with interactive searches
+    for more than their share of the API quota.
+    """
+    
+    def __init__(self, per_hour: float, burst: int | None = None, clock: Callable[[], float] = time.monotonic):
+        self._rate = max(per_hour, 0.0) / 3600
+        # Up to a quarter of an hour's budget may be spent at once
+        self._burst = burst or max(1, math.ceil(per_hour / 4))
+        self._tokens = float(self._burst) if per_hour > 0 else 0.0
+        self._clock = clock
+        self._updated = clock()
+        self.spent = 0
+        self.denied = 0
+    
+    def available(self) -> int:
+        """Number of requests that can be made now"""
+        self._refill()
+        return int(self._tokens)
+    
+    def try_acquire(self) -> bool:
+        """Spends one request if the budget allows it"""
+        self._refill()
+        if self._tokens < 1:
+            self.denied += 1
+            return False
+        self._tokens -= 1
+        self.spent += 1
+        return True
+    
+    def wait_time(self) -> float:
+        """Seconds until one more request is allowed"""
+        self._refill()
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self._rate if self._rate else math.inf
+    
+    def stats(self) -> dict:
+        return {"available": self.available(), "burst": self._burst, "spent": self.spent, "denied": self.denied}
+    
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
@@ -3,9 +3,12 @@ from datetime import datetime
 from src.domain.vo.location_code import LocationCode
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FlightSegment:
-    """Flight segment"""
+    """Flight segment
+    
+    Immutable so identical segments can be shared between offers.
+    """
     departure: LocationCode
     arrival: LocationCode
     departure_time: datetime
@@ -16,7 +19,7 @@ class FlightSegment:
     duration: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlightOffer:
     """Flight offer"""
     id: str
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+from src.domain.vo.search_params import FlightSearchParams
+
+
+@dataclass(slots=True)
+class PricePoint:
+    """One check of a watched route, stored as its difference from the previous check
+    
+    Offers are identified by their itinerary signature (see
+    `price_diff.offer_signature`). `new_offers` and `removed_offers` map
+    signatures to prices; `price_changes` maps them to (old price, new price).
+    """
+    checked_at: float
+    min_price: float | None = None
+    previous_min_price: float | None = None
+    currency: str | None = None
+    offers: int = 0
+    new_offers: dict[str, float] = field(default_factory=dict)
+    removed_offers: dict[str, float] = field(default_factory=dict)
+    price_changes: dict[str, tuple[float, float]] = field(default_factory=dict)
+    error: str | None = None
+    
+    @property
+    def changed(self) -> bool:
+        """Whether the check found new, removed or repriced offers"""
+        return bool(self.new_offers or self.removed_offers or self.price_changes)
+
+
+@dataclass(slots=True)
+class PriceWatch:
+    """A route re-searched periodically, with the offers seen at its last check"""
+    id: str
+    params: FlightSearchParams
+    interval: float
+    created_at: float
+    next_check_at: float
+    last_checked_at: float | None = None
+    checks: int = 0
+    failures: int = 0
+    last_error: str | None = None
+    currency: str | None = None
+    snapshot: dict[str, float] = field(default_factory=dict)
+    
+    @property
+    def min_price(self) -> float | None:
+        return min(self.snapshot.values(), default=None)
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from src.domain.entities.flight import FlightOffer
+from src.domain.vo.ranking_options import RankingOptions
+from src.domain.vo.search_params import FlightSearchParams
+
+
+@dataclass(slots=True)
+class ResultSet:
+    """Full result of one flight search, kept server-side for paging"""
+    cursor: str
+    params: FlightSearchParams
+    flights: list[FlightOffer]
+    ranking: RankingOptions
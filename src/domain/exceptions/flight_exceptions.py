@@ -16,6 +16,16 @@ class FlightServiceUnavailableException(FlightDomainException):
     pass
 
 
+class ResultSetNotFoundException(FlightDomainException):
+    """Exception for unknown or expired result cursors"""
+    pass
+
+
+class WatchNotFoundException(FlightDomainException):
+    """Exception for unknown price watches"""
+    pass
+
+
 class FlightApiException(FlightDomainException):
     """Exception for external flight API errors"""
     
@@ -8,6 +8,6 @@ class CityGateway(ABC):
     """City gateway interface for external API"""
     
     @abstractmethod
-    async def search_cities(self, params: CitySearchParams) -> dict:
+    async def search_cities(self, params: CitySearchParams) -> List[City]:
         """Search cities via external API"""
         pass
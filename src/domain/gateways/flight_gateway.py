@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List
 from src.domain.entities.flight import FlightOffer
 from src.domain.vo.search_params import FlightSearchParams
 
@@ -11,3 +11,8 @@ class FlightGateway(ABC):
     async def search_flights(self, params: FlightSearchParams) -> List[FlightOffer]:
         """Busca ofertas de voos via API externa"""
         pass
+    
+    async def iter_flights(self, params: FlightSearchParams) -> AsyncIterator[FlightOffer]:
+        """Yields flight offers one by one; gateways able to stream the response override this"""
+        for flight in await self.search_flights(params):
+            yield flight
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
+
+
+class MetricsRecorder(ABC):
+    """Records per-stage timings, sizes and counts on the request hot path"""
+    
+    @abstractmethod
+    def timer(self, stage: str, **labels: str) -> AbstractContextManager:
+        """Context manager timing the enclosed block as `stage`"""
+        pass
+    
+    @abstractmethod
+    def observe(self, name: str, value: float, **labels: str):
+        """Adds a sample to the `name` histogram"""
+        pass
+    
+    @abstractmethod
+    def increment(self, name: str, amount: float = 1, **labels: str):
+        """Adds `amount` to the `name` counter"""
+        pass
+
+
+_NULL_TIMER = nullcontext()
+
+
+class NullMetricsRecorder(MetricsRecorder):
+    """Recorder used while metrics are disabled; every call is a no-op"""
+    
+    def timer(self, stage: str, **labels: str) -> AbstractContextManager:
+        return _NULL_TIMER
+    
+    def observe(self, name: str, value: float, **labels: str):
+        pass
+    
+    def increment(self, name: str, amount: float = 1, **labels: str):
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from src.domain.vo.search_params import FlightSearchParams
+
+
+class QueryLog(ABC):
+    """Log of the flight searches users run, used to anticipate popular ones"""
+    
+    @abstractmethod
+    def record(self, params: FlightSearchParams):
+        """Counts one search; called on the request path, so it must not block"""
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from src.domain.entities.flight import FlightOffer
+from src.domain.entities.result_set import ResultSet
+from src.domain.vo.ranking_options import RankingOptions
+from src.domain.vo.search_params import FlightSearchParams
+
+
+class ResultStore(ABC):
+    """Server-side storage of search results addressed by opaque cursors"""
+    
+    @abstractmethod
+    async def save(self, params: FlightSearchParams, flights: list[FlightOffer], ranking: RankingOptions) -> ResultSet:
+        """Stores a result set under a new cursor"""
+        pass
+    
+    @abstractmethod
+    async def load(self, cursor: str) -> ResultSet | None:
+        """Returns the result set for a cursor, or None if unknown or expired"""
+        pass
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from src.domain.entities.price_watch import PriceWatch, PricePoint
+
+
+class WatchStore(ABC):
+    """Storage of price watches and their compact check history"""
+    
+    @abstractmethod
+    async def add(self, watch: PriceWatch):
+        """Stores a new watch"""
+        pass
+    
+    @abstractmethod
+    async def remove(self, watch_id: str) -> bool:
+        """Deletes a watch and its history; False if it did not exist"""
+        pass
+    
+    @abstractmethod
+    async def get(self, watch_id: str) -> PriceWatch | None:
+        """Returns a watch, or None if unknown"""
+        pass
+    
+    @abstractmethod
+    async def list_all(self) -> list[PriceWatch]:
+        """Returns every watch, oldest first"""
+        pass
+    
+    @abstractmethod
+    async def claim_due(self, now: float, limit: int, lease: float) -> list[PriceWatch]:
+        """Returns up to `limit` watches due by `now`, postponing them by `lease`
+        
+        The postponement keeps other schedulers sharing the store from checking
+        the same watches concurrently. Watches whose departure date has passed
+        are never due.
+        """
+        pass
+    
+    @abstractmethod
+    async def next_due(self) -> float | None:
+        """Returns the earliest next check time, or None without active watches"""
+        pass
+    
+    @abstractmethod
+    async def record(self, watch: PriceWatch, point: PricePoint):
+        """Saves a watch after a check and appends the check to its history"""
+        pass
+    
+    @abstractmethod
+    async def history(self, watch_id: str, limit: int) -> list[PricePoint]:
+        """Returns the latest `limit` checks of a watch, newest first"""
+        pass
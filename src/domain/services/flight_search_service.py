@@ -1,23 +1,114 @@
-from typing import List
+import asyncio
+import heapq
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Sequence
 from src.domain.entities.flight import FlightOffer
+from src.domain.exceptions.flight_exceptions import FlightDomainException
 from src.domain.gateways.flight_gateway import FlightGateway
+from src.domain.gateways.metrics_recorder import MetricsRecorder, NullMetricsRecorder
+from src.domain.services.ranking import RankingEngine
+from src.domain.vo.ranking_options import RankingOptions
 from src.domain.vo.search_params import FlightSearchParams
 
 
+@dataclass
+class SearchOutcome:
+    """Result of one search within a fan-out: sorted flights or the failure"""
+    params: FlightSearchParams
+    flights: List[FlightOffer] = field(default_factory=list)
+    error: FlightDomainException | None = None
+
+
 class FlightSearchService:
     """Domain service for flight search"""
     
-    def __init__(self, flight_gateway: FlightGateway):
+    def __init__(
+        self,
+        flight_gateway: FlightGateway,
+        ranking_engine: RankingEngine | None = None,
+        metrics: MetricsRecorder | None = None
+    ):
         self._flight_gateway = flight_gateway
+        self._ranking_engine = ranking_engine or RankingEngine()
+        self._metrics = metrics or NullMetricsRecorder()
+    
+    async def search_flights(self, params: FlightSearchParams) -> List[FlightOffer]:
+        """Searches flights in the order the gateway returns them, without ranking"""
+        with self._metrics.timer("gateway_search"):
+            return await self._flight_gateway.search_flights(params)
     
-    async def search_best_flights(self, params: FlightSearchParams) -> List[FlightOffer]:
+    async def search_best_flights(self, params: FlightSearchParams, ranking: RankingOptions | None = None) -> List[FlightOffer]:
         """Searches the best flights based on parameters"""
-        flights = await self._flight_gateway.search_flights(params)
+        flights = await self.search_flights(params)
         
         # Apply business rules to sort/filter
-        return self._sort_flights_by_best_value(flights)
+        with self._metrics.timer("ranking"):
+            return self._ranking_engine.rank(flights, ranking)
+    
+    async def search_top_flights(self, params: FlightSearchParams, ranking: RankingOptions | None = None, top_k: int = 1) -> List[FlightOffer]:
+        """Searches the best `top_k` flights
+        
+        When the ranking has a per-offer key, offers are consumed as the gateway
+        yields them and at most `top_k` are kept, whatever the response size.
+        """
+        key = self._ranking_engine.row_key(ranking)
+        if key is None:
+            return (await self.search_best_flights(params, ranking))[:top_k]
+        
+        # Max-heap of the best offers so far; the arrival index keeps ties stable
+        best: list[tuple] = []
+        with self._metrics.timer("gateway_search"):
+            async with aclosing(self._flight_gateway.iter_flights(params)) as flights:
+                index = 0
+                async for flight in flights:
+                    entry = (tuple(-value for value in key(flight)), -index, flight)
+                    if len(best) < top_k:
+                        heapq.heappush(best, entry)
+                    else:
+                        heapq.heappushpop(best, entry)
+                    index += 1
+        return [flight for _, _, flight in sorted(best, reverse=True)]
+    
+    async def search_many(
+        self,
+        params_list: Sequence[FlightSearchParams],
+        max_concurrency: int = 4,
+        on_outcome: Callable[[SearchOutcome], Awaitable[None]] | None = None,
+        ranking: RankingOptions | None = None,
+        top_k: int | None = None
+    ) -> List[SearchOutcome]:
+        """Runs several searches concurrently, capturing failures per search
+        
+        `on_outcome` is awaited as each search finishes, in completion order.
+        Outcomes are returned in the same order as `params_list`, each keeping
+        its best `top_k` flights when given.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(params: FlightSearchParams) -> SearchOutcome:
+            async with semaphore:
+                try:
+                    if top_k is None:
+                        flights = await self.search_best_flights(params, ranking)
+                    else:
+                        flights = await self.search_top_flights(params, ranking, top_k)
+                    outcome = SearchOutcome(params, flights)
+                except FlightDomainException as e:
+                    outcome = SearchOutcome(params, error=e)
+            
+            if on_outcome is not None:
+                await on_outcome(outcome)
+            return outcome
+        
+        return list(await asyncio.gather(*(run(params) for params in params_list)))
     
-    def _sort_flights_by_best_value(self, flights: List[FlightOffer]) -> List[FlightOffer]:
-        """Sorts flights by best value"""
-        # Prioritizes direct flights and lower price
-        return sorted(flights, key=lambda f: (not f.is_direct, f.price))
+    def rank_flights(
+        self,
+        flights: List[FlightOffer],
+        ranking: RankingOptions | None = None,
+        top_k: int | None = None
+    ) -> List[FlightOffer]:
+        """Ranks flights gathered from several searches, keeping the best `top_k`"""
+        with self._metrics.timer("ranking"):
+            return self._ranking_engine.rank(flights, ranking, top_k)
@@ -0,0 +1,43 @@
+from typing import Iterable
+from src.domain.entities.flight import FlightOffer
+from src.domain.entities.price_watch import PricePoint
+
+
+def offer_signature(flight: FlightOffer) -> str:
+    """Identifies an itinerary across searches, e.g. "LA8084 2026-11-02T08:00 / TP82 2026-11-02T23:15"
+    
+    Offer ids are only unique within one response, so offers are matched by
+    their flights and departure times instead.
+    """
+    return " / ".join(
+        f"{segment.carrier_code}{segment.flight_number} {segment.departure_time.isoformat(timespec='minutes')}"
+        for segment in flight.segments
+    )
+
+
+def snapshot_offers(flights: Iterable[FlightOffer]) -> dict[str, float]:
+    """Maps each itinerary to its lowest price among `flights`"""
+    snapshot: dict[str, float] = {}
+    for flight in flights:
+        signature = offer_signature(flight)
+        if signature not in snapshot or flight.price < snapshot[signature]:
+            snapshot[signature] = flight.price
+    return snapshot
+
+
+def diff_snapshots(previous: dict[str, float], current: dict[str, float], checked_at: float, currency: str | None) -> PricePoint:
+    """Compares two snapshots of the same route"""
+    return PricePoint(
+        checked_at=checked_at,
+        min_price=min(current.values(), default=None),
+        previous_min_price=min(previous.values(), default=None),
+        currency=currency,
+        offers=len(current),
+        new_offers={signature: price for signature, price in current.items() if signature not in previous},
+        removed_offers={signature: price for signature, price in previous.items() if signature not in current},
+        price_changes={
+            signature: (previous[signature], price)
+            for signature, price in current.items()
+            if signature in previous and previous[signature] != price
+        }
+    )
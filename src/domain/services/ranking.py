@@ -0,0 +1,207 @@
+import heapq
+import re
+from functools import lru_cache
+from typing import Callable, List, Sequence
+from src.domain.entities.flight import FlightOffer
+from src.domain.services.skyline import skyline
+from src.domain.vo.ranking_options import (
+    RankingOptions,
+    SORT_BEST_VALUE,
+    SORT_PRICE,
+    SORT_DURATION,
+    SORT_STOPS,
+    SORT_DEPARTURE,
+    SORT_WEIGHTED,
+    RESULT_PARETO
+)
+
+# NumPy is optional and slow to import, so it is loaded on first vectorized ranking
+np = None
+_numpy_checked = False
+
+_ISO_DURATION = re.compile(r'P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?')
+
+# Below this size the pure Python path is faster than building arrays
+VECTORIZE_THRESHOLD = 64
+
+
+def load_numpy():
+    """Imports NumPy once, returning None when it is not installed"""
+    global np, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None
+        _numpy_checked = True
+    return np
+
+
+@lru_cache(maxsize=4096)
+def duration_minutes(value: str) -> int:
+    """Parses an ISO 8601 duration such as 'PT10H30M' into minutes"""
+    match = _ISO_DURATION.fullmatch(value)
+    if not match:
+        return 0
+    days, hours, minutes = (int(group) if group else 0 for group in match.groups())
+    return days * 1440 + hours * 60 + minutes
+
+
+def total_minutes(flight: FlightOffer) -> float:
+    """Total travel time: flown segment durations, or first departure to last arrival"""
+    segments = flight.segments
+    total = 0
+    for segment in segments:
+        if not segment.duration:
+            return (segments[-1].arrival_time - segments[0].departure_time).total_seconds() / 60
+        total += duration_minutes(segment.duration)
+    return float(total)
+
+
+class RankingEngine:
+    """Ranks flight offers by configurable weighted criteria
+    
+    Offers are turned into columns (price, duration, stops, departure time,
+    seats) and scored in one vectorized pass when NumPy is installed, with a
+    pure Python fallback. When only the top `k` offers are needed, selection
+    uses a partial sort (argpartition / heap) instead of sorting everything.
+    """
+    
+    def __init__(self, vectorize: bool = True):
+        self._vectorize_requested = vectorize
+    
+    @property
+    def _vectorize(self) -> bool:
+        return self._vectorize_requested and load_numpy() is not None
+    
+    def rank(self, flights: Sequence[FlightOffer], options: RankingOptions | None = None, top_k: int | None = None) -> List[FlightOffer]:
+        """Returns flights ordered best first, limited to `top_k` when given"""
+        options = options or RankingOptions()
+        if options.result_mode == RESULT_PARETO:
+            flights = self.pareto_front(flights, options)
+        if not flights:
+            return []
+        
+        keys = self._sort_keys(flights, options)
+        if len(flights) >= VECTORIZE_THRESHOLD and self._vectorize:
+            order = self._vectorized_order(keys, top_k)
+        else:
+            order = self._python_order(keys, top_k)
+        return [flights[i] for i in order]
+    
+    def row_key(self, options: RankingOptions | None = None) -> Callable[[FlightOffer], tuple] | None:
+        """Per-offer sort key ordering offers as `rank` does
+        
+        Returns None when the order depends on the whole set (weighted scores
+        are normalized across offers, Pareto fronts compare them).
+        """
+        options = options or RankingOptions()
+        if options.result_mode == RESULT_PARETO or options.sort_by == SORT_WEIGHTED:
+            return None
+        
+        def key(flight: FlightOffer) -> tuple:
+            return tuple(column[0] for column in reversed(self._sort_keys((flight,), options)))
+        
+        return key
+    
+    def pareto_front(self, flights: Sequence[FlightOffer], options: RankingOptions) -> List[FlightOffer]:
+        """Offers not dominated by another offer on `options.pareto_criteria`"""
+        if not flights:
+            return []
+        columns = self._criterion_columns(flights, options)
+        points = list(zip(*(columns[criterion]() for criterion in options.pareto_criteria)))
+        return [flights[i] for i in skyline(points)]
+    
+    def _sort_keys(self, flights: Sequence[FlightOffer], options: RankingOptions) -> list[list[float]]:
+        """Sort keys as columns, least significant first"""
+        prices = [flight.price for flight in flights]
+        
+        if options.sort_by == SORT_BEST_VALUE:
+            # Direct flights first, then lower price
+            return [prices, [0.0 if flight.is_direct else 1.0 for flight in flights]]
+        if options.sort_by == SORT_PRICE:
+            return [prices]
+        if options.sort_by == SORT_DURATION:
+            return [prices, [total_minutes(flight) for flight in flights]]
+        if options.sort_by == SORT_STOPS:
+            return [prices, [float(len(flight.segments) - 1) for flight in flights]]
+        if options.sort_by == SORT_DEPARTURE:
+            return [prices, self._window_distances(flights, options.departure_window)]
+        return [prices, self._weighted_scores(flights, options, prices)]
+    
+    def _weighted_scores(self, flights: Sequence[FlightOffer], options: RankingOptions, prices: list[float]) -> list[float]:
+        """Weighted sum of min-max normalized criteria"""
+        columns = self._criterion_columns(flights, options, prices)
+        weights = options.effective_weights()
+        
+        if len(flights) >= VECTORIZE_THRESHOLD and self._vectorize:
+            scores = np.zeros(len(flights))
+            for criterion, weight in weights.items():
+                column = np.asarray(columns[criterion](), dtype=float)
+                spread = column.max() - column.min()
+                if spread > 0:
+                    scores += weight * (column - column.min()) / spread
+            return scores.tolist()
+        
+        scores = [0.0] * len(flights)
+        for criterion, weight in weights.items():
+            column = columns[criterion]()
+            low, high = min(column), max(column)
+            if high > low:
+                # Same operation order as the vectorized pass, so ties rank alike on both paths
+                spread = high - low
+                scores = [score + weight * (value - low) / spread for score, value in zip(scores, column)]
+        return scores
+    
+    def _criterion_columns(self, flights: Sequence[FlightOffer], options: RankingOptions, prices: list[float] | None = None) -> dict:
+        """Lazily built criterion columns, oriented so that lower is better"""
+        return {
+            "price": lambda: prices if prices is not None else [flight.price for flight in flights],
+            "duration": lambda: [total_minutes(flight) for flight in flights],
+            "stops": lambda: [float(len(flight.segments) - 1) for flight in flights],
+            "departure": lambda: self._window_distances(flights, options.departure_window),
+            # Negated so that more seats rank better
+            "seats": lambda: [-float(flight.seats_available) for flight in flights]
+        }
+    
+    @staticmethod
+    def _window_distances(flights: Sequence[FlightOffer], window: tuple[int, int] | None) -> list[float]:
+        """Hours between each first departure and the preferred window (0 inside it)"""
+        distances = []
+        for flight in flights:
+            if not flight.segments or window is None:
+                distances.append(0.0)
+                continue
+            departure = flight.segments[0].departure_time
+            hour = departure.hour + departure.minute / 60
+            start, end = window
+            inside = start <= hour < end if start <= end else (hour >= start or hour < end)
+            if inside:
+                distances.append(0.0)
+            else:
+                distances.append(min((start - hour) % 24, (hour - end) % 24))
+        return distances
+    
+    @staticmethod
+    def _vectorized_order(keys: list[list[float]], top_k: int | None) -> list[int]:
+        columns = [np.asarray(key, dtype=float) for key in keys]
+        size = len(columns[0])
+        
+        if top_k is not None and top_k < size:
+            # Partition on the primary key, keeping every tie at the cut-off
+            primary = columns[-1]
+            cutoff = np.partition(primary, top_k - 1)[top_k - 1]
+            candidates = np.flatnonzero(primary <= cutoff)
+            sub_order = np.lexsort([column[candidates] for column in columns])
+            return candidates[sub_order[:top_k]].tolist()
+        
+        return np.lexsort(columns).tolist()
+    
+    @staticmethod
+    def _python_order(keys: list[list[float]], top_k: int | None) -> list[int]:
+        rows = list(zip(*reversed(keys)))
+        indexes = range(len(rows))
+        if top_k is not None and top_k < len(rows):
+            return heapq.nsmallest(top_k, indexes, key=lambda i: (rows[i], i))
+        return sorted(indexes, key=lambda i: rows[i])
@@ -0,0 +1,78 @@
+from bisect import bisect_left, bisect_right
+from typing import List, Sequence
+
+
+def skyline(points: Sequence[tuple[float, ...]]) -> List[int]:
+    """Indexes of the non-dominated points, lower being better on every dimension
+    
+    A point is dominated when another one is no worse on every dimension and
+    differs from it. Identical points are all kept. Runs in O(n log n) for up
+    to three dimensions (sort and sweep) and falls back to sort-filter-skyline
+    beyond that.
+    """
+    if not points:
+        return []
+    
+    # Duplicates share a fate, so the sweep only sees distinct points
+    groups: dict[tuple[float, ...], list[int]] = {}
+    for index, point in enumerate(points):
+        groups.setdefault(tuple(point), []).append(index)
+    unique = sorted(groups)
+    
+    dimensions = len(unique[0])
+    if dimensions == 1:
+        front = unique[:1]
+    elif dimensions == 2:
+        front = _skyline_2d(unique)
+    elif dimensions == 3:
+        front = _skyline_3d(unique)
+    else:
+        front = _skyline_sfs(unique)
+    
+    return sorted(index for point in front for index in groups[point])
+
+
+def _skyline_2d(points: list[tuple[float, ...]]) -> list[tuple[float, ...]]:
+    """Sweep over points sorted by (x, y), keeping those that lower the best y"""
+    front = []
+    best_y = float("inf")
+    for point in points:
+        if point[1] < best_y:
+            front.append(point)
+            best_y = point[1]
+    return front
+
+
+def _skyline_3d(points: list[tuple[float, ...]]) -> list[tuple[float, ...]]:
+    """Sweep over points sorted by x, keeping a (y, z) staircase of the front so far
+    
+    The staircase is ordered by ascending y with strictly descending z, so the
+    best z among points with y' <= y is that of the last step at or before y.
+    """
+    front = []
+    stair_y: list[float] = []
+    stair_z: list[float] = []
+    for point in points:
+        _, y, z = point
+        position = bisect_right(stair_y, y)
+        if position and stair_z[position - 1] <= z:
+            continue
+        front.append(point)
+        
+        # Drop the steps this point now dominates in (y, z)
+        start = bisect_left(stair_y, y)
+        end = start
+        while end < len(stair_y) and stair_z[end] >= z:
+            end += 1
+        stair_y[start:end] = [y]
+        stair_z[start:end] = [z]
+    return front
+
+
+def _skyline_sfs(points: list[tuple[float, ...]]) -> list[tuple[float, ...]]:
+    """Sort-filter-skyline: in sum order no point is dominated by a later one"""
+    front: list[tuple[float, ...]] = []
+    for point in sorted(points, key=sum):
+        if not any(all(a <= b for a, b in zip(kept, point)) for kept in front):
+            front.append(point)
+    return front
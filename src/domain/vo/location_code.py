@@ -1,6 +1,11 @@
 from dataclasses import dataclass
 import re
 
+_IATA_CODE_PATTERN = re.compile(r'[A-Z]{3}')
+
+# Validated instances shared by `LocationCode.of`; bounded by the 26^3 possible codes
+_INTERNED: dict[str, 'LocationCode'] = {}
+
 
 @dataclass(frozen=True)
 class LocationCode:
@@ -11,10 +16,18 @@ class LocationCode:
         if not self._is_valid_iata_code(self.code):
             raise ValueError(f"Invalid IATA code: {self.code}")
     
+    @classmethod
+    def of(cls, code: str) -> 'LocationCode':
+        """Returns a shared instance, validating each distinct code only once"""
+        location = _INTERNED.get(code)
+        if location is None:
+            location = _INTERNED.setdefault(code, cls(code))
+        return location
+    
     @staticmethod
     def _is_valid_iata_code(code: str) -> bool:
         """Validates IATA code (3 uppercase letters)"""
-        return bool(re.match(r'^[A-Z]{3}$', code))
+        return isinstance(code, str) and _IATA_CODE_PATTERN.fullmatch(code) is not None
     
     def __str__(self) -> str:
         return self.code
@@ -0,0 +1,67 @@
+from dataclasses import dataclass, field
+
+SORT_BEST_VALUE = "best_value"
+SORT_PRICE = "price"
+SORT_DURATION = "duration"
+SORT_STOPS = "stops"
+SORT_DEPARTURE = "departure"
+SORT_WEIGHTED = "weighted"
+
+SORT_OPTIONS = (SORT_BEST_VALUE, SORT_PRICE, SORT_DURATION, SORT_STOPS, SORT_DEPARTURE, SORT_WEIGHTED)
+RANKING_CRITERIA = ("price", "duration", "stops", "departure", "seats")
+
+RESULT_ALL = "all"
+RESULT_PARETO = "pareto"
+RESULT_MODES = (RESULT_ALL, RESULT_PARETO)
+DEFAULT_PARETO_CRITERIA = ("price", "duration", "stops")
+
+
+@dataclass(frozen=True)
+class RankingOptions:
+    """How flight offers are ranked
+    
+    `weighted` scores each offer as the weighted sum of its min-max normalized
+    criteria (lower is better; more seats and departures inside
+    `departure_window` score better). The `pareto` result mode keeps only the
+    offers no other offer beats on all of `pareto_criteria`.
+    """
+    sort_by: str = SORT_BEST_VALUE
+    weights: dict[str, float] = field(default_factory=dict)
+    departure_window: tuple[int, int] | None = None
+    result_mode: str = RESULT_ALL
+    pareto_criteria: tuple[str, ...] = DEFAULT_PARETO_CRITERIA
+    
+    def __post_init__(self):
+        if self.sort_by not in SORT_OPTIONS:
+            raise ValueError(f"Invalid sort_by: {self.sort_by}. Use one of: {', '.join(SORT_OPTIONS)}")
+        for criterion, weight in self.weights.items():
+            if criterion not in RANKING_CRITERIA:
+                raise ValueError(f"Invalid ranking criterion: {criterion}. Use one of: {', '.join(RANKING_CRITERIA)}")
+            if weight < 0:
+                raise ValueError(f"Ranking weight for {criterion} must not be negative")
+        if self.result_mode not in RESULT_MODES:
+            raise ValueError(f"Invalid result_mode: {self.result_mode}. Use one of: {', '.join(RESULT_MODES)}")
+        if not self.pareto_criteria:
+            raise ValueError("Pareto criteria must not be empty")
+        for criterion in self.pareto_criteria:
+            if criterion not in RANKING_CRITERIA:
+                raise ValueError(f"Invalid ranking criterion: {criterion}. Use one of: {', '.join(RANKING_CRITERIA)}")
+        if self.departure_window is not None:
+            start, end = self.departure_window
+            if not (0 <= start <= 24 and 0 <= end <= 24):
+                raise ValueError("Departure window hours must be between 0 and 24")
+    
+    @classmethod
+    def parse_window(cls, value: str | None) -> tuple[int, int] | None:
+        """Parses a departure window such as '06-12' (hours, may wrap midnight)"""
+        if not value:
+            return None
+        try:
+            start, end = value.split("-")
+            return int(start), int(end)
+        except ValueError:
+            raise ValueError(f"Invalid departure window: {value}. Use the format 'HH-HH'") from None
+    
+    def effective_weights(self) -> dict[str, float]:
+        """Weights applied by the `weighted` mode (price only when none given)"""
+        return {criterion: weight for criterion, weight in (self.weights or {"price": 1.0}).items() if weight}
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import date
 from src.domain.vo.location_code import LocationCode
 
@@ -28,6 +28,50 @@ class FlightSearchParams:
             raise ValueError("Number of children must be between 0 and 9")
         if self.infants is not None and (self.infants < 0 or self.infants > 9):
             raise ValueError("Number of infants must be between 0 and 9")
+    
+    def to_dict(self) -> dict:
+        """JSON-compatible form, read back by `from_dict`"""
+        document = asdict(self)
+        document["origin"] = str(self.origin)
+        document["destination"] = str(self.destination)
+        document["departure_date"] = self.departure_date.isoformat()
+        document["return_date"] = self.return_date.isoformat() if self.return_date else None
+        return document
+    
+    @classmethod
+    def from_dict(cls, document: dict) -> 'FlightSearchParams':
+        """Rebuilds parameters stored with `to_dict`"""
+        return cls(**{
+            **document,
+            "origin": LocationCode.of(document["origin"]),
+            "destination": LocationCode.of(document["destination"]),
+            "departure_date": date.fromisoformat(document["departure_date"]),
+            "return_date": date.fromisoformat(document["return_date"]) if document["return_date"] else None
+        })
+    
+    def cache_key(self) -> str:
+        """Canonical key: equivalent searches map to the same string"""
+        def codes(value: str | None) -> str:
+            if not value:
+                return ""
+            return ",".join(sorted(code.strip().upper() for code in value.split(",") if code.strip()))
+        
+        return "|".join((
+            str(self.origin),
+            str(self.destination),
+            self.departure_date.isoformat(),
+            self.return_date.isoformat() if self.return_date else "",
+            str(self.adults),
+            str(self.children or 0),
+            str(self.infants or 0),
+            (self.travel_class or "").upper(),
+            codes(self.included_airline_codes),
+            codes(self.excluded_airline_codes),
+            "1" if self.non_stop else "0",
+            (self.currency_code or "").upper(),
+            str(self.max_price) if self.max_price is not None else "",
+            str(self.max_results) if self.max_results is not None else ""
+        ))
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from typing import Callable
+from src.application.services.request_budget import RequestBudget
+from src.infrastructure.cache.query_log import SQLiteQueryLog
+from src.infrastructure.gateways.cached_flight_gateway import CachedFlightGateway
+
+logger = logging.getLogger(__name__)
+
+# Decayed score a search needs to be warmed: about two searches within one half-life
+MIN_WARM_SCORE = 1.0
+
+
+class CacheWarmer:
+    """Prefetches the most popular searches into the offer cache while the server is idle
+    
+    Every `interval` seconds the query log is flushed and its hottest searches
+    that are missing from the cache, or would go stale before the next pass,
+    are fetched one at a time. A pass stops as soon as a user search comes in
+    or the request budget runs out. The gateway, and with it the HTTP stack, is
+    only built once there is something to warm.
+    """
+    
+    def __init__(
+        self,
+        query_log: SQLiteQueryLog,
+        gateway_factory: Callable[[], CachedFlightGateway],
+        budget: RequestBudget,
+        interval: float = 60.0,
+        idle_seconds: float = 5.0,
+        max_routes: int = 20
+    ):
+        self._query_log = query_log
+        self._gateway_factory = gateway_factory
+        self._budget = budget
+        self._interval = interval
+        self._idle_seconds = idle_seconds
+        self._max_routes = max_routes
+        self._task: asyncio.Task | None = None
+        self.passes = 0
+        self.warmed = 0
+        self.skipped_busy = 0
+        self.errors = 0
+    
+    def start(self):
+        """Starts warming on the running event loop; the first pass runs right away"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "passes": self.passes,
+            "warmed": self.warmed,
+            "skipped_busy": self.skipped_busy,
+            "errors": self.errors,
+            "budget": self._budget.stats()
+        }
+    
+    async def aclose(self):
+        """Stops warming and saves the searches recorded since the last pass"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._query_log.flush()
+    
+    async def warm(self) -> int:
+        """Runs one pass; returns the number of searches prefetched"""
+        await self._query_log.flush()
+        if self._query_log.idle_for() < self._idle_seconds:
+            self.skipped_busy += 1
+            return 0
+        
+        hottest = await self._query_log.hottest(self._max_routes, MIN_WARM_SCORE)
+        if not hottest:
+            return 0
+        
+        self.passes += 1
+        gateway = self._gateway_factory()
+        warmed = 0
+        for params in hottest:
+            if self._query_log.idle_for() < self._idle_seconds:
+                self.skipped_busy += 1
+                break
+            if gateway.is_cached(params, min_fresh=self._interval):
+                continue
+            if not self._budget.try_acquire():
+                break
+            try:
+                await gateway.prefetch(params)
+                warmed += 1
+            except Exception as e:
+                self.errors += 1
+                logger.warning("Cache warming failed for %s: %s", params.cache_key(), str(e))
+        self.warmed += warmed
+        return warmed
+    
+    async def _run(self):
+        while True:
+            try:
+                warmed = await self.warm()
+                if warmed:
+                    logger.info("Warmed %d popular searches", warmed)
+            except Exception as e:
+                # The loop must outlive storage or upstream failures
+                self.errors += 1
+                logger.warning("Cache warming pass failed: %s", str(e))
+            await asyncio.sleep(self._interval)
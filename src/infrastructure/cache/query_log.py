@@ -0,0 +1,148 @@
+import asyncio
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable
+from src.domain.gateways.query_log import QueryLog
+from src.domain.vo.search_params import FlightSearchParams
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_log (
+    key TEXT PRIMARY KEY,
+    params TEXT NOT NULL,
+    departure_date TEXT NOT NULL,
+    score REAL NOT NULL,
+    hits INTEGER NOT NULL,
+    last_seen REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS query_log_score ON query_log (score);
+"""
+
+
+def _log2_add(a: float, b: float) -> float:
+    """log2(2**a + 2**b) without overflow"""
+    high, low = (a, b) if a >= b else (b, a)
+    return high + math.log2(1 + 2 ** (low - high))
+
+
+class SQLiteQueryLog(QueryLog):
+    """Decayed popularity of normalized searches, persisted in SQLite
+    
+    Every search adds 1 to its score and scores halve every `half_life`
+    seconds. Scores are kept as log2 values in half-lives since the epoch, so
+    older rows never need rewriting: ranking by the stored value is ranking by
+    current popularity. Searches are aggregated in memory and merged into the
+    database by `flush`, keeping the request path free of I/O; only the
+    `max_entries` most popular searches with future departures are kept.
+    """
+    
+    def __init__(self, path: Path, half_life: float, max_entries: int, busy_timeout: float = 5.0, clock: Callable[[], float] = time.time):
+        self._path = Path(path)
+        self._half_life = half_life
+        self._max_entries = max_entries
+        self._busy_timeout = busy_timeout
+        self._clock = clock
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._pending: dict[str, list] = {}
+        self._last_recorded: float | None = None
+        self.recorded = 0
+        self.flushes = 0
+        self.errors = 0
+    
+    def record(self, params: FlightSearchParams):
+        now = self._clock()
+        key = params.cache_key()
+        weight = now / self._half_life
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = [params, weight, 1, now]
+        else:
+            pending[1] = _log2_add(pending[1], weight)
+            pending[2] += 1
+            pending[3] = now
+        self._last_recorded = time.monotonic()
+        self.recorded += 1
+    
+    def idle_for(self) -> float:
+        """Seconds since the last recorded search (infinite if none yet)"""
+        return math.inf if self._last_recorded is None else time.monotonic() - self._last_recorded
+    
+    async def flush(self):
+        """Merges the searches recorded since the last flush into the database"""
+        pending, self._pending = self._pending, {}
+        await asyncio.to_thread(self._locked, self._flush, pending)
+    
+    async def hottest(self, limit: int, min_score: float = 1.0) -> list[FlightSearchParams]:
+        """Returns the most popular upcoming searches whose decayed score is at least `min_score`"""
+        rows = await asyncio.to_thread(self._locked, self._hottest, limit, min_score)
+        return [FlightSearchParams.from_dict(json.loads(row[0])) for row in rows or ()]
+    
+    def stats(self) -> dict:
+        return {"recorded": self.recorded, "pending": len(self._pending), "flushes": self.flushes, "errors": self.errors}
+    
+    def close(self):
+        """Closes the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def _locked(self, operation, *args):
+        """Runs an operation on the shared connection; failures only lose popularity data"""
+        with self._lock:
+            try:
+                return operation(self._connect(), *args)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                self.errors += 1
+                logger.warning("Query log operation failed: %s", str(e))
+                return None
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, timeout=self._busy_timeout, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+    
+    def _flush(self, connection: sqlite3.Connection, pending: dict[str, list]):
+        today = date.fromtimestamp(self._clock()).isoformat()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for key, (params, score, hits, last_seen) in pending.items():
+                row = connection.execute("SELECT score, hits FROM query_log WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    score = _log2_add(row[0], score)
+                    hits += row[1]
+                connection.execute(
+                    "INSERT OR REPLACE INTO query_log (key, params, departure_date, score, hits, last_seen) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, json.dumps(params.to_dict(), separators=(",", ":")), params.departure_date.isoformat(), score, hits, last_seen)
+                )
+            connection.execute("DELETE FROM query_log WHERE departure_date < ?", (today,))
+            connection.execute(
+                "DELETE FROM query_log WHERE key NOT IN (SELECT key FROM query_log ORDER BY score DESC LIMIT ?)",
+                (self._max_entries,)
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self.flushes += 1
+    
+    def _hottest(self, connection: sqlite3.Connection, limit: int, min_score: float) -> list[tuple]:
+        now = self._clock()
+        threshold = math.log2(min_score) + now / self._half_life if min_score > 0 else -math.inf
+        return connection.execute(
+            "SELECT params FROM query_log WHERE departure_date >= ? AND score >= ? ORDER BY score DESC LIMIT ?",
+            (date.fromtimestamp(now).isoformat(), threshold, limit)
+        ).fetchall()
@@ -0,0 +1,138 @@
+import secrets
+from dataclasses import asdict, fields
+from datetime import datetime
+from src.domain.entities.flight import FlightOffer, FlightSegment
+from src.domain.entities.result_set import ResultSet
+from src.domain.gateways.result_store import ResultStore
+from src.domain.vo.location_code import LocationCode
+from src.domain.vo.ranking_options import RankingOptions
+from src.domain.vo.search_params import FlightSearchParams
+from src.infrastructure.cache.sqlite_cache import SQLiteCache
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+PERSISTENT_NAMESPACE = "result-sets"
+
+
+class InMemoryResultStore(ResultStore):
+    """Keeps result sets in a TTL/LRU cache bounded by count and size"""
+    
+    def __init__(self, cache: TTLLRUCache):
+        self._cache = cache
+    
+    async def save(self, params: FlightSearchParams, flights: list[FlightOffer], ranking: RankingOptions) -> ResultSet:
+        result_set = ResultSet(
+            cursor=secrets.token_urlsafe(12),
+            params=params,
+            flights=list(flights),
+            ranking=ranking
+        )
+        self._cache.put(result_set.cursor, result_set)
+        return result_set
+    
+    async def load(self, cursor: str) -> ResultSet | None:
+        entry = self._cache.get(cursor)
+        return entry.value if entry else None
+    
+    def adopt(self, result_set: ResultSet):
+        """Stores a result set under its existing cursor"""
+        self._cache.put(result_set.cursor, result_set)
+    
+    def stats(self) -> dict:
+        """Returns storage counters"""
+        return self._cache.stats()
+
+
+class SharedResultStore(ResultStore):
+    """Result store whose cursors can be resolved by any server process
+    
+    Result sets stay in memory locally and are also written, offers included,
+    to the persistent cache. Another worker adopts the stored offers as they
+    are rather than searching again, so a cursor always pages the same list.
+    """
+    
+    def __init__(self, local: InMemoryResultStore, persistent_cache: SQLiteCache, ttl: float):
+        self._local = local
+        self._persistent_cache = persistent_cache
+        self._ttl = ttl
+        self.adopted = 0
+    
+    async def save(self, params: FlightSearchParams, flights: list[FlightOffer], ranking: RankingOptions) -> ResultSet:
+        result_set = await self._local.save(params, flights, ranking)
+        document = {
+            "params": params.to_dict(),
+            "ranking": _ranking_to_json(ranking),
+            "flights": [_offer_to_json(flight) for flight in result_set.flights]
+        }
+        await self._persistent_cache.put(PERSISTENT_NAMESPACE, result_set.cursor, document, self._ttl)
+        return result_set
+    
+    async def load(self, cursor: str) -> ResultSet | None:
+        result_set = await self._local.load(cursor)
+        if result_set is not None:
+            return result_set
+        
+        document = await self._persistent_cache.get(PERSISTENT_NAMESPACE, cursor)
+        if document is None:
+            return None
+        
+        result_set = ResultSet(
+            cursor=cursor,
+            params=FlightSearchParams.from_dict(document["params"]),
+            flights=[_offer_from_json(flight) for flight in document["flights"]],
+            ranking=_ranking_from_json(document["ranking"])
+        )
+        self._local.adopt(result_set)
+        self.adopted += 1
+        return result_set
+    
+    def stats(self) -> dict:
+        """Returns storage counters"""
+        return {**self._local.stats(), "adopted": self.adopted}
+
+
+def _ranking_to_json(ranking: RankingOptions) -> dict:
+    return asdict(ranking)
+
+
+def _ranking_from_json(document: dict) -> RankingOptions:
+    window = document["departure_window"]
+    return RankingOptions(**{
+        **document,
+        "departure_window": tuple(window) if window else None,
+        "pareto_criteria": tuple(document["pareto_criteria"])
+    })
+
+
+def _offer_to_json(flight: FlightOffer) -> dict:
+    document = {field.name: getattr(flight, field.name) for field in fields(flight)}
+    document["segments"] = [
+        [
+            str(segment.departure),
+            str(segment.arrival),
+            segment.departure_time.isoformat(),
+            segment.arrival_time.isoformat(),
+            segment.carrier_code,
+            segment.flight_number,
+            segment.aircraft,
+            segment.duration
+        ]
+        for segment in flight.segments
+    ]
+    return document
+
+
+def _offer_from_json(document: dict) -> FlightOffer:
+    segments = [
+        FlightSegment(
+            departure=LocationCode.of(departure),
+            arrival=LocationCode.of(arrival),
+            departure_time=datetime.fromisoformat(departure_time),
+            arrival_time=datetime.fromisoformat(arrival_time),
+            carrier_code=carrier_code,
+            flight_number=flight_number,
+            aircraft=aircraft,
+            duration=duration
+        )
+        for departure, arrival, departure_time, arrival_time, carrier_code, flight_number, aircraft, duration in document["segments"]
+    ]
+    return FlightOffer(**{**document, "segments": segments})
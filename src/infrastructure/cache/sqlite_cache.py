@@ -0,0 +1,157 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_entries_expires_at ON cache_entries (expires_at);
+"""
+
+
+class SQLiteCache:
+    """Persistent JSON cache in a local SQLite database shared across processes
+    
+    The database runs in WAL mode so readers never block the single writer, and
+    writes use `BEGIN IMMEDIATE` with a busy timeout so concurrent server
+    processes queue instead of failing. Entries expire by wall-clock TTL; when
+    the stored values exceed `max_bytes`, the entries closest to expiry are
+    evicted first. Failures are logged and treated as misses so the cache can
+    never break a search.
+    """
+    
+    def __init__(self, path: Path, max_bytes: int, busy_timeout: float = 5.0):
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._busy_timeout = busy_timeout
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+    
+    async def get(self, namespace: str, key: str) -> Any | None:
+        """Returns the decoded value if present and not expired"""
+        value = await asyncio.to_thread(self._locked, self._get, namespace, key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+    
+    async def put(self, namespace: str, key: str, value: Any, ttl: float):
+        """Stores a JSON-serializable value for `ttl` seconds"""
+        await asyncio.to_thread(self._locked, self._put, namespace, key, value, ttl)
+    
+    async def invalidate(self, namespace: str, key: str):
+        """Removes a single entry"""
+        await asyncio.to_thread(self._locked, self._invalidate, namespace, key)
+    
+    def stats(self) -> dict:
+        """Returns cache counters for this process"""
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self._path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+    
+    def close(self):
+        """Closes the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def _locked(self, operation, *args):
+        """Runs an operation on the shared connection, turning errors into misses"""
+        with self._lock:
+            try:
+                return operation(self._connect(), *args)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                self.errors += 1
+                logger.warning("Persistent cache operation failed: %s", str(e))
+                return None
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # Cached values include the OAuth token, so keep the file private
+            if not self._path.exists():
+                self._path.touch(mode=0o600)
+            connection = sqlite3.connect(self._path, timeout=self._busy_timeout, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+    
+    def _get(self, connection: sqlite3.Connection, namespace: str, key: str) -> Any | None:
+        row = connection.execute(
+            "SELECT value FROM cache_entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (namespace, key, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def _put(self, connection: sqlite3.Connection, namespace: str, key: str, value: Any, ttl: float):
+        encoded = json.dumps(value, separators=(",", ":"))
+        size = len(encoded)
+        if size > self._max_bytes:
+            return
+        
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, size, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, encoded, size, now + ttl)
+            )
+            self._evict(connection, now)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self.writes += 1
+    
+    def _evict(self, connection: sqlite3.Connection, now: float):
+        """Drops expired entries, then the ones closest to expiry until under `max_bytes`"""
+        self.evictions += connection.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,)).rowcount
+        
+        excess = connection.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0] - self._max_bytes
+        if excess <= 0:
+            return
+        
+        freed = 0
+        victims = []
+        for namespace, key, size in connection.execute(
+            "SELECT namespace, key, size FROM cache_entries ORDER BY expires_at"
+        ):
+            victims.append((namespace, key))
+            freed += size
+            if freed >= excess:
+                break
+        connection.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", victims)
+        self.evictions += len(victims)
+    
+    def _invalidate(self, connection: sqlite3.Connection, namespace: str, key: str):
+        connection.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key))
+
@@ -0,0 +1,164 @@
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+
+@dataclass
+class CacheEntry:
+    """Cached value with freshness bookkeeping"""
+    value: Any
+    size: int
+    expires_at: float
+    stale_until: float
+    
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (time.monotonic() if now is None else now) < self.expires_at
+    
+    def is_usable(self, now: float | None = None) -> bool:
+        return (time.monotonic() if now is None else now) < self.stale_until
+
+
+class TTLLRUCache:
+    """In-memory cache with per-entry TTL and LRU eviction by count and size
+    
+    Entries stay usable for `stale_ttl` seconds after they expire so callers
+    can serve them while a refresh runs (stale-while-revalidate).
+    """
+    
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float, stale_ttl: float = 0.0):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable) -> CacheEntry | None:
+        """Returns a usable entry (fresh or stale) and marks it recently used"""
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        
+        if entry is None:
+            self.misses += 1
+            return None
+        if not entry.is_usable(now):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        if entry.is_fresh(now):
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry
+    
+    def peek(self, key: Hashable) -> CacheEntry | None:
+        """Returns a usable entry without counting a lookup or marking it used"""
+        entry = self._entries.get(key)
+        return entry if entry is not None and entry.is_usable() else None
+    
+    def put(self, key: Hashable, value: Any, size: int | None = None, ttl: float | None = None):
+        """Stores a value, evicting least recently used entries to fit"""
+        size = approximate_size(value) if size is None else size
+        if size > self._max_bytes:
+            return
+        
+        if key in self._entries:
+            self._remove(key)
+        
+        now = time.monotonic()
+        expires_at = now + (self._ttl if ttl is None else ttl)
+        self._entries[key] = CacheEntry(
+            value=value,
+            size=size,
+            expires_at=expires_at,
+            stale_until=expires_at + self._stale_ttl
+        )
+        self._total_bytes += size
+        self._evict()
+    
+    def invalidate(self, key: Hashable):
+        """Removes a single entry"""
+        if key in self._entries:
+            self._remove(key)
+    
+    def clear(self):
+        """Removes all entries"""
+        self._entries.clear()
+        self._total_bytes = 0
+    
+    def stats(self) -> dict:
+        """Returns cache counters"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.is_usable(time.monotonic())
+    
+    def _evict(self):
+        """Evicts least recently used entries until both bounds hold"""
+        while self._entries and (len(self._entries) > self._max_entries or self._total_bytes > self._max_bytes):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+    
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+
+
+def approximate_size(obj: Any) -> int:
+    """Approximates the deep memory footprint of an object graph in bytes
+    
+    Shared objects (interned strings, pooled value objects) are counted once.
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        
+        if isinstance(current, (str, bytes, int, float, bool)) or current is None:
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        else:
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    
+    return total
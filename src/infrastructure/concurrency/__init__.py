@@ -0,0 +1 @@
+# Concurrency primitives
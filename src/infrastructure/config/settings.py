@@ -3,12 +3,33 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
+def _env_int(name: str, default: int) -> int:
+    """Reads an integer environment variable"""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Reads a float environment variable"""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Reads a boolean environment variable"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 @dataclass
 class AmadeusConfig:
     """Amadeus API configuration"""
     api_base: str
     api_key: str
     api_secret: str
+    token_refresh_margin: float = 60.0
     
     @classmethod
     def from_env(cls) -> 'AmadeusConfig':
@@ -25,7 +46,298 @@ class AmadeusConfig:
         return cls(
             api_base=api_base,
             api_key=api_key,
-            api_secret=api_secret
+            api_secret=api_secret,
+            token_refresh_margin=_env_float('AMADEUS_TOKEN_REFRESH_MARGIN', cls.token_refresh_margin)
+        )
+
+
+@dataclass
+class HttpClientConfig:
+    """Shared HTTP connection pool configuration"""
+    timeout: float = 30.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    
+    @classmethod
+    def from_env(cls) -> 'HttpClientConfig':
+        """Create configuration from environment variables"""
+        return cls(
+            timeout=_env_float('AMADEUS_HTTP_TIMEOUT', cls.timeout),
+            max_connections=_env_int('AMADEUS_HTTP_MAX_CONNECTIONS', cls.max_connections),
+            max_keepalive_connections=_env_int('AMADEUS_HTTP_MAX_KEEPALIVE', cls.max_keepalive_connections),
+            keepalive_expiry=_env_float('AMADEUS_HTTP_KEEPALIVE_EXPIRY', cls.keepalive_expiry),
+            http2=_env_bool('AMADEUS_HTTP2', cls.http2)
+        )
+
+
+@dataclass
+class RateLimitConfig:
+    """Client-side rate limit for one Amadeus endpoint"""
+    rate: float = 10.0
+    burst: int = 1
+    max_concurrency: int = 8
+    min_concurrency: int = 1
+    
+    @classmethod
+    def from_env(cls, prefix: str, rate: float = 10.0, burst: int = 1, max_concurrency: int = 8) -> 'RateLimitConfig':
+        """Create configuration from `<prefix>_*` environment variables"""
+        return cls(
+            rate=_env_float(f'{prefix}_RATE_LIMIT', rate),
+            burst=_env_int(f'{prefix}_BURST', burst),
+            max_concurrency=_env_int(f'{prefix}_MAX_CONCURRENCY', max_concurrency),
+            min_concurrency=_env_int(f'{prefix}_MIN_CONCURRENCY', cls.min_concurrency)
+        )
+
+
+@dataclass
+class RateLimitsConfig:
+    """Per-endpoint rate limits (defaults follow the Amadeus self-service quotas)"""
+    flight_offers: RateLimitConfig
+    locations: RateLimitConfig
+    default: RateLimitConfig
+    max_throttle_retries: int = 3
+    
+    @classmethod
+    def from_env(cls) -> 'RateLimitsConfig':
+        """Create configuration from environment variables"""
+        return cls(
+            flight_offers=RateLimitConfig.from_env('AMADEUS_FLIGHTS', rate=10.0, burst=1, max_concurrency=8),
+            locations=RateLimitConfig.from_env('AMADEUS_LOCATIONS', rate=10.0, burst=5, max_concurrency=4),
+            default=RateLimitConfig.from_env('AMADEUS_DEFAULT', rate=10.0, burst=1, max_concurrency=4),
+            max_throttle_retries=_env_int('AMADEUS_MAX_THROTTLE_RETRIES', cls.max_throttle_retries)
+        )
+
+
+@dataclass
+class ResilienceConfig:
+    """Retry and circuit breaker configuration for Amadeus calls"""
+    max_retries: int = 2
+    retry_base_delay: float = 0.2
+    retry_max_delay: float = 2.0
+    breaker_failure_threshold: int = 5
+    breaker_recovery_timeout: float = 30.0
+    
+    @classmethod
+    def from_env(cls) -> 'ResilienceConfig':
+        """Create configuration from environment variables"""
+        return cls(
+            max_retries=_env_int('AMADEUS_MAX_RETRIES', cls.max_retries),
+            retry_base_delay=_env_float('AMADEUS_RETRY_BASE_DELAY', cls.retry_base_delay),
+            retry_max_delay=_env_float('AMADEUS_RETRY_MAX_DELAY', cls.retry_max_delay),
+            breaker_failure_threshold=_env_int('AMADEUS_BREAKER_FAILURE_THRESHOLD', cls.breaker_failure_threshold),
+            breaker_recovery_timeout=_env_float('AMADEUS_BREAKER_RECOVERY_TIMEOUT', cls.breaker_recovery_timeout)
+        )
+
+
+@dataclass
+class CacheConfig:
+    """Flight offer cache configuration"""
+    enabled: bool = True
+    ttl: float = 300.0
+    stale_ttl: float = 600.0
+    max_entries: int = 512
+    max_bytes: int = 64 * 1024 * 1024
+    
+    @classmethod
+    def from_env(cls) -> 'CacheConfig':
+        """Create configuration from environment variables"""
+        return cls(
+            enabled=_env_bool('FLIGHT_CACHE_ENABLED', cls.enabled),
+            ttl=_env_float('FLIGHT_CACHE_TTL', cls.ttl),
+            stale_ttl=_env_float('FLIGHT_CACHE_STALE_TTL', cls.stale_ttl),
+            max_entries=_env_int('FLIGHT_CACHE_MAX_ENTRIES', cls.max_entries),
+            max_bytes=_env_int('FLIGHT_CACHE_MAX_BYTES', cls.max_bytes)
+        )
+
+
+@dataclass
+class ResultStoreConfig:
+    """Server-side result set (pagination cursor) storage configuration"""
+    ttl: float = 1800.0
+    max_entries: int = 256
+    max_bytes: int = 32 * 1024 * 1024
+    
+    @classmethod
+    def from_env(cls) -> 'ResultStoreConfig':
+        """Create configuration from environment variables"""
+        return cls(
+            ttl=_env_float('RESULT_STORE_TTL', cls.ttl),
+            max_entries=_env_int('RESULT_STORE_MAX_ENTRIES', cls.max_entries),
+            max_bytes=_env_int('RESULT_STORE_MAX_BYTES', cls.max_bytes)
+        )
+
+
+@dataclass
+class PersistentCacheConfig:
+    """SQLite cache tier shared by server processes on the same machine"""
+    enabled: bool = False
+    path: Path | None = None
+    max_bytes: int = 256 * 1024 * 1024
+    flights_ttl: float = 300.0
+    locations_ttl: float = 86400.0
+    
+    def __post_init__(self):
+        if self.path is None:
+            cache_home = os.getenv('XDG_CACHE_HOME') or Path.home() / ".cache"
+            self.path = Path(cache_home) / "mcp-flight" / "cache.sqlite3"
+    
+    @classmethod
+    def from_env(cls) -> 'PersistentCacheConfig':
+        """Create configuration from environment variables"""
+        path = os.getenv('PERSISTENT_CACHE_PATH')
+        return cls(
+            enabled=_env_bool('PERSISTENT_CACHE_ENABLED', cls.enabled),
+            path=Path(path).expanduser() if path else None,
+            max_bytes=_env_int('PERSISTENT_CACHE_MAX_BYTES', cls.max_bytes),
+            flights_ttl=_env_float('PERSISTENT_CACHE_FLIGHTS_TTL', cls.flights_ttl),
+            locations_ttl=_env_float('PERSISTENT_CACHE_LOCATIONS_TTL', cls.locations_ttl)
+        )
+
+
+@dataclass
+class CityIndexConfig:
+    """Local city/airport index configuration"""
+    enabled: bool = True
+    dataset_path: Path = Path(__file__).parent.parent.parent.parent / "data" / "iata_cities.csv"
+    
+    @classmethod
+    def from_env(cls) -> 'CityIndexConfig':
+        """Create configuration from environment variables"""
+        dataset_path = os.getenv('CITY_INDEX_PATH')
+        return cls(
+            enabled=_env_bool('CITY_INDEX_ENABLED', cls.enabled),
+            dataset_path=Path(dataset_path) if dataset_path else cls.dataset_path
+        )
+
+
+@dataclass
+class PriceWatchConfig:
+    """Background price watch scheduler and history storage (opt-in: every server process runs its own scheduler)"""
+    enabled: bool = False
+    path: Path | None = None
+    default_interval: float = 3600.0
+    min_interval: float = 600.0
+    jitter: float = 0.1
+    budget_per_hour: float = 30.0
+    max_concurrency: int = 2
+    max_watches: int = 50
+    tracked_offers: int = 20
+    history_limit: int = 500
+    
+    def __post_init__(self):
+        if self.path is None:
+            data_home = os.getenv('XDG_DATA_HOME') or Path.home() / ".local" / "share"
+            self.path = Path(data_home) / "mcp-flight" / "watches.sqlite3"
+    
+    @classmethod
+    def from_env(cls) -> 'PriceWatchConfig':
+        """Create configuration from environment variables"""
+        path = os.getenv('PRICE_WATCH_PATH')
+        return cls(
+            enabled=_env_bool('PRICE_WATCH_ENABLED', cls.enabled),
+            path=Path(path).expanduser() if path else None,
+            default_interval=_env_float('PRICE_WATCH_INTERVAL', cls.default_interval),
+            min_interval=_env_float('PRICE_WATCH_MIN_INTERVAL', cls.min_interval),
+            jitter=_env_float('PRICE_WATCH_JITTER', cls.jitter),
+            budget_per_hour=_env_float('PRICE_WATCH_BUDGET_PER_HOUR', cls.budget_per_hour),
+            max_concurrency=_env_int('PRICE_WATCH_MAX_CONCURRENCY', cls.max_concurrency),
+            max_watches=_env_int('PRICE_WATCH_MAX_WATCHES', cls.max_watches),
+            tracked_offers=_env_int('PRICE_WATCH_TRACKED_OFFERS', cls.tracked_offers),
+            history_limit=_env_int('PRICE_WATCH_HISTORY_LIMIT', cls.history_limit)
+        )
+
+
+@dataclass
+class QueryLogConfig:
+    """Log of served searches, ranked by decayed popularity (opt-in: it persists every search)"""
+    enabled: bool = False
+    path: Path | None = None
+    half_life: float = 43200.0
+    max_entries: int = 1000
+    
+    def __post_init__(self):
+        if self.path is None:
+            data_home = os.getenv('XDG_DATA_HOME') or Path.home() / ".local" / "share"
+            self.path = Path(data_home) / "mcp-flight" / "query_log.sqlite3"
+    
+    @classmethod
+    def from_env(cls) -> 'QueryLogConfig':
+        """Create configuration from environment variables"""
+        path = os.getenv('QUERY_LOG_PATH')
+        return cls(
+            enabled=_env_bool('QUERY_LOG_ENABLED', cls.enabled),
+            path=Path(path).expanduser() if path else None,
+            half_life=_env_float('QUERY_LOG_HALF_LIFE', cls.half_life),
+            max_entries=_env_int('QUERY_LOG_MAX_ENTRIES', cls.max_entries)
+        )
+
+
+@dataclass
+class CacheWarmingConfig:
+    """Background prefetching of popular searches into the offer cache (opt-in: it spends API quota)"""
+    enabled: bool = False
+    interval: float = 60.0
+    idle_seconds: float = 5.0
+    max_routes: int = 20
+    
+    @classmethod
+    def from_env(cls) -> 'CacheWarmingConfig':
+        """Create configuration from environment variables"""
+        return cls(
+            enabled=_env_bool('CACHE_WARM_ENABLED', cls.enabled),
+            interval=_env_float('CACHE_WARM_INTERVAL', cls.interval),
+            idle_seconds=_env_float('CACHE_WARM_IDLE_SECONDS', cls.idle_seconds),
+            max_routes=_env_int('CACHE_WARM_MAX_ROUTES', cls.max_routes)
+        )
+
+
+@dataclass
+class ServerConfig:
+    """MCP transport configuration"""
+    transport: str = "stdio"
+    host: str = "127.0.0.1"
+    port: int = 8000
+    workers: int = 1
+    stateless_http: bool | None = None
+    warmup: bool = False
+    
+    def __post_init__(self):
+        # Sessions cannot follow a client across workers, so pooled workers are stateless
+        if self.stateless_http is None:
+            self.stateless_http = self.workers > 1
+    
+    @classmethod
+    def from_env(cls) -> 'ServerConfig':
+        """Create configuration from environment variables"""
+        stateless = os.getenv('MCP_STATELESS_HTTP')
+        return cls(
+            transport=os.getenv('MCP_TRANSPORT', cls.transport),
+            host=os.getenv('MCP_HOST', cls.host),
+            port=_env_int('MCP_PORT', cls.port),
+            workers=_env_int('MCP_WORKERS', cls.workers),
+            stateless_http=_env_bool('MCP_STATELESS_HTTP', False) if stateless else None,
+            warmup=_env_bool('MCP_FLIGHT_WARMUP', cls.warmup)
+        )
+
+
+@dataclass
+class ObservabilityConfig:
+    """Logging and metrics configuration"""
+    log_level: str = "ERROR"
+    metrics_enabled: bool = False
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int = 0
+    
+    @classmethod
+    def from_env(cls) -> 'ObservabilityConfig':
+        """Create configuration from environment variables"""
+        return cls(
+            log_level=os.getenv('LOG_LEVEL', cls.log_level).upper(),
+            metrics_enabled=_env_bool('METRICS_ENABLED', cls.metrics_enabled),
+            metrics_host=os.getenv('METRICS_HOST', cls.metrics_host),
+            metrics_port=_env_int('METRICS_PORT', cls.metrics_port)
         )
 
 
@@ -34,11 +346,61 @@ class AppConfig:
     """Application configuration"""
     templates_dir: Path = Path(__file__).parent.parent.parent / "presentation" / "templates"
     amadeus: AmadeusConfig | None = None
+    http: HttpClientConfig | None = None
+    rate_limits: RateLimitsConfig | None = None
+    resilience: ResilienceConfig | None = None
+    cache: CacheConfig | None = None
+    city_index: CityIndexConfig | None = None
+    result_store: ResultStoreConfig | None = None
+    persistent_cache: PersistentCacheConfig | None = None
+    price_watch: PriceWatchConfig | None = None
+    query_log: QueryLogConfig | None = None
+    cache_warming: CacheWarmingConfig | None = None
+    server: ServerConfig | None = None
+    observability: ObservabilityConfig | None = None
     
     def __post_init__(self):
         if self.amadeus is None:
             self.amadeus = AmadeusConfig.from_env()
+        if self.http is None:
+            self.http = HttpClientConfig.from_env()
+        if self.rate_limits is None:
+            self.rate_limits = RateLimitsConfig.from_env()
+        if self.resilience is None:
+            self.resilience = ResilienceConfig.from_env()
+        if self.cache is None:
+            self.cache = CacheConfig.from_env()
+        if self.city_index is None:
+            self.city_index = CityIndexConfig.from_env()
+        if self.result_store is None:
+            self.result_store = ResultStoreConfig.from_env()
+        if self.persistent_cache is None:
+            self.persistent_cache = PersistentCacheConfig.from_env()
+        if self.price_watch is None:
+            self.price_watch = PriceWatchConfig.from_env()
+        if self.query_log is None:
+            self.query_log = QueryLogConfig.from_env()
+        if self.cache_warming is None:
+            self.cache_warming = CacheWarmingConfig.from_env()
+        if self.server is None:
+            self.server = ServerConfig.from_env()
+        if self.observability is None:
+            self.observability = ObservabilityConfig.from_env()
+
+
+_config: AppConfig | None = None
+
+
+def get_config() -> AppConfig:
+    """Returns the application configuration, reading the environment on first use"""
+    global _config
+    if _config is None:
+        _config = AppConfig()
+    return _config
 
 
-# Global configuration instance
-config = AppConfig()
+def __getattr__(name: str):
+    # `config` is built on first access rather than at import time
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
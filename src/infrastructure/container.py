@@ -1,44 +1,399 @@
-"""Dependency container for dependency injection"""
+"""Dependency container for dependency injection
 
-from src.application.services.flight_application_service import FlightApplicationService
-from src.infrastructure.gateways.amadeus_flight_gateway import AmadeusFlightGateway
-from src.infrastructure.gateways.amadeus_city_gateway import AmadeusCityGateway
-from src.domain.services.flight_search_service import FlightSearchService
+Infrastructure and application modules are imported when a dependency is first
+built, so importing the container (and registering the MCP tools) stays cheap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import time
+from typing import TYPE_CHECKING
+from src.infrastructure.config.settings import get_config
+
+if TYPE_CHECKING:
+    from src.domain.gateways.flight_gateway import FlightGateway
+    from src.domain.gateways.city_gateway import CityGateway
+    from src.domain.gateways.result_store import ResultStore
+    from src.domain.gateways.metrics_recorder import MetricsRecorder
+    from src.domain.services.flight_search_service import FlightSearchService
+    from src.application.services.flight_application_service import FlightApplicationService
+    from src.application.services.city_application_service import CityApplicationService
+    from src.application.services.fare_calendar_service import FareCalendarApplicationService
+    from src.application.services.price_watch_service import PriceWatchApplicationService
+    from src.application.services.request_budget import RequestBudget
+    from src.infrastructure.reference.city_index import CityIndex
+    from src.infrastructure.reference.travel_guides import SeasonsGuide, DocumentsChecklist
+    from src.infrastructure.cache.sqlite_cache import SQLiteCache
+    from src.infrastructure.cache.query_log import SQLiteQueryLog
+    from src.infrastructure.cache.cache_warmer import CacheWarmer
+    from src.infrastructure.external.http_client import SharedHttpClient
+    from src.infrastructure.external.amadeus_auth import AmadeusAuthService
+    from src.infrastructure.external.amadeus_client import AmadeusClient
+    from src.infrastructure.watch.sqlite_watch_store import SQLiteWatchStore
+    from src.infrastructure.watch.scheduler import PriceWatchScheduler
+
+logger = logging.getLogger(__name__)
+
+# Modules behind the tools, imported off the event loop during warm-up
+WARMUP_MODULES = (
+    "src.application.services.flight_application_service",
+    "src.application.services.city_application_service",
+    "src.application.services.fare_calendar_service",
+    "src.infrastructure.gateways.amadeus_flight_gateway",
+    "src.infrastructure.gateways.amadeus_city_gateway",
+    "src.infrastructure.gateways.cached_flight_gateway",
+    "src.infrastructure.gateways.indexed_city_gateway",
+    "src.infrastructure.cache.result_store",
+    "src.infrastructure.reference.city_index"
+)
 
 
 class Container:
     """Dependency container using lazy initialization"""
     
     def __init__(self):
-        self._flight_gateway: AmadeusFlightGateway | None = None
-        self._city_gateway: AmadeusCityGateway | None = None
+        self._metrics: MetricsRecorder | None = None
+        self._http_client: SharedHttpClient | None = None
+        self._persistent_cache: SQLiteCache | None = None
+        self._auth_service: AmadeusAuthService | None = None
+        self._amadeus_client: AmadeusClient | None = None
+        self._flight_gateway: FlightGateway | None = None
+        self._live_flight_gateway: FlightGateway | None = None
+        self._city_index: CityIndex | None = None
+        self._city_gateway: CityGateway | None = None
+        self._seasons_guide: SeasonsGuide | None = None
+        self._documents_checklist: DocumentsChecklist | None = None
+        self._result_store: ResultStore | None = None
         self._flight_search_service: FlightSearchService | None = None
         self._flight_app_service: FlightApplicationService | None = None
+        self._city_app_service: CityApplicationService | None = None
+        self._fare_calendar_service: FareCalendarApplicationService | None = None
+        self._background_budget: RequestBudget | None = None
+        self._watch_store: SQLiteWatchStore | None = None
+        self._price_watch_service: PriceWatchApplicationService | None = None
+        self._price_watch_scheduler: PriceWatchScheduler | None = None
+        self._query_log: SQLiteQueryLog | None = None
+        self._cache_warmer: CacheWarmer | None = None
+    
+    @property
+    def metrics(self) -> MetricsRecorder:
+        if self._metrics is None:
+            if get_config().observability.metrics_enabled:
+                from src.infrastructure.metrics.registry import MetricsRegistry
+                self._metrics = MetricsRegistry()
+            else:
+                from src.domain.gateways.metrics_recorder import NullMetricsRecorder
+                self._metrics = NullMetricsRecorder()
+        return self._metrics
+    
+    @property
+    def http_client(self) -> SharedHttpClient:
+        if self._http_client is None:
+            from src.infrastructure.external.http_client import SharedHttpClient
+            self._http_client = SharedHttpClient()
+            self._collect("http_pool", self._http_client)
+        return self._http_client
+    
+    @property
+    def persistent_cache(self) -> SQLiteCache | None:
+        settings = get_config().persistent_cache
+        if self._persistent_cache is None and settings.enabled:
+            from src.infrastructure.cache.sqlite_cache import SQLiteCache
+            self._persistent_cache = SQLiteCache(settings.path, settings.max_bytes)
+            self._collect("persistent_cache", self._persistent_cache)
+        return self._persistent_cache
     
     @property
-    def flight_gateway(self) -> AmadeusFlightGateway:
+    def auth_service(self) -> AmadeusAuthService:
+        if self._auth_service is None:
+            from src.infrastructure.external.amadeus_auth import AmadeusAuthService
+            self._auth_service = AmadeusAuthService(self.http_client, persistent_cache=self.persistent_cache)
+            self._collect("auth", self._auth_service)
+        return self._auth_service
+    
+    @property
+    def amadeus_client(self) -> AmadeusClient:
+        if self._amadeus_client is None:
+            from src.infrastructure.external.amadeus_client import AmadeusClient
+            self._amadeus_client = AmadeusClient(self.http_client, self.auth_service, metrics=self.metrics)
+            self._collect("amadeus_client", self._amadeus_client)
+        return self._amadeus_client
+    
+    @property
+    def flight_gateway(self) -> FlightGateway:
         if self._flight_gateway is None:
-            self._flight_gateway = AmadeusFlightGateway()
+            from src.infrastructure.gateways.amadeus_flight_gateway import AmadeusFlightGateway
+            from src.infrastructure.gateways.cached_flight_gateway import CachedFlightGateway
+            from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+            
+            config = get_config()
+            gateway = AmadeusFlightGateway(
+                self.amadeus_client,
+                persistent_cache=self.persistent_cache,
+                persistent_ttl=config.persistent_cache.flights_ttl,
+                metrics=self.metrics
+            )
+            self._collect("flight_gateway", gateway)
+            if config.cache.enabled:
+                cache = TTLLRUCache(
+                    max_entries=config.cache.max_entries,
+                    max_bytes=config.cache.max_bytes,
+                    ttl=config.cache.ttl,
+                    stale_ttl=config.cache.stale_ttl
+                )
+                gateway = CachedFlightGateway(gateway, cache)
+                self._collect("flight_cache", gateway)
+            self._flight_gateway = gateway
         return self._flight_gateway
     
     @property
-    def city_gateway(self) -> AmadeusCityGateway:
+    def live_flight_gateway(self) -> FlightGateway:
+        """Flight gateway without the offer caches, so every search is one fresh API call"""
+        if self._live_flight_gateway is None:
+            from src.infrastructure.gateways.amadeus_flight_gateway import AmadeusFlightGateway
+            self._live_flight_gateway = AmadeusFlightGateway(self.amadeus_client, metrics=self.metrics)
+        return self._live_flight_gateway
+    
+    @property
+    def city_index(self) -> CityIndex:
+        if self._city_index is None:
+            from src.infrastructure.reference.city_index import CityIndex
+            self._city_index = CityIndex.from_csv(get_config().city_index.dataset_path)
+        return self._city_index
+    
+    @property
+    def seasons_guide(self) -> SeasonsGuide:
+        if self._seasons_guide is None:
+            from src.infrastructure.reference.travel_guides import SeasonsGuide
+            self._seasons_guide = SeasonsGuide()
+            self._collect("seasons_guide", self._seasons_guide)
+        return self._seasons_guide
+    
+    @property
+    def documents_checklist(self) -> DocumentsChecklist:
+        if self._documents_checklist is None:
+            from src.infrastructure.reference.travel_guides import DocumentsChecklist
+            self._documents_checklist = DocumentsChecklist()
+            self._collect("documents_checklist", self._documents_checklist)
+        return self._documents_checklist
+    
+    @property
+    def city_gateway(self) -> CityGateway:
         if self._city_gateway is None:
-            self._city_gateway = AmadeusCityGateway()
+            from src.infrastructure.gateways.amadeus_city_gateway import AmadeusCityGateway
+            from src.infrastructure.gateways.indexed_city_gateway import IndexedCityGateway
+            
+            config = get_config()
+            gateway = AmadeusCityGateway(
+                self.amadeus_client,
+                persistent_cache=self.persistent_cache,
+                persistent_ttl=config.persistent_cache.locations_ttl,
+                metrics=self.metrics
+            )
+            self._collect("city_gateway", gateway)
+            if config.city_index.enabled:
+                gateway = IndexedCityGateway(self.city_index, gateway)
+                self._collect("city_index", gateway)
+            self._city_gateway = gateway
         return self._city_gateway
     
+    @property
+    def result_store(self) -> ResultStore:
+        if self._result_store is None:
+            from src.infrastructure.cache.result_store import InMemoryResultStore, SharedResultStore
+            from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+            
+            config = get_config()
+            cache = TTLLRUCache(
+                max_entries=config.result_store.max_entries,
+                max_bytes=config.result_store.max_bytes,
+                ttl=config.result_store.ttl
+            )
+            store = InMemoryResultStore(cache)
+            if self.persistent_cache is not None:
+                store = SharedResultStore(store, self.persistent_cache, config.result_store.ttl)
+            self._result_store = store
+            self._collect("result_store", store)
+        return self._result_store
+    
     @property
     def flight_search_service(self) -> FlightSearchService:
         if self._flight_search_service is None:
-            self._flight_search_service = FlightSearchService(self.flight_gateway)
+            from src.domain.services.flight_search_service import FlightSearchService
+            self._flight_search_service = FlightSearchService(self.flight_gateway, metrics=self.metrics)
         return self._flight_search_service
     
     @property
     def flight_app_service(self) -> FlightApplicationService:
         if self._flight_app_service is None:
-            self._flight_app_service = FlightApplicationService(self.flight_search_service)
+            from src.application.services.flight_application_service import FlightApplicationService
+            self._flight_app_service = FlightApplicationService(self.flight_search_service, self.result_store, self.query_log)
         return self._flight_app_service
     
+    @property
+    def city_app_service(self) -> CityApplicationService:
+        if self._city_app_service is None:
+            from src.application.services.city_application_service import CityApplicationService
+            self._city_app_service = CityApplicationService(self.city_gateway)
+        return self._city_app_service
+    
+    @property
+    def fare_calendar_service(self) -> FareCalendarApplicationService:
+        if self._fare_calendar_service is None:
+            from src.application.services.fare_calendar_service import FareCalendarApplicationService
+            self._fare_calendar_service = FareCalendarApplicationService(self.flight_search_service)
+        return self._fare_calendar_service
+    
+    @property
+    def query_log(self) -> SQLiteQueryLog | None:
+        if self._query_log is None and get_config().query_log.enabled:
+            from src.infrastructure.cache.query_log import SQLiteQueryLog
+            config = get_config().query_log
+            self._query_log = SQLiteQueryLog(config.path, config.half_life, config.max_entries)
+            self._collect("query_log", self._query_log)
+        return self._query_log
+    
+    @property
+    def cache_warmer(self) -> CacheWarmer | None:
+        """Prefetcher of popular searches; None unless the query log and offer cache are enabled"""
+        config = get_config()
+        if self._cache_warmer is None and config.cache_warming.enabled and config.cache.enabled and self.query_log is not None:
+            from src.infrastructure.cache.cache_warmer import CacheWarmer
+            warming = config.cache_warming
+            self._cache_warmer = CacheWarmer(
+                self.query_log,
+                lambda: self.flight_gateway,
+                self.background_budget,
+                interval=warming.interval,
+                idle_seconds=warming.idle_seconds,
+                max_routes=warming.max_routes
+            )
+            self._collect("cache_warmer", self._cache_warmer)
+        return self._cache_warmer
+    
+    @property
+    def background_budget(self) -> RequestBudget:
+        """Share of the API quota available to background jobs (price watches and cache warming)"""
+        if self._background_budget is None:
+            from src.application.services.request_budget import RequestBudget
+            config = get_config()
+            # Every worker runs its own background jobs, so the hourly cap is split between them
+            self._background_budget = RequestBudget(config.price_watch.budget_per_hour / config.server.workers)
+            self._collect("background_budget", self._background_budget)
+        return self._background_budget
+    
+    @property
+    def watch_store(self) -> SQLiteWatchStore:
+        if self._watch_store is None:
+            from src.infrastructure.watch.sqlite_watch_store import SQLiteWatchStore
+            config = get_config().price_watch
+            self._watch_store = SQLiteWatchStore(config.path, config.history_limit)
+            self._collect("watch_store", self._watch_store)
+        return self._watch_store
+    
+    @property
+    def price_watch_service(self) -> PriceWatchApplicationService:
+        if self._price_watch_service is None:
+            from src.application.services.price_watch_service import PriceWatchApplicationService
+            from src.domain.services.flight_search_service import FlightSearchService
+            config = get_config().price_watch
+            # Checks must see current prices and each one must be counted by the budget,
+            # so they bypass the offer caches and their background refreshes
+            self._price_watch_service = PriceWatchApplicationService(
+                FlightSearchService(self.live_flight_gateway, metrics=self.metrics),
+                self.watch_store,
+                self.background_budget,
+                default_interval=config.default_interval,
+                min_interval=config.min_interval,
+                jitter=config.jitter,
+                tracked_offers=config.tracked_offers,
+                max_watches=config.max_watches,
+                max_concurrency=config.max_concurrency
+            )
+            self._collect("price_watch", self._price_watch_service)
+        return self._price_watch_service
+    
+    @property
+    def price_watch_scheduler(self) -> PriceWatchScheduler:
+        if self._price_watch_scheduler is None:
+            from src.infrastructure.watch.scheduler import PriceWatchScheduler
+            self._price_watch_scheduler = PriceWatchScheduler(self.watch_store, lambda: self.price_watch_service)
+            self._collect("price_watch_scheduler", self._price_watch_scheduler)
+        return self._price_watch_scheduler
+    
+    def _collect(self, name: str, component):
+        """Reports the component's stats() as gauges when metrics are enabled"""
+        register = getattr(self.metrics, "register_collector", None)
+        if register is not None:
+            register(name, component.stats)
+    
+    async def warm_up(self):
+        """Prepares dependencies in the background so the first tool call is fast
+        
+        Heavy imports and the city index and travel guide loads run in a worker
+        thread; the service graph is then built on the event loop, the HTTP pool
+        opened and the OAuth token fetched. Failures are logged and left to the first real request.
+        """
+        started = time.perf_counter()
+        config = get_config()
+        try:
+            guides = (self.seasons_guide, self.documents_checklist)
+            city_index = await asyncio.to_thread(self._load_in_background, config.city_index.enabled, guides)
+            if city_index is not None and self._city_index is None:
+                self._city_index = city_index
+            
+            self.flight_app_service
+            self.city_app_service
+            self.fare_calendar_service
+            self.http_client.client
+            await self.auth_service.get_access_token()
+        except Exception as e:
+            logger.warning("Warm-up incomplete after %.3fs: %s", time.perf_counter() - started, str(e))
+            return
+        logger.info("Warm-up finished in %.3fs", time.perf_counter() - started)
+    
+    def _load_in_background(self, load_city_index: bool, guides: tuple = ()) -> CityIndex | None:
+        """Imports the service modules and optional NumPy, and reads the travel guides and city index"""
+        for module in WARMUP_MODULES:
+            importlib.import_module(module)
+        
+        from src.domain.services.ranking import load_numpy
+        load_numpy()
+        
+        for guide in guides:
+            try:
+                guide.regions()
+            except OSError as e:
+                logger.warning("Could not load %s: %s", guide.path.name, str(e))
+        
+        if not load_city_index or self._city_index is not None:
+            return None
+        from src.infrastructure.reference.city_index import CityIndex
+        return CityIndex.from_csv(get_config().city_index.dataset_path)
+    
+    async def aclose(self):
+        """Releases resources owned by the container"""
+        if self._price_watch_scheduler is not None:
+            await self._price_watch_scheduler.aclose()
+        if self._cache_warmer is not None:
+            await self._cache_warmer.aclose()
+        elif self._query_log is not None:
+            await self._query_log.flush()
+        if self._flight_gateway is not None:
+            from src.infrastructure.gateways.cached_flight_gateway import CachedFlightGateway
+            if isinstance(self._flight_gateway, CachedFlightGateway):
+                await self._flight_gateway.aclose()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+        if self._watch_store is not None:
+            self._watch_store.close()
+        if self._query_log is not None:
+            self._query_log.close()
 
 
 # Global container instance
@@ -1,6 +1,11 @@
+import asyncio
+import hashlib
 import httpx
 import logging
-from src.infrastructure.config.settings import config
+import time
+from src.infrastructure.cache.sqlite_cache import SQLiteCache
+from src.infrastructure.config.settings import get_config
+from src.infrastructure.external.http_client import SharedHttpClient
 from src.domain.exceptions.flight_exceptions import (
     FlightApiException,
     FlightServiceUnavailableException,
@@ -9,50 +14,158 @@ from src.domain.exceptions.flight_exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Lifetime assumed when the token response does not carry expires_in
+DEFAULT_TOKEN_LIFETIME = 1799.0
+
+PERSISTENT_NAMESPACE = "oauth-token"
+
 
 class AmadeusAuthService:
-    """Amadeus authentication service"""
+    """Amadeus authentication service
+    
+    Process-wide OAuth token manager: tokens are refreshed proactively before
+    `expires_in` elapses, and concurrent refreshes are coalesced into a single
+    request behind a lock. With a persistent cache, a token fetched by another
+    server process is reused until it nears expiry.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: SharedHttpClient,
+        refresh_margin: float | None = None,
+        persistent_cache: SQLiteCache | None = None
+    ):
+        self._http_client = http_client
+        self._config = get_config()
+        self._refresh_margin = self._config.amadeus.token_refresh_margin if refresh_margin is None else refresh_margin
+        self._persistent_cache = persistent_cache
+        self._persistent_key = hashlib.sha256(f"{self._config.amadeus.api_base}|{self._config.amadeus.api_key}".encode()).hexdigest()
+        self._rejected_token: str | None = None
         self._access_token: str | None = None
+        self._expires_at: float = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_count = 0
+        self._refresh_failures = 0
+        self._shared_reuses = 0
+        self._last_refresh_latency: float | None = None
+        self._total_refresh_latency = 0.0
+        self._max_refresh_latency = 0.0
     
     async def get_access_token(self) -> str:
         """Gets valid access token"""
-        if self._access_token is None:
-            self._access_token = await self._fetch_new_token()
-        return self._access_token
+        if self._is_token_valid():
+            return self._access_token
+        
+        async with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not self._is_token_valid():
+                await self._refresh_token()
+            return self._access_token
+    
+    def invalidate_token(self, token: str | None = None):
+        """Invalidates current token
+        
+        When `token` is given, only that token is invalidated, so a late 401 for
+        an already replaced token does not discard the fresh one.
+        """
+        if token is None or token == self._access_token:
+            # Keep a shared copy of this token from being loaded again
+            self._rejected_token = self._access_token
+            self._access_token = None
+            self._expires_at = 0.0
+    
+    def stats(self) -> dict:
+        """Returns token refresh statistics"""
+        return {
+            "has_token": self._access_token is not None,
+            "expires_in": max(0.0, self._expires_at - time.monotonic()) if self._access_token else 0.0,
+            "refresh_count": self._refresh_count,
+            "refresh_failures": self._refresh_failures,
+            "shared_token_reuses": self._shared_reuses,
+            "last_refresh_latency": self._last_refresh_latency,
+            "avg_refresh_latency": self._total_refresh_latency / self._refresh_count if self._refresh_count else None,
+            "max_refresh_latency": self._max_refresh_latency
+        }
     
-    async def _fetch_new_token(self) -> str:
+    def _is_token_valid(self) -> bool:
+        """Checks if the cached token is outside the refresh margin"""
+        return self._access_token is not None and time.monotonic() < self._expires_at - self._refresh_margin
+    
+    async def _refresh_token(self):
+        """Fetches a new token and records refresh metrics"""
+        if await self._load_shared_token():
+            return
+        
+        started = time.perf_counter()
+        try:
+            token, expires_in = await self._fetch_new_token()
+        except Exception:
+            self._refresh_failures += 1
+            raise
+        
+        latency = time.perf_counter() - started
+        self._refresh_count += 1
+        self._last_refresh_latency = latency
+        self._total_refresh_latency += latency
+        self._max_refresh_latency = max(self._max_refresh_latency, latency)
+        
+        self._access_token = token
+        self._expires_at = time.monotonic() + expires_in
+        logger.debug("Amadeus token refreshed in %.3fs, expires in %ss", latency, expires_in)
+        
+        if self._persistent_cache is not None:
+            await self._persistent_cache.put(
+                PERSISTENT_NAMESPACE,
+                self._persistent_key,
+                {"access_token": token, "expires_at": time.time() + expires_in},
+                expires_in
+            )
+    
+    async def _load_shared_token(self) -> bool:
+        """Adopts a still valid token stored by another process"""
+        if self._persistent_cache is None:
+            return False
+        
+        shared = await self._persistent_cache.get(PERSISTENT_NAMESPACE, self._persistent_key)
+        if not shared or shared["access_token"] == self._rejected_token:
+            return False
+        
+        remaining = shared["expires_at"] - time.time()
+        if remaining <= self._refresh_margin:
+            return False
+        
+        self._access_token = shared["access_token"]
+        self._expires_at = time.monotonic() + remaining
+        self._shared_reuses += 1
+        logger.debug("Reusing shared Amadeus token, expires in %.0fs", remaining)
+        return True
+    
+    async def _fetch_new_token(self) -> tuple[str, float]:
         """Fetches new token from API"""
-        url = f"{config.amadeus.api_base}/v1/security/oauth2/token"
+        url = f"{self._config.amadeus.api_base}/v1/security/oauth2/token"
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         data = {
             "grant_type": "client_credentials",
-            "client_id": config.amadeus.api_key,
-            "client_secret": config.amadeus.api_secret,
+            "client_id": self._config.amadeus.api_key,
+            "client_secret": self._config.amadeus.api_secret,
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(url, headers=headers, data=data)
-                response.raise_for_status()
-                token_data = response.json()
-                return token_data["access_token"]
-                
-            except httpx.HTTPStatusError as e:
-                logger.error("HTTP error in Amadeus authentication: %s - %s", e.response.status_code, str(e))
+        try:
+            response = await self._http_client.client.post(url, headers=headers, data=data)
+            response.raise_for_status()
+            token_data = response.json()
+            return token_data["access_token"], float(token_data.get("expires_in", DEFAULT_TOKEN_LIFETIME))
+            
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error in Amadeus authentication: %s - %s", e.response.status_code, str(e))
+            
+            if e.response.status_code == 400:
+                raise InvalidSearchParametersException("Invalid API credentials") from e
+            elif e.response.status_code >= 500:
+                raise FlightServiceUnavailableException("Authentication service temporarily unavailable") from e
+            else:
+                raise FlightApiException(f"Authentication error (HTTP {e.response.status_code})", e.response.status_code) from e
                 
-                if e.response.status_code == 400:
-                    raise InvalidSearchParametersException("Invalid API credentials") from e
-                elif e.response.status_code >= 500:
-                    raise FlightServiceUnavailableException("Authentication service temporarily unavailable") from e
-                else:
-                    raise FlightApiException(f"Authentication error (HTTP {e.response.status_code})", e.response.status_code) from e
-                    
-            except (httpx.RequestError, ConnectionError) as e:
-                logger.error("Connectivity error in authentication: %s", str(e))
-                raise FlightServiceUnavailableException("Connectivity error in authentication. Please try again.") from e
-    
-    def invalidate_token(self):
-        """Invalidates current token"""
-        self._access_token = None
+        except (httpx.RequestError, ConnectionError) as e:
+            logger.error("Connectivity error in authentication: %s", str(e))
+            raise FlightServiceUnavailableException("Connectivity error in authentication. Please try again.") from e
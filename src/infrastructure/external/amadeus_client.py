@@ -1,8 +1,19 @@
+import asyncio
 import httpx
 import logging
-from typing import Dict, Any
+import time
+from typing import Any, AsyncIterator, Dict
 from src.infrastructure.external.amadeus_auth import AmadeusAuthService
-from src.infrastructure.config.settings import config
+from src.infrastructure.external.http_client import SharedHttpClient
+from src.infrastructure.external.json_stream import JsonArrayStream
+from src.infrastructure.external.rate_limiter import (
+    EndpointRateLimiter,
+    RateLimiterRegistry,
+    parse_retry_after
+)
+from src.infrastructure.external.resilience import CircuitBreaker, RetryPolicy
+from src.infrastructure.config.settings import get_config
+from src.domain.gateways.metrics_recorder import MetricsRecorder, NullMetricsRecorder
 from src.domain.exceptions.flight_exceptions import (
     FlightApiException, 
     FlightServiceUnavailableException,
@@ -11,43 +22,201 @@ from src.domain.exceptions.flight_exceptions import (
 
 logger = logging.getLogger(__name__)
 
+FLIGHT_OFFERS_PREFIX = "/v2/shopping/flight-offers"
+LOCATIONS_PREFIX = "/v1/reference-data/locations"
+
 
 class AmadeusClient:
     """Client for Amadeus API"""
     
-    def __init__(self):
-        self._auth_service = AmadeusAuthService()
+    def __init__(
+        self,
+        http_client: SharedHttpClient,
+        auth_service: AmadeusAuthService,
+        rate_limiters: RateLimiterRegistry | None = None,
+        metrics: MetricsRecorder | None = None
+    ):
+        self._http_client = http_client
+        self._auth_service = auth_service
+        self._metrics = metrics or NullMetricsRecorder()
+        self._config = get_config()
+        self._rate_limiters = rate_limiters or RateLimiterRegistry(
+            {
+                FLIGHT_OFFERS_PREFIX: self._config.rate_limits.flight_offers,
+                LOCATIONS_PREFIX: self._config.rate_limits.locations
+            },
+            default=self._config.rate_limits.default
+        )
+        self._retry_policy = RetryPolicy(
+            max_retries=self._config.resilience.max_retries,
+            base_delay=self._config.resilience.retry_base_delay,
+            max_delay=self._config.resilience.retry_max_delay
+        )
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self.retries = 0
     
     async def get(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Makes GET request to Amadeus API"""
-        url = f"{config.amadeus.api_base}{endpoint}"
-        access_token = await self._auth_service.get_access_token()
-        headers = {"Authorization": f"Bearer {access_token}"}
+        limiter = self._rate_limiters.for_endpoint(endpoint)
+        response = await self._request(limiter, endpoint, params)
+        with self._metrics.timer("json_decode", endpoint=limiter.name):
+            return response.json()
+    
+    async def stream_array(self, endpoint: str, params: Dict[str, Any] = None, field: str = "data") -> AsyncIterator[Dict[str, Any]]:
+        """Makes GET request to Amadeus API, yielding the items of the body's `field` array
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(url, headers=headers, params=params or {})
-                
-                if response.status_code == 401:
-                    # Token expired, try to renew
-                    self._auth_service.invalidate_token()
-                    access_token = await self._auth_service.get_access_token()
-                    headers = {"Authorization": f"Bearer {access_token}"}
-                    response = await client.get(url, headers=headers, params=params or {})
-                
-                response.raise_for_status()
-                return response.json()
-                
-            except httpx.HTTPStatusError as e:
-                logger.error("HTTP error in Amadeus API: %s - %s", e.response.status_code, str(e))
+        The body is decoded as it is received, so only the current network chunk
+        and item are held rather than the whole decoded response. Close the
+        iterator (e.g. with `contextlib.aclosing`) when stopping early.
+        """
+        limiter = self._rate_limiters.for_endpoint(endpoint)
+        response = await self._request(limiter, endpoint, params, stream=True)
+        decoder = JsonArrayStream(field)
+        received = 0
+        try:
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                for item in decoder.feed(chunk):
+                    yield item
+            for item in decoder.close():
+                yield item
+        except httpx.RequestError as e:
+            logger.error("Connectivity error while reading response: %s", str(e))
+            raise FlightServiceUnavailableException("Connectivity error. Please try again.") from e
+        except ValueError as e:
+            logger.error("Malformed response from %s: %s", limiter.name, str(e))
+            raise FlightApiException("Invalid response from the Amadeus API", response.status_code) from e
+        finally:
+            await response.aclose()
+            self._metrics.observe("upstream_payload_bytes", received, endpoint=limiter.name)
+    
+    async def _request(self, limiter: EndpointRateLimiter, endpoint: str, params: Dict[str, Any] | None, stream: bool = False) -> httpx.Response:
+        """Sends a GET through the circuit breaker, mapping HTTP errors to domain exceptions
+        
+        A streamed response is returned unread when successful; the caller closes it.
+        """
+        url = f"{self._config.amadeus.api_base}{endpoint}"
+        breaker = self._breaker_for(limiter.name)
+        
+        if not breaker.allow_request():
+            logger.warning("Circuit open for %s, failing fast", limiter.name)
+            raise FlightServiceUnavailableException("Service temporarily unavailable. Please try again later.")
+        
+        try:
+            with self._metrics.timer("upstream_total", endpoint=limiter.name):
+                response = await self._send_with_retries(limiter, url, params or {}, stream)
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            
+            response.raise_for_status()
+            return response
+            
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error in Amadeus API: %s - %s", e.response.status_code, str(e))
+            
+            if e.response.status_code == 400:
+                raise InvalidSearchParametersException(f"Invalid parameters: {e.response.text}") from e
+            elif e.response.status_code >= 500:
+                raise FlightServiceUnavailableException("Service temporarily unavailable") from e
+            elif e.response.status_code == 429:
+                raise FlightApiException("API rate limit exceeded. Please try again later.", 429) from e
+            else:
+                raise FlightApiException(f"API error (HTTP {e.response.status_code})", e.response.status_code) from e
                 
-                if e.response.status_code == 400:
-                    raise InvalidSearchParametersException(f"Invalid parameters: {e.response.text}") from e
-                elif e.response.status_code >= 500:
-                    raise FlightServiceUnavailableException("Service temporarily unavailable") from e
-                else:
-                    raise FlightApiException(f"API error (HTTP {e.response.status_code})", e.response.status_code) from e
-                    
+        except (httpx.RequestError, ConnectionError) as e:
+            breaker.record_failure()
+            logger.error("Connectivity error: %s", str(e))
+            raise FlightServiceUnavailableException("Connectivity error. Please try again.") from e
+    
+    def stats(self) -> dict:
+        """Returns rate limiter, retry and circuit breaker statistics per endpoint"""
+        return {
+            "rate_limits": self._rate_limiters.stats(),
+            "circuit_breakers": {name: breaker.stats() for name, breaker in self._breakers.items()},
+            "retries": self.retries
+        }
+    
+    def _breaker_for(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=self._config.resilience.breaker_failure_threshold,
+                recovery_timeout=self._config.resilience.breaker_recovery_timeout
+            )
+            self._breakers[name] = breaker
+        return breaker
+    
+    async def _send_with_retries(self, limiter: EndpointRateLimiter, url: str, params: Dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Retries transient failures of idempotent GETs with jittered backoff"""
+        attempt = 0
+        while True:
+            try:
+                response = await self._send_rate_limited(limiter, url, params, stream)
+                if response.status_code < 500 or attempt >= self._retry_policy.max_retries:
+                    return response
+                logger.warning("Amadeus returned %s on %s, retrying", response.status_code, limiter.name)
             except (httpx.RequestError, ConnectionError) as e:
-                logger.error("Connectivity error: %s", str(e))
-                raise FlightServiceUnavailableException("Connectivity error. Please try again.") from e
+                if attempt >= self._retry_policy.max_retries:
+                    raise
+                logger.warning("Connectivity error on %s, retrying: %s", limiter.name, str(e))
+            
+            await asyncio.sleep(self._retry_policy.backoff(attempt))
+            attempt += 1
+            self.retries += 1
+    
+    async def _send_rate_limited(self, limiter: EndpointRateLimiter, url: str, params: Dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Sends the request through the endpoint limiter, waiting out 429 responses"""
+        attempt = 0
+        while True:
+            queued_at = time.perf_counter()
+            async with limiter.slot():
+                self._metrics.observe("rate_limit_wait_seconds", time.perf_counter() - queued_at, endpoint=limiter.name)
+                with self._metrics.timer("upstream_request", endpoint=limiter.name):
+                    response = await self._send(url, params, stream)
+            self._metrics.increment("upstream_responses_total", endpoint=limiter.name, status=str(response.status_code))
+            if not stream or not response.is_success:
+                # Streamed bodies are measured as they are read
+                self._metrics.observe("upstream_payload_bytes", len(response.content), endpoint=limiter.name)
+            
+            if response.status_code == 429 and attempt < self._config.rate_limits.max_throttle_retries:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                logger.warning("Amadeus rate limit hit on %s, retrying in %.2fs", limiter.name, retry_after)
+                limiter.on_throttled(retry_after)
+                attempt += 1
+                continue
+            
+            if response.status_code == 429:
+                limiter.on_throttled(parse_retry_after(response.headers.get("Retry-After")))
+            elif response.status_code >= 500:
+                limiter.on_overload()
+            else:
+                limiter.on_success()
+            return response
+    
+    async def _send(self, url: str, params: Dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Sends an authenticated GET, renewing the token once on 401
+        
+        With `stream`, a successful response is returned before its body is read.
+        """
+        client = self._http_client.client
+        with self._metrics.timer("token"):
+            access_token = await self._auth_service.get_access_token()
+        headers = {"Authorization": f"Bearer {access_token}"}
+        response = await client.send(client.build_request("GET", url, headers=headers, params=params), stream=stream)
+        
+        if response.status_code == 401:
+            # Token rejected, try to renew
+            await response.aclose()
+            self._auth_service.invalidate_token(access_token)
+            with self._metrics.timer("token"):
+                access_token = await self._auth_service.get_access_token()
+            headers = {"Authorization": f"Bearer {access_token}"}
+            response = await client.send(client.build_request("GET", url, headers=headers, params=params), stream=stream)
+        
+        if stream and not response.is_success:
+            # Error bodies are small and needed by the retry and error handling
+            await response.aread()
+        return response
@@ -0,0 +1,68 @@
+import httpx
+import logging
+from src.infrastructure.config.settings import get_config, HttpClientConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SharedHttpClient:
+    """Long-lived, connection-pooled HTTP client shared by the Amadeus services"""
+    
+    def __init__(self, http_config: HttpClientConfig | None = None):
+        self._config = http_config or get_config().http
+        self._client: httpx.AsyncClient | None = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Returns the pooled client, opening it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+    
+    @property
+    def is_open(self) -> bool:
+        """Checks if the underlying pool is open"""
+        return self._client is not None and not self._client.is_closed
+    
+    def stats(self) -> dict:
+        """Returns connection pool occupancy (empty until the pool is opened)"""
+        if not self.is_open:
+            return {"open": False}
+        # httpx does not expose its pool; read the httpcore pool when it is there
+        pool = getattr(self._client._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        return {
+            "open": True,
+            "connections": len(connections),
+            "idle": sum(1 for connection in connections if connection.is_idle()),
+            "max_connections": self._config.max_connections
+        }
+    
+    async def aclose(self):
+        """Closes the pool and all keep-alive connections"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        """Creates the pooled client from configuration"""
+        limits = httpx.Limits(
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry
+        )
+        return httpx.AsyncClient(
+            timeout=self._config.timeout,
+            limits=limits,
+            http2=self._config.http2 and self._http2_available()
+        )
+    
+    @staticmethod
+    def _http2_available() -> bool:
+        """Checks if the optional HTTP/2 dependency is installed"""
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, falling back to HTTP/1.1")
+            return False
+        return True
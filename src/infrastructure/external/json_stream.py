@@ -0,0 +1,155 @@
+import codecs
+import json
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+# Characters that may continue a number cut by a chunk boundary ("7." or "1e")
+_NUMBER_TAIL = "0123456789.eE+-"
+
+# Parser states
+_START = 0
+_MEMBER = 1
+_ARRAY = 2
+_DONE = 3
+
+
+class JsonArrayStream:
+    """Incrementally decodes one array member of a top-level JSON object
+    
+    Bytes are fed as they arrive and each element of the `field` array is
+    returned as soon as it is complete, so the whole array is never held
+    decoded at once. Other members of the object are decoded whole and kept in
+    `members`. Each element is parsed by the C decoder; an element cut by a
+    chunk boundary is retried once the buffer has doubled, which keeps the
+    work linear even for a value spanning many chunks.
+    """
+    
+    def __init__(self, field: str = "data"):
+        self._field = field
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = _START
+        self._closed = False
+        self._retry_at = 0
+        self.members: dict[str, Any] = {}
+        self.items = 0
+    
+    def feed(self, chunk: bytes) -> list:
+        """Adds bytes and returns the array elements completed by them"""
+        self._buffer += self._utf8.decode(chunk)
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._drain()
+    
+    def close(self) -> list:
+        """Signals the end of the body, returning the last elements
+        
+        Raises ValueError if the body is truncated or not a JSON object.
+        """
+        self._buffer += self._utf8.decode(b"", final=True)
+        self._closed = True
+        items = self._drain()
+        if self._state != _DONE or self._buffer.strip(_WHITESPACE):
+            raise ValueError("Truncated or malformed JSON body")
+        return items
+    
+    def _drain(self) -> list:
+        items = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = self._skip_whitespace(buffer, pos)
+            if pos >= len(buffer) or self._state == _DONE:
+                break
+            char = buffer[pos]
+            
+            if self._state == _START:
+                if char != "{":
+                    raise ValueError("Expected a JSON object")
+                self._state = _MEMBER
+                pos += 1
+            elif self._state == _MEMBER:
+                if char == ",":
+                    pos += 1
+                elif char == "}":
+                    self._state = _DONE
+                    pos += 1
+                else:
+                    member = self._decode_member(buffer, pos)
+                    if member is None:
+                        break
+                    pos = member
+            else:
+                if char == ",":
+                    pos += 1
+                elif char == "]":
+                    self._state = _MEMBER
+                    pos += 1
+                else:
+                    decoded = self._decode(buffer, pos)
+                    if decoded is None:
+                        break
+                    value, pos = decoded
+                    items.append(value)
+                    self.items += 1
+        
+        self._buffer = buffer[pos:]
+        self._retry_at = 2 * len(self._buffer)
+        return items
+    
+    def _decode_member(self, buffer: str, pos: int) -> int | None:
+        """Consumes `"key": value` (or the array opener of `field`); None if incomplete"""
+        decoded = self._decode(buffer, pos)
+        if decoded is None:
+            return None
+        key, end = decoded
+        end = self._skip_whitespace(buffer, end)
+        if end >= len(buffer):
+            return None
+        if buffer[end] != ":" or not isinstance(key, str):
+            raise ValueError("Expected an object member")
+        
+        end = self._skip_whitespace(buffer, end + 1)
+        if end >= len(buffer):
+            return None
+        if key == self._field and buffer[end] == "[":
+            self._state = _ARRAY
+            return end + 1
+        
+        decoded = self._decode(buffer, end)
+        if decoded is None:
+            return None
+        self.members[key], end = decoded
+        return end
+    
+    def _decode(self, buffer: str, pos: int) -> tuple[Any, int] | None:
+        """Decodes the value at `pos`, or returns None until more bytes arrive"""
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if self._closed:
+                raise
+            return None
+        # A number at the end of the buffer may continue in the next chunk
+        if not self._closed and self._may_continue(buffer, value, end):
+            return None
+        return value, end
+    
+    @staticmethod
+    def _may_continue(buffer: str, value: Any, end: int) -> bool:
+        """Whether the decoded value could still grow with more input"""
+        if end >= len(buffer):
+            return True
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        # raw_decode stops before a dangling fraction or exponent: wait unless it is followed by more
+        while end < len(buffer) and buffer[end] in _NUMBER_TAIL:
+            end += 1
+        return end >= len(buffer)
+    
+    @staticmethod
+    def _skip_whitespace(buffer: str, pos: int) -> int:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
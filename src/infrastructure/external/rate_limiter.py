@@ -0,0 +1,194 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import AsyncIterator
+from src.infrastructure.config.settings import RateLimitConfig
+
+
+class TokenBucket:
+    """Token bucket that queues callers in FIFO order until a token is available"""
+    
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Waits for a token; the lock keeps waiters in arrival order"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                
+                wait = self._blocked_until - now
+                if wait <= 0 and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                if wait <= 0:
+                    wait = (1 - self._tokens) / self._rate
+                await asyncio.sleep(wait)
+    
+    def block_for(self, seconds: float):
+        """Pauses all acquisitions, e.g. for a Retry-After period"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+    
+    def _refill(self, now: float):
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency cap adjusted with AIMD, queueing excess callers fairly
+    
+    The limit grows by roughly one slot per window of successful calls and is
+    multiplied by `decrease_factor` when the upstream signals overload.
+    """
+    
+    def __init__(self, initial: int, minimum: int, maximum: int, decrease_factor: float = 0.5):
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._limit = float(min(max(initial, self._minimum), self._maximum))
+        self._decrease_factor = decrease_factor
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+    
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+    
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+    
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+    
+    async def acquire(self):
+        """Takes a slot, waiting in FIFO order if the limit is reached"""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before cancellation; pass it on
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+    
+    def release(self):
+        """Frees a slot and hands it to the next waiter"""
+        self._in_flight -= 1
+        self._wake_waiters()
+    
+    def on_success(self):
+        """Additive increase"""
+        self._limit = min(self._maximum, self._limit + 1 / max(self._limit, 1))
+        self._wake_waiters()
+    
+    def on_overload(self):
+        """Multiplicative decrease"""
+        self._limit = max(self._minimum, self._limit * self._decrease_factor)
+    
+    def _wake_waiters(self):
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+class EndpointRateLimiter:
+    """Token bucket plus adaptive concurrency cap for one Amadeus endpoint"""
+    
+    def __init__(self, name: str, limit_config: RateLimitConfig):
+        self.name = name
+        self._bucket = TokenBucket(limit_config.rate, limit_config.burst)
+        self._concurrency = AdaptiveConcurrencyLimiter(
+            initial=limit_config.max_concurrency,
+            minimum=limit_config.min_concurrency,
+            maximum=limit_config.max_concurrency
+        )
+        self.throttled = 0
+        self.overloads = 0
+    
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Holds a concurrency slot and a rate token for one request"""
+        await self._concurrency.acquire()
+        try:
+            await self._bucket.acquire()
+            yield
+        finally:
+            self._concurrency.release()
+    
+    def on_success(self):
+        self._concurrency.on_success()
+    
+    def on_overload(self):
+        """Records a 5xx response"""
+        self.overloads += 1
+        self._concurrency.on_overload()
+    
+    def on_throttled(self, retry_after: float):
+        """Records a 429 response and pauses the endpoint for `retry_after` seconds"""
+        self.throttled += 1
+        self._concurrency.on_overload()
+        self._bucket.block_for(retry_after)
+    
+    def stats(self) -> dict:
+        return {
+            "concurrency_limit": self._concurrency.limit,
+            "in_flight": self._concurrency.in_flight,
+            "queued": self._concurrency.queued,
+            "throttled": self.throttled,
+            "overloads": self.overloads
+        }
+
+
+class RateLimiterRegistry:
+    """Selects the rate limiter for an endpoint by path prefix"""
+    
+    def __init__(self, limits: dict[str, RateLimitConfig], default: RateLimitConfig):
+        self._limiters = [(prefix, EndpointRateLimiter(prefix, limit)) for prefix, limit in limits.items()]
+        self._default = EndpointRateLimiter("default", default)
+    
+    def for_endpoint(self, endpoint: str) -> EndpointRateLimiter:
+        for prefix, limiter in self._limiters:
+            if endpoint.startswith(prefix):
+                return limiter
+        return self._default
+    
+    def stats(self) -> dict:
+        limiters = [limiter for _, limiter in self._limiters] + [self._default]
+        return {limiter.name: limiter.stats() for limiter in limiters}
+
+
+def parse_retry_after(value: str | None, default: float = 1.0) -> float:
+    """Parses a Retry-After header given in seconds or as an HTTP date"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,84 @@
+import random
+import time
+from dataclasses import dataclass
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry policy with exponential backoff and full jitter"""
+    max_retries: int = 2
+    base_delay: float = 0.2
+    max_delay: float = 2.0
+    
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Circuit breaker that fails fast while the upstream is down
+    
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    are rejected. Once `recovery_timeout` has elapsed a single probe is let
+    through (half-open): success closes the circuit, failure re-opens it.
+    """
+    
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._recovery_timeout = recovery_timeout
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: float | None = None
+        self.rejected = 0
+        self.times_opened = 0
+    
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self._recovery_timeout:
+            return HALF_OPEN
+        return self._state
+    
+    def allow_request(self) -> bool:
+        """Checks if a call may proceed, reserving the probe when half-open"""
+        state = self.state
+        if state == CLOSED:
+            return True
+        
+        now = time.monotonic()
+        # A probe that never reported back (e.g. cancelled) is considered lost
+        probe_lost = self._probe_started_at is not None and now - self._probe_started_at >= self._recovery_timeout
+        if state == HALF_OPEN and (self._probe_started_at is None or probe_lost):
+            self._state = HALF_OPEN
+            self._probe_started_at = now
+            return True
+        
+        self.rejected += 1
+        return False
+    
+    def record_success(self):
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._probe_started_at = None
+    
+    def record_failure(self):
+        self._consecutive_failures += 1
+        if self._state == HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+            if self._state != OPEN:
+                self.times_opened += 1
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._probe_started_at = None
+    
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
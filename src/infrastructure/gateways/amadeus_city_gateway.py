@@ -1,20 +1,65 @@
+import logging
+from typing import List
+from src.domain.entities.city import City, Airport
 from src.domain.gateways.city_gateway import CityGateway
+from src.domain.vo.coordinates import Coordinates
 from src.domain.vo.search_params import CitySearchParams
+from src.domain.gateways.metrics_recorder import MetricsRecorder, NullMetricsRecorder
+from src.infrastructure.cache.sqlite_cache import SQLiteCache
 from src.infrastructure.external.amadeus_client import AmadeusClient
+from src.infrastructure.concurrency.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+PERSISTENT_NAMESPACE = "locations"
 
 
 class AmadeusCityGateway(CityGateway):
     """City gateway implementation using Amadeus API"""
     
-    def __init__(self):
-        self._client = AmadeusClient()
+    def __init__(
+        self,
+        client: AmadeusClient,
+        persistent_cache: SQLiteCache | None = None,
+        persistent_ttl: float = 86400.0,
+        metrics: MetricsRecorder | None = None
+    ):
+        self._client = client
+        self._single_flight = SingleFlight()
+        self._persistent_cache = persistent_cache
+        self._persistent_ttl = persistent_ttl
+        self._metrics = metrics or NullMetricsRecorder()
+    
+    async def search_cities(self, params: CitySearchParams) -> List[City]:
+        """Searches cities in Amadeus API
+        
+        Concurrent identical searches share a single upstream request.
+        """
+        cities = await self._single_flight.do(params, lambda: self._fetch_cities(params))
+        return list(cities)
+    
+    def stats(self) -> dict:
+        """Returns request coalescing statistics"""
+        return {"coalescing": self._single_flight.stats()}
     
-    async def search_cities(self, params: CitySearchParams) -> dict:
-        """Searches cities in Amadeus API"""
+    async def _fetch_cities(self, params: CitySearchParams) -> List[City]:
+        """Fetches and maps cities from the persistent cache or the API"""
         api_params = self._build_api_params(params)
+        key = "&".join(f"{name}={value}" for name, value in sorted(api_params.items()))
+        if self._persistent_cache is not None:
+            with self._metrics.timer("persistent_cache_get", namespace=PERSISTENT_NAMESPACE):
+                response = await self._persistent_cache.get(PERSISTENT_NAMESPACE, key)
+            if response is not None:
+                with self._metrics.timer("map_response", gateway="cities"):
+                    return self._map_response_to_entities(response)
+        
         response = await self._client.get("/v1/reference-data/locations/cities", api_params)
         
-        return response
+        if self._persistent_cache is not None:
+            await self._persistent_cache.put(PERSISTENT_NAMESPACE, key, response, self._persistent_ttl)
+        with self._metrics.timer("map_response", gateway="cities"):
+            return self._map_response_to_entities(response)
     
     def _build_api_params(self, params: CitySearchParams) -> dict:
         """Builds parameters for API"""
@@ -28,3 +73,48 @@ class AmadeusCityGateway(CityGateway):
             api_params["include"] = params.include
         
         return api_params
+    
+    def _map_response_to_entities(self, response: dict) -> List[City]:
+        """Maps API response to entities"""
+        included_airports = response.get("included", {}).get("airports", {})
+        cities = []
+        
+        for city_data in response.get("data", []):
+            address = city_data.get("address", {})
+            name = city_data.get("name", "")
+            
+            airports = []
+            for relationship in city_data.get("relationships", []):
+                airport_data = included_airports.get(relationship.get("id"))
+                if relationship.get("type") != "Airport" or airport_data is None:
+                    continue
+                airports.append(Airport(
+                    iata_code=airport_data.get("iataCode", relationship["id"]),
+                    name=airport_data.get("name", ""),
+                    city_name=name,
+                    country_code=airport_data.get("address", {}).get("countryCode", address.get("countryCode", "")),
+                    coordinates=self._map_coordinates(airport_data.get("geoCode"))
+                ))
+            
+            cities.append(City(
+                name=name,
+                iata_code=city_data.get("iataCode", ""),
+                country_code=address.get("countryCode", ""),
+                country_name=address.get("countryName", ""),
+                state_code=address.get("stateCode"),
+                coordinates=self._map_coordinates(city_data.get("geoCode")),
+                airports=airports
+            ))
+        
+        return cities
+    
+    @staticmethod
+    def _map_coordinates(geo_code: dict | None) -> Coordinates | None:
+        """Maps an Amadeus geoCode to coordinates, ignoring invalid values"""
+        if not geo_code:
+            return None
+        try:
+            return Coordinates(float(geo_code["latitude"]), float(geo_code["longitude"]))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Ignoring invalid geoCode %s: %s", geo_code, str(e))
+            return None
@@ -1,24 +1,95 @@
-from typing import List
-from datetime import datetime
-from src.domain.entities.flight import FlightOffer, FlightSegment
+from contextlib import aclosing
+from typing import AsyncIterator, List
+from src.domain.entities.flight import FlightOffer
 from src.domain.gateways.flight_gateway import FlightGateway
 from src.domain.vo.search_params import FlightSearchParams
-from src.domain.vo.location_code import LocationCode
+from src.domain.gateways.metrics_recorder import MetricsRecorder, NullMetricsRecorder
+from src.infrastructure.cache.sqlite_cache import SQLiteCache
 from src.infrastructure.external.amadeus_client import AmadeusClient
+from src.infrastructure.concurrency.single_flight import SingleFlight
+from src.infrastructure.gateways.flight_offer_mapper import FlightOfferMapper
+
+
+PERSISTENT_NAMESPACE = "flight-offers"
+FLIGHT_OFFERS_ENDPOINT = "/v2/shopping/flight-offers"
 
 
 class AmadeusFlightGateway(FlightGateway):
-    """Flight gateway implementation using Amadeus API"""
+    """Flight gateway implementation using Amadeus API
     
-    def __init__(self):
-        self._client = AmadeusClient()
+    Responses are decoded and mapped offer by offer as they are received, so
+    the whole decoded body is never held next to the entities. With a
+    persistent cache, raw responses are instead kept whole to be shared with
+    other server processes and re-mapped locally on a hit.
+    """
+    
+    def __init__(
+        self,
+        client: AmadeusClient,
+        persistent_cache: SQLiteCache | None = None,
+        persistent_ttl: float = 300.0,
+        metrics: MetricsRecorder | None = None
+    ):
+        self._client = client
+        self._single_flight = SingleFlight()
+        self._mapper = FlightOfferMapper()
+        self._persistent_cache = persistent_cache
+        self._persistent_ttl = persistent_ttl
+        self._metrics = metrics or NullMetricsRecorder()
     
     async def search_flights(self, params: FlightSearchParams) -> List[FlightOffer]:
-        """Searches flight offers in Amadeus API"""
+        """Searches flight offers in Amadeus API
+        
+        Concurrent identical searches share a single upstream request.
+        """
+        offers = await self._single_flight.do(params.cache_key(), lambda: self._fetch_flights(params))
+        return list(offers)
+    
+    async def iter_flights(self, params: FlightSearchParams) -> AsyncIterator[FlightOffer]:
+        """Yields flight offers as they are decoded from the response
+        
+        Streamed searches are not coalesced with concurrent identical searches.
+        """
+        if self._persistent_cache is not None:
+            for flight in await self.search_flights(params):
+                yield flight
+            return
+        
+        async with aclosing(self._stream_flights(params)) as flights:
+            async for flight in flights:
+                yield flight
+    
+    def stats(self) -> dict:
+        """Returns request coalescing statistics"""
+        return {"coalescing": self._single_flight.stats()}
+    
+    async def _fetch_flights(self, params: FlightSearchParams) -> List[FlightOffer]:
+        """Fetches and maps flight offers from the persistent cache or the API"""
+        if self._persistent_cache is None:
+            with self._metrics.timer("stream_response", gateway="flights"):
+                async with aclosing(self._stream_flights(params)) as flights:
+                    return [flight async for flight in flights]
+        
+        key = params.cache_key()
+        with self._metrics.timer("persistent_cache_get", namespace=PERSISTENT_NAMESPACE):
+            response = await self._persistent_cache.get(PERSISTENT_NAMESPACE, key)
+        if response is not None:
+            with self._metrics.timer("map_response", gateway="flights"):
+                return self._map_response_to_entities(response)
+        
         api_params = self._build_api_params(params)
-        response = await self._client.get("/v2/shopping/flight-offers", api_params)
+        response = await self._client.get(FLIGHT_OFFERS_ENDPOINT, api_params)
         
-        return self._map_response_to_entities(response)
+        await self._persistent_cache.put(PERSISTENT_NAMESPACE, key, response, self._persistent_ttl)
+        with self._metrics.timer("map_response", gateway="flights"):
+            return self._map_response_to_entities(response)
+    
+    async def _stream_flights(self, params: FlightSearchParams) -> AsyncIterator[FlightOffer]:
+        """Maps offers one by one while the response body is still being received"""
+        items = self._client.stream_array(FLIGHT_OFFERS_ENDPOINT, self._build_api_params(params))
+        async with aclosing(items):
+            async for flight in self._mapper.map_offer_stream(items):
+                yield flight
     
     def _build_api_params(self, params: FlightSearchParams) -> dict:
         """Builds parameters for API"""
@@ -55,43 +126,4 @@ class AmadeusFlightGateway(FlightGateway):
     
     def _map_response_to_entities(self, response: dict) -> List[FlightOffer]:
         """Maps API response to entities"""
-        offers = []
-        
-        for offer_data in response.get("data", []):
-            segments = []
-            
-            for itinerary in offer_data.get("itineraries", []):
-                for segment_data in itinerary.get("segments", []):
-                    segment = FlightSegment(
-                        departure=LocationCode(segment_data["departure"]["iataCode"]),
-                        arrival=LocationCode(segment_data["arrival"]["iataCode"]),
-                        departure_time=datetime.fromisoformat(
-                            segment_data["departure"]["at"].replace("Z", "+00:00")
-                        ),
-                        arrival_time=datetime.fromisoformat(
-                            segment_data["arrival"]["at"].replace("Z", "+00:00")
-                        ),
-                        carrier_code=segment_data["carrierCode"],
-                        flight_number=segment_data["number"],
-                        aircraft=segment_data.get("aircraft", {}).get("code"),
-                        duration=segment_data.get("duration")
-                    )
-                    segments.append(segment)
-            
-            price_data = offer_data["price"]
-            offer = FlightOffer(
-                id=offer_data["id"],
-                segments=segments,
-                price=float(price_data["total"]),
-                currency=price_data["currency"],
-                seats_available=offer_data.get("numberOfBookableSeats", 0),
-                travel_class=offer_data.get("travelerPricings", [{}])[0].get("fareDetailsBySegment", [{}])[0].get("class", ""),
-                validating_airline_codes=offer_data.get("validatingAirlineCodes", []),
-                instant_ticketing_required=offer_data.get("instantTicketingRequired", False),
-                non_homogeneous=offer_data.get("nonHomogeneous", False),
-                one_way=offer_data.get("oneWay", False),
-                last_ticketing_date=offer_data.get("lastTicketingDate")
-            )
-            offers.append(offer)
-        
-        return offers
+        return self._mapper.map_response(response)
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, List
+from src.domain.entities.flight import FlightOffer
+from src.domain.gateways.flight_gateway import FlightGateway
+from src.domain.vo.search_params import FlightSearchParams
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedFlightGateway(FlightGateway):
+    """Flight gateway decorator that caches offers with stale-while-revalidate"""
+    
+    def __init__(self, gateway: FlightGateway, cache: TTLLRUCache):
+        self._gateway = gateway
+        self._cache = cache
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self.background_refreshes = 0
+        self.prefetches = 0
+    
+    async def search_flights(self, params: FlightSearchParams) -> List[FlightOffer]:
+        """Searches flight offers, serving cached results when available"""
+        key = params.cache_key()
+        entry = self._cache.get(key)
+        
+        if entry is None:
+            return list(await self._load(key, params))
+        
+        if not entry.is_fresh():
+            self._schedule_refresh(key, params)
+        return list(entry.value)
+    
+    async def iter_flights(self, params: FlightSearchParams) -> AsyncIterator[FlightOffer]:
+        """Yields cached offers, or streams them from the wrapped gateway on a miss
+        
+        A streamed response is cached once it has been read to the end; a
+        search abandoned part way leaves the cache untouched.
+        """
+        key = params.cache_key()
+        entry = self._cache.get(key)
+        if entry is not None:
+            if not entry.is_fresh():
+                self._schedule_refresh(key, params)
+            for flight in entry.value:
+                yield flight
+            return
+        
+        offers = []
+        async with aclosing(self._gateway.iter_flights(params)) as flights:
+            async for flight in flights:
+                offers.append(flight)
+                yield flight
+        self._cache.put(key, offers)
+    
+    def is_cached(self, params: FlightSearchParams, min_fresh: float = 0.0) -> bool:
+        """Whether the search is cached and stays fresh for at least `min_fresh` seconds
+        
+        Does not count as a cache lookup, so probing leaves the hit ratio alone.
+        """
+        key = params.cache_key()
+        if key in self._refreshing:
+            return True
+        entry = self._cache.peek(key)
+        return entry is not None and entry.expires_at - time.monotonic() > min_fresh
+    
+    async def prefetch(self, params: FlightSearchParams):
+        """Loads a search into the cache ahead of demand"""
+        self.prefetches += 1
+        await self._load(params.cache_key(), params)
+    
+    def stats(self) -> dict:
+        """Returns cache statistics"""
+        return {
+            **self._cache.stats(),
+            "background_refreshes": self.background_refreshes,
+            "prefetches": self.prefetches,
+            "refreshing": len(self._refreshing)
+        }
+    
+    async def aclose(self):
+        """Cancels pending background refreshes"""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refreshing.clear()
+    
+    async def _load(self, key: str, params: FlightSearchParams) -> List[FlightOffer]:
+        """Fetches offers from the wrapped gateway and stores them"""
+        offers = await self._gateway.search_flights(params)
+        self._cache.put(key, offers)
+        return offers
+    
+    def _schedule_refresh(self, key: str, params: FlightSearchParams):
+        """Refreshes a stale entry in the background, once per key"""
+        if key in self._refreshing:
+            return
+        
+        task = asyncio.create_task(self._refresh(key, params))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+    
+    async def _refresh(self, key: str, params: FlightSearchParams):
+        self.background_refreshes += 1
+        try:
+            await self._load(key, params)
+        except Exception as e:
+            # Keep serving the stale entry; the next miss surfaces the error
+            logger.warning("Background refresh failed for %s: %s", key, str(e))
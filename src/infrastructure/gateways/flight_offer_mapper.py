@@ -0,0 +1,105 @@
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import AsyncIterable, AsyncIterator, Iterable, List
+from src.domain.entities.flight import FlightOffer, FlightSegment
+from src.domain.vo.location_code import LocationCode
+
+_EMPTY: dict = {}
+
+
+@lru_cache(maxsize=8192)
+def parse_timestamp(value: str) -> datetime:
+    """Parses an Amadeus ISO timestamp; repeated values are parsed once"""
+    return datetime.fromisoformat(value)
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value else value
+
+
+class FlightOfferMapper:
+    """Maps Amadeus flight-offers payloads to domain entities
+    
+    Airports are resolved through interned `LocationCode` instances and
+    timestamps through a parse cache, so repeated values across segments and
+    offers are validated and parsed once. Repeated strings are interned, and
+    identical segments within a response (the same flight combined into many
+    offers) share a single immutable instance to keep cached offers compact.
+    """
+    
+    def map_response(self, response: dict) -> List[FlightOffer]:
+        """Maps a full response body"""
+        return self.map_offers(response.get("data", ()))
+    
+    def map_offers(self, offers_data: Iterable[dict]) -> List[FlightOffer]:
+        """Maps a sequence of raw offers sharing one segment pool"""
+        map_offer = self.map_offer
+        segment_pool: dict[tuple, FlightSegment] = {}
+        return [map_offer(offer_data, segment_pool) for offer_data in offers_data]
+    
+    async def map_offer_stream(self, offers_data: AsyncIterable[dict]) -> AsyncIterator[FlightOffer]:
+        """Maps raw offers as they arrive, sharing one segment pool"""
+        map_offer = self.map_offer
+        segment_pool: dict[tuple, FlightSegment] = {}
+        async for offer_data in offers_data:
+            yield map_offer(offer_data, segment_pool)
+    
+    def map_offer(self, offer_data: dict, segment_pool: dict[tuple, FlightSegment] | None = None) -> FlightOffer:
+        """Maps a single raw offer, reusing segments already in `segment_pool`"""
+        if segment_pool is None:
+            segment_pool = {}
+        map_segment = self._map_segment
+        segments = [
+            map_segment(segment_data, segment_pool)
+            for itinerary in offer_data.get("itineraries", ())
+            for segment_data in itinerary.get("segments", ())
+        ]
+        
+        price_data = offer_data["price"]
+        return FlightOffer(
+            id=offer_data["id"],
+            segments=segments,
+            price=float(price_data["total"]),
+            currency=_intern(price_data["currency"]),
+            seats_available=offer_data.get("numberOfBookableSeats", 0),
+            travel_class=_intern(self._travel_class(offer_data)),
+            validating_airline_codes=[sys.intern(code) for code in offer_data.get("validatingAirlineCodes", ())],
+            instant_ticketing_required=offer_data.get("instantTicketingRequired", False),
+            non_homogeneous=offer_data.get("nonHomogeneous", False),
+            one_way=offer_data.get("oneWay", False),
+            last_ticketing_date=offer_data.get("lastTicketingDate")
+        )
+    
+    @staticmethod
+    def _map_segment(segment_data: dict, segment_pool: dict[tuple, FlightSegment]) -> FlightSegment:
+        departure = segment_data["departure"]
+        arrival = segment_data["arrival"]
+        aircraft = segment_data.get("aircraft", _EMPTY).get("code")
+        duration = segment_data.get("duration")
+        key = (
+            departure["iataCode"], departure["at"], arrival["iataCode"], arrival["at"],
+            segment_data["carrierCode"], segment_data["number"], aircraft, duration
+        )
+        
+        segment = segment_pool.get(key)
+        if segment is None:
+            segment = FlightSegment(
+                departure=LocationCode.of(departure["iataCode"]),
+                arrival=LocationCode.of(arrival["iataCode"]),
+                departure_time=parse_timestamp(departure["at"]),
+                arrival_time=parse_timestamp(arrival["at"]),
+                carrier_code=sys.intern(segment_data["carrierCode"]),
+                flight_number=sys.intern(segment_data["number"]),
+                aircraft=_intern(aircraft),
+                duration=_intern(duration)
+            )
+            segment_pool[key] = segment
+        return segment
+    
+    @staticmethod
+    def _travel_class(offer_data: dict) -> str:
+        """Fare class of the first segment of the first traveler"""
+        traveler_pricings = offer_data.get("travelerPricings") or (_EMPTY,)
+        fare_details = traveler_pricings[0].get("fareDetailsBySegment") or (_EMPTY,)
+        return fare_details[0].get("class", "")
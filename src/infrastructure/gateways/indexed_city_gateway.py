@@ -0,0 +1,69 @@
+import logging
+from typing import List
+from src.domain.entities.city import City
+from src.domain.exceptions.flight_exceptions import FlightDomainException
+from src.domain.gateways.city_gateway import CityGateway
+from src.domain.vo.search_params import CitySearchParams
+from src.infrastructure.reference.city_index import CityIndex
+
+logger = logging.getLogger(__name__)
+
+
+class IndexedCityGateway(CityGateway):
+    """City gateway that answers from the local index and falls back on a miss
+    
+    The bundled dataset only covers major cities, so a lookup counts as a hit
+    only when it is exact (the keyword is a city or airport IATA code, or a
+    city's full name) or fills a whole page of results. Partial prefix results are completed by the fallback, and
+    fuzzy matches are only used when the fallback finds nothing or fails.
+    """
+    
+    def __init__(self, index: CityIndex, fallback: CityGateway):
+        self._index = index
+        self._fallback = fallback
+        self.local_hits = 0
+        self.fallbacks = 0
+        self.local_on_error = 0
+    
+    async def search_cities(self, params: CitySearchParams) -> List[City]:
+        """Searches cities locally, querying the fallback gateway only on a miss"""
+        lookup = self._index.lookup(
+            keyword=params.keyword,
+            country_code=params.country_code,
+            max_results=params.max_results,
+            include_airports=(params.include or "").upper() == "AIRPORTS"
+        )
+        complete = lookup.exact or (params.max_results and len(lookup.cities) >= params.max_results)
+        if lookup.cities and not lookup.fuzzy and complete:
+            self.local_hits += 1
+            return lookup.cities
+        
+        self.fallbacks += 1
+        try:
+            remote = await self._fallback.search_cities(params)
+        except FlightDomainException as e:
+            if not lookup.cities:
+                raise
+            logger.warning("City lookup fallback failed, answering from the local index: %s", str(e))
+            self.local_on_error += 1
+            return lookup.cities
+        
+        if lookup.fuzzy:
+            return remote or lookup.cities
+        return self._merge(lookup.cities, remote, params.max_results)
+    
+    def stats(self) -> dict:
+        """Returns local hit and fallback counters"""
+        return {
+            "indexed_cities": len(self._index),
+            "local_hits": self.local_hits,
+            "fallbacks": self.fallbacks,
+            "local_on_error": self.local_on_error
+        }
+    
+    @staticmethod
+    def _merge(local: List[City], remote: List[City], max_results: int | None) -> List[City]:
+        """Local code and prefix matches first, then remote cities not already listed"""
+        seen = {city.iata_code for city in local}
+        merged = local + [city for city in remote if city.iata_code not in seen]
+        return merged[:max_results] if max_results else merged
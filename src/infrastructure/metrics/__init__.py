@@ -0,0 +1 @@
+# Metrics registry and exporters
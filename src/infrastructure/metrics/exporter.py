@@ -0,0 +1,38 @@
+import asyncio
+import logging
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def start_prometheus_exporter(registry: MetricsRegistry, host: str, port: int) -> asyncio.Server:
+    """Serves `GET /metrics` on a dedicated port, for transports without an HTTP app (stdio)"""
+    
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            # Drain the headers; the request has no body
+            while (await asyncio.wait_for(reader.readline(), timeout=5.0)).strip():
+                pass
+            
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, content_type, body = "200 OK", PROMETHEUS_CONTENT_TYPE, registry.render_prometheus().encode()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", b"Not Found\n"
+            
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError, ValueError) as e:
+            logger.debug("Metrics scrape aborted: %s", str(e))
+        finally:
+            writer.close()
+    
+    server = await asyncio.start_server(handle, host, port)
+    logger.info("Prometheus metrics on http://%s:%s/metrics", host, port)
+    return server
@@ -0,0 +1,206 @@
+import logging
+import math
+import re
+import time
+from bisect import bisect_left
+from typing import Callable
+from src.domain.gateways.metrics_recorder import MetricsRecorder
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds, in seconds, of the stage latency buckets
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Upper bounds of histograms whose name ends in "_bytes"
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+METRIC_PREFIX = "mcp_flight"
+QUANTILES = (0.5, 0.95, 0.99)
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]+")
+
+LabelSet = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """Fixed-bucket histogram; quantiles are interpolated within a bucket"""
+    
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+    
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+    
+    def quantile(self, q: float) -> float:
+        """Estimates the q-quantile, capped at the largest observed value"""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(estimate, self.max)
+            seen += bucket_count
+        return self.max
+    
+    def summary(self) -> dict:
+        summary = {"count": self.count, "sum": round(self.sum, 6), "max": round(self.max, 6)}
+        if self.count:
+            summary["mean"] = round(self.sum / self.count, 6)
+            for q in QUANTILES:
+                summary[f"p{round(q * 100)}"] = round(self.quantile(q), 6)
+        return summary
+
+
+class _StageTimer:
+    """Times a block and records it in the stage latency histogram"""
+    
+    __slots__ = ("_histogram", "_started")
+    
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+    
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._histogram.observe(time.perf_counter() - self._started)
+        return False
+
+
+class MetricsRegistry(MetricsRecorder):
+    """In-process metrics: stage latency histograms, sample histograms, counters
+    and gauges collected from components' `stats()` at read time
+    
+    Recording is meant for the event loop thread and takes no locks.
+    """
+    
+    def __init__(self):
+        self._histograms: dict[tuple[str, LabelSet], Histogram] = {}
+        self._counters: dict[tuple[str, LabelSet], float] = {}
+        self._collectors: dict[str, Callable[[], dict]] = {}
+        self.started_at = time.time()
+    
+    def timer(self, stage: str, **labels: str) -> _StageTimer:
+        return _StageTimer(self._histogram("stage_seconds", (("stage", stage), *sorted(labels.items()))))
+    
+    def observe(self, name: str, value: float, **labels: str):
+        self._histogram(name, tuple(sorted(labels.items()))).observe(value)
+    
+    def increment(self, name: str, amount: float = 1, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        self._counters[key] = self._counters.get(key, 0) + amount
+    
+    def register_collector(self, name: str, collect: Callable[[], dict]):
+        """Reports the dict returned by `collect` (usually a component's stats) as gauges"""
+        self._collectors[name] = collect
+    
+    def snapshot(self) -> dict:
+        """Returns every metric as plain JSON-serializable data"""
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "stages": {
+                self._format_key(labels): histogram.summary()
+                for (name, labels), histogram in sorted(self._histograms.items())
+                if name == "stage_seconds"
+            },
+            "histograms": {
+                f"{name}{{{self._format_key(labels)}}}" if labels else name: histogram.summary()
+                for (name, labels), histogram in sorted(self._histograms.items())
+                if name != "stage_seconds"
+            },
+            "counters": {
+                f"{name}{{{self._format_key(labels)}}}" if labels else name: value
+                for (name, labels), value in sorted(self._counters.items())
+            },
+            "components": self._collect()
+        }
+    
+    def render_prometheus(self) -> str:
+        """Renders every metric in the Prometheus text exposition format"""
+        lines = []
+        typed = set()
+        for (name, labels), histogram in sorted(self._histograms.items()):
+            metric = f"{METRIC_PREFIX}_{name}"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, bucket_count in zip((*histogram.bounds, math.inf), histogram.counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == math.inf else repr(float(bound))
+                lines.append(f"{metric}_bucket{self._prometheus_labels((*labels, ('le', le)))} {cumulative}")
+            lines.append(f"{metric}_sum{self._prometheus_labels(labels)} {histogram.sum!r}")
+            lines.append(f"{metric}_count{self._prometheus_labels(labels)} {histogram.count}")
+        
+        for (name, labels), value in sorted(self._counters.items()):
+            metric = f"{METRIC_PREFIX}_{name}"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{self._prometheus_labels(labels)} {value!r}")
+        
+        for component, stats in self._collect().items():
+            component = _INVALID_NAME_CHARS.sub("_", component).strip("_")
+            for path, value in self._flatten(stats):
+                metric = f"{METRIC_PREFIX}_{component}_{path}"
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric} {float(value)!r}")
+        
+        lines.append("")
+        return "\n".join(lines)
+    
+    def _histogram(self, name: str, labels: LabelSet) -> Histogram:
+        key = (name, labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = Histogram(SIZE_BUCKETS if name.endswith("_bytes") else LATENCY_BUCKETS)
+            self._histograms[key] = histogram
+        return histogram
+    
+    def _collect(self) -> dict:
+        components = {}
+        for name, collect in self._collectors.items():
+            try:
+                components[name] = collect()
+            except Exception as e:
+                # A broken collector must not hide the other metrics
+                logger.warning("Metrics collector %s failed: %s", name, str(e))
+        return components
+    
+    @classmethod
+    def _flatten(cls, stats: dict, prefix: str = ""):
+        """Yields (metric name suffix, value) for every numeric leaf of a stats dict"""
+        for key, value in stats.items():
+            path = _INVALID_NAME_CHARS.sub("_", f"{prefix}_{key}" if prefix else str(key)).strip("_")
+            if isinstance(value, dict):
+                yield from cls._flatten(value, path)
+            elif isinstance(value, (int, float)):
+                yield path, value
+    
+    @staticmethod
+    def _format_key(labels: LabelSet) -> str:
+        return ",".join(f"{name}={value}" for name, value in labels)
+    
+    @staticmethod
+    def _prometheus_labels(labels: LabelSet) -> str:
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
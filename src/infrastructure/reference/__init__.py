@@ -0,0 +1 @@
+# Local reference data indexes
@@ -0,0 +1,157 @@
+import csv
+import difflib
+import logging
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Iterable, List
+from src.domain.entities.city import City, Airport
+from src.domain.vo.coordinates import Coordinates
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATASET = Path(__file__).parent.parent.parent.parent / "data" / "iata_cities.csv"
+
+
+def normalize_keyword(value: str) -> str:
+    """Uppercases and strips accents so 'São' matches 'SAO'"""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).upper().strip()
+
+
+@dataclass
+class CityLookup:
+    """Cities found by the index and how they were matched
+    
+    `exact` is set when the keyword is the IATA code or full name of a
+    returned city (an airport code counts for its city);
+    `fuzzy` when the cities were only found by typo-tolerant matching.
+    """
+    cities: List[City] = field(default_factory=list)
+    exact: bool = False
+    fuzzy: bool = False
+
+
+class CityIndex:
+    """In-memory city/airport index with code, prefix and fuzzy lookup"""
+    
+    def __init__(self, cities: Iterable[City]):
+        self._cities: List[City] = list(cities)
+        self._by_code: dict[str, City] = {}
+        self._by_name: dict[str, List[City]] = {}
+        keys: list[tuple[str, int]] = []
+        
+        for position, city in enumerate(self._cities):
+            self._by_code.setdefault(city.iata_code.upper(), city)
+            for airport in city.airports:
+                self._by_code.setdefault(airport.iata_code.upper(), city)
+            
+            name = normalize_keyword(city.name)
+            self._by_name.setdefault(name, []).append(city)
+            keys.append((name, position))
+            # Word keys let "YORK" find "NEW YORK"
+            for word in name.split()[1:]:
+                keys.append((word, position))
+        
+        keys.sort()
+        self._keys = [key for key, _ in keys]
+        self._positions = [position for _, position in keys]
+    
+    @classmethod
+    def from_csv(cls, path: Path | str = DEFAULT_DATASET) -> 'CityIndex':
+        """Builds the index from an IATA dataset in CSV format"""
+        cities = []
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                cities.append(cls._parse_row(row))
+        
+        logger.info("Loaded %d cities into the local index from %s", len(cities), path)
+        return cls(cities)
+    
+    def __len__(self) -> int:
+        return len(self._cities)
+    
+    def search(
+        self,
+        keyword: str,
+        country_code: str | None = None,
+        max_results: int | None = None,
+        include_airports: bool = False
+    ) -> List[City]:
+        """Searches cities by IATA code, name prefix or, failing that, fuzzy name"""
+        return self.lookup(keyword, country_code, max_results, include_airports).cities
+    
+    def lookup(
+        self,
+        keyword: str,
+        country_code: str | None = None,
+        max_results: int | None = None,
+        include_airports: bool = False
+    ) -> CityLookup:
+        """Like `search`, also telling whether the match was exact or fuzzy"""
+        needle = normalize_keyword(keyword)
+        country = country_code.upper() if country_code else None
+        
+        candidates: list[City] = []
+        by_code = self._by_code.get(needle)
+        if by_code is not None:
+            candidates.append(by_code)
+        candidates.extend(self._prefix_matches(needle))
+        fuzzy = not candidates
+        if fuzzy:
+            candidates.extend(self._fuzzy_matches(needle))
+        
+        lookup = CityLookup(fuzzy=fuzzy)
+        seen = set()
+        for city in candidates:
+            if id(city) in seen or (country and city.country_code != country):
+                continue
+            seen.add(id(city))
+            lookup.cities.append(city if include_airports else replace(city, airports=[]))
+            lookup.exact = lookup.exact or city is by_code or (not fuzzy and normalize_keyword(city.name) == needle)
+            if max_results and len(lookup.cities) >= max_results:
+                break
+        
+        return lookup
+    
+    def _prefix_matches(self, needle: str) -> List[City]:
+        """Finds keys starting with the needle using binary search"""
+        matches = []
+        position = bisect_left(self._keys, needle)
+        while position < len(self._keys) and self._keys[position].startswith(needle):
+            matches.append(self._cities[self._positions[position]])
+            position += 1
+        return matches
+    
+    def _fuzzy_matches(self, needle: str) -> List[City]:
+        """Finds names close to the needle, tolerating typos"""
+        names = difflib.get_close_matches(needle, self._by_name.keys(), n=10, cutoff=0.75)
+        return [city for name in names for city in self._by_name[name]]
+    
+    @staticmethod
+    def _parse_row(row: dict) -> City:
+        """Maps a dataset row to a City entity"""
+        coordinates = None
+        if row.get("latitude") and row.get("longitude"):
+            coordinates = Coordinates(float(row["latitude"]), float(row["longitude"]))
+        
+        airports = []
+        for item in filter(None, (row.get("airports") or "").split(";")):
+            code, _, name = item.partition(":")
+            airports.append(Airport(
+                iata_code=code.strip(),
+                name=name.strip(),
+                city_name=row["city_name"],
+                country_code=row["country_code"]
+            ))
+        
+        return City(
+            name=row["city_name"],
+            iata_code=row["city_code"],
+            country_code=row["country_code"],
+            country_name=row.get("country_name") or "",
+            state_code=row.get("state_code") or None,
+            coordinates=coordinates,
+            airports=airports
+        )
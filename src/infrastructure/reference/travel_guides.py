@@ -0,0 +1,219 @@
+import calendar
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
+SEASONS_GUIDE_PATH = DATA_DIR / "seasons_guide.txt"
+DOCUMENTS_CHECKLIST_PATH = DATA_DIR / "documents_checklist.txt"
+
+# How often, at most, a guide stats its file to pick up edits
+RELOAD_CHECK_SECONDS = 5.0
+
+MONTH_NAMES = tuple(calendar.month_name)[1:]
+_MONTHS = {name.lower(): number for number, name in enumerate(MONTH_NAMES, start=1)}
+_MONTHS.update({name[:3].lower(): number for name, number in list(_MONTHS.items())})
+
+SEASON_FIELDS = ("high_season", "shoulder_season", "low_season")
+CROWD_FIELDS = ("crowd_level_high", "crowd_level_medium", "crowd_level_low")
+
+# Slice key of the list of regions; never collides with a region name
+_REGIONS = None
+
+
+class UnknownGuideKeyException(LookupError):
+    """Raised when a region or month is not in a travel guide"""
+
+
+def normalize_region(value: str) -> str:
+    """'North America' and 'north-america' both become 'north_america'"""
+    return "_".join(value.strip().lower().replace("-", " ").split())
+
+
+def parse_month(value: str) -> int:
+    """Month number from a name ('July', 'jul') or a number ('7')"""
+    key = value.strip().lower()
+    if key.isdigit() and 1 <= int(key) <= 12:
+        return int(key)
+    if key in _MONTHS:
+        return _MONTHS[key]
+    raise UnknownGuideKeyException(f"Unknown month: {value}. Use a month name or a number from 1 to 12")
+
+
+def parse_month_ranges(value: str) -> frozenset[int]:
+    """Months covered by 'April-May, September-October'; ranges may wrap the year end"""
+    months = set()
+    for part in value.split(","):
+        bounds = [bound.strip() for bound in part.split("-")]
+        first = _MONTHS.get(bounds[0].lower())
+        last = _MONTHS.get(bounds[-1].lower())
+        if first is None or last is None:
+            logger.warning("Ignoring unparseable month range: %s", part.strip())
+            continue
+        month = first
+        months.add(month)
+        while month != last:
+            month = month % 12 + 1
+            months.add(month)
+    return frozenset(months)
+
+
+def parse_sections(text: str) -> dict[str, dict[str, str]]:
+    """Parses `## section` (or `### section`) headings followed by `key=value` lines"""
+    sections: dict[str, dict[str, str]] = {}
+    current = None
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("##"):
+            current = sections.setdefault(line.lstrip("#").strip(), {})
+        elif current is not None and "=" in line:
+            key, value = line.split("=", 1)
+            current[key.strip()] = value.strip()
+    return sections
+
+
+class TravelGuide(ABC):
+    """A data file held in memory with pre-encoded slices, reloaded when its mtime changes
+    
+    Lookups are dictionary reads of JSON encoded at load time. The file is
+    stat'ed at most every `check_interval` seconds, so the hot path does no
+    file I/O.
+    """
+    
+    def __init__(self, path: Path | str, check_interval: float = RELOAD_CHECK_SECONDS):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._mtime_ns: int | None = None
+        self._checked_at = 0.0
+        self._text = ""
+        self._slices: dict[Any, str] = {}
+        self.loads = 0
+        self.hits = 0
+    
+    def text(self) -> str:
+        """Returns the whole file; raises OSError if it cannot be read"""
+        self._refresh()
+        self.hits += 1
+        return self._text
+    
+    def stats(self) -> dict:
+        return {"loads": self.loads, "hits": self.hits, "slices": len(self._slices), "bytes": len(self._text)}
+    
+    def regions(self) -> str:
+        """JSON list of the regions in the guide"""
+        return self._lookup(_REGIONS, "")
+    
+    def _lookup(self, key: Any, region: str) -> str:
+        self._refresh()
+        self.hits += 1
+        value = self._slices.get(key)
+        if value is None:
+            raise UnknownGuideKeyException(f"Unknown region: {region}. Available regions: {self._available()}")
+        return value
+    
+    def _available(self) -> str:
+        return ", ".join(json.loads(self._slices[_REGIONS]))
+    
+    def _refresh(self):
+        now = time.monotonic()
+        if self._mtime_ns is not None and now - self._checked_at < self.check_interval:
+            return
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        self._checked_at = now
+        if mtime_ns == self._mtime_ns:
+            return
+        
+        text = self.path.read_text(encoding="utf-8")
+        self._slices = {key: json.dumps(value, ensure_ascii=False) for key, value in self._build(text).items()}
+        self._text = text
+        self._mtime_ns = mtime_ns
+        self.loads += 1
+        logger.info("Loaded %s (%d slices)", self.path.name, len(self._slices))
+    
+    @abstractmethod
+    def _build(self, text: str) -> dict[Any, Any]:
+        """Returns every slice served by the guide, keyed by lookup key"""
+        pass
+
+
+class SeasonsGuide(TravelGuide):
+    """Travel seasons indexed by region and by region and month"""
+    
+    def __init__(self, path: Path | str = SEASONS_GUIDE_PATH, check_interval: float = RELOAD_CHECK_SECONDS):
+        super().__init__(path, check_interval)
+    
+    def region(self, region: str) -> str:
+        """JSON of a region's season, price and crowd periods"""
+        return self._lookup(normalize_region(region), region)
+    
+    def month(self, region: str, month: str) -> str:
+        """JSON of a single month of a region"""
+        return self._lookup((normalize_region(region), parse_month(month)), region)
+    
+    def _build(self, text: str) -> dict[Any, Any]:
+        slices: dict[Any, Any] = {}
+        sections = parse_sections(text)
+        for region, fields in sections.items():
+            ranges = {name: parse_month_ranges(value) for name, value in fields.items() if name != "notes"}
+            for number in range(1, 13):
+                slices[(region, number)] = self._classify(region, number, fields, ranges)
+            slices[region] = {"region": region, **fields}
+        slices[_REGIONS] = list(sections)
+        return slices
+    
+    @staticmethod
+    def _classify(region: str, month: int, fields: dict[str, str], ranges: dict[str, frozenset[int]]) -> dict:
+        season = next((name.removesuffix("_season") for name in SEASON_FIELDS if month in ranges.get(name, ())), None)
+        crowd = next((name.removeprefix("crowd_level_") for name in CROWD_FIELDS if month in ranges.get(name, ())), None)
+        return {
+            "region": region,
+            "month": MONTH_NAMES[month - 1],
+            "season": season,
+            "crowd_level": crowd,
+            "best_weather": month in ranges.get("best_weather", ()),
+            "cheapest_flights": month in ranges.get("cheapest_flights", ()),
+            "most_expensive": month in ranges.get("most_expensive", ()),
+            "notes": fields.get("notes")
+        }
+    
+
+class DocumentsChecklist(TravelGuide):
+    """Travel document requirements indexed by region, plus the general sections"""
+    
+    GENERAL_SECTIONS = ("essential_documents", "recommended_documents", "important_tips")
+    
+    def __init__(self, path: Path | str = DOCUMENTS_CHECKLIST_PATH, check_interval: float = RELOAD_CHECK_SECONDS):
+        super().__init__(path, check_interval)
+    
+    def region(self, region: str) -> str:
+        """JSON of a region's requirements, or of a general section such as `essential_documents`"""
+        return self._lookup(normalize_region(region), region)
+    
+    def _available(self) -> str:
+        return f"{super()._available()}; general sections: {', '.join(self.GENERAL_SECTIONS)}"
+    
+    def _build(self, text: str) -> dict[Any, Any]:
+        slices: dict[Any, Any] = {}
+        regions = []
+        in_regions = False
+        for line in text.splitlines():
+            line = line.strip()
+            if line.startswith("### ") and in_regions:
+                regions.append(line[4:].strip())
+            elif line.startswith("## "):
+                in_regions = line[3:].strip() == "documents_by_region"
+        
+        sections = parse_sections(text)
+        for region in regions:
+            slices[region] = {"region": region, "documents": sections.get(region, {})}
+        for section in self.GENERAL_SECTIONS:
+            if section in sections:
+                slices[section] = {"section": section, "documents": sections[section]}
+        slices[_REGIONS] = regions
+        return slices
@@ -0,0 +1 @@
+# Price watch storage and scheduling
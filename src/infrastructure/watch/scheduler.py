@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import time
+from typing import Callable
+from src.application.services.price_watch_service import PriceWatchApplicationService
+from src.domain.gateways.watch_store import WatchStore
+
+logger = logging.getLogger(__name__)
+
+# Shortest pause between two passes, so a failing store cannot spin the loop
+MIN_SLEEP_SECONDS = 1.0
+
+
+class PriceWatchScheduler:
+    """Background task running due price watch checks
+    
+    Sleeps until the next watch is due, waking at least every `poll_interval`
+    to notice watches added by other server processes. The application
+    service, and with it the flight search stack, is only built once a watch
+    is actually due.
+    """
+    
+    def __init__(
+        self,
+        store: WatchStore,
+        service_factory: Callable[[], PriceWatchApplicationService],
+        poll_interval: float = 60.0
+    ):
+        self._store = store
+        self._service_factory = service_factory
+        self._poll_interval = poll_interval
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+        self.passes = 0
+        self.errors = 0
+    
+    def start(self):
+        """Starts the scheduler loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    def wake(self):
+        """Runs a pass now instead of waiting for the next due watch"""
+        self._wake.set()
+    
+    def stats(self) -> dict:
+        return {"running": self._task is not None and not self._task.done(), "passes": self.passes, "errors": self.errors}
+    
+    async def aclose(self):
+        """Stops the loop, cancelling checks in progress"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+    
+    async def _run(self):
+        while True:
+            delay = await self._pass()
+            try:
+                await asyncio.wait_for(self._wake.wait(), min(max(delay, MIN_SLEEP_SECONDS), self._poll_interval))
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+    
+    async def _pass(self) -> float:
+        """Checks what is due; returns the seconds to sleep"""
+        try:
+            next_due = await self._store.next_due()
+            if next_due is None:
+                return self._poll_interval
+            if next_due > time.time():
+                return next_due - time.time()
+            
+            self.passes += 1
+            delay = await self._service_factory().run_due()
+            return delay if delay is not None else self._poll_interval
+        except Exception as e:
+            # The loop must outlive storage or upstream failures
+            self.errors += 1
+            logger.warning("Price watch pass failed: %s", str(e))
+            return self._poll_interval
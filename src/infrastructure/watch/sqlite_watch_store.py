@@ -0,0 +1,251 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+from src.domain.entities.price_watch import PriceWatch, PricePoint
+from src.domain.exceptions.flight_exceptions import FlightServiceUnavailableException
+from src.domain.gateways.watch_store import WatchStore
+from src.domain.vo.search_params import FlightSearchParams
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watches (
+    id TEXT PRIMARY KEY,
+    params TEXT NOT NULL,
+    departure_date TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    next_check_at REAL NOT NULL,
+    state TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS watches_next_check_at ON watches (next_check_at);
+CREATE TABLE IF NOT EXISTS price_history (
+    watch_id TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    point TEXT NOT NULL,
+    PRIMARY KEY (watch_id, checked_at)
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteWatchStore(WatchStore):
+    """Price watches and their history in a local SQLite database
+    
+    Each check is stored as a compact JSON diff against the previous one and
+    only the latest `history_limit` checks per watch are kept. Like the
+    persistent cache, the database runs in WAL mode with `BEGIN IMMEDIATE`
+    writes, so several server processes can share it; `claim_due` leases due
+    watches so only one of them checks each watch.
+    """
+    
+    def __init__(self, path: Path, history_limit: int, busy_timeout: float = 5.0):
+        self._path = Path(path)
+        self._history_limit = history_limit
+        self._busy_timeout = busy_timeout
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.claimed = 0
+        self.recorded = 0
+    
+    async def add(self, watch: PriceWatch):
+        await self._run(self._add, watch)
+    
+    async def remove(self, watch_id: str) -> bool:
+        return await self._run(self._remove, watch_id)
+    
+    async def get(self, watch_id: str) -> PriceWatch | None:
+        return await self._run(self._get, watch_id)
+    
+    async def list_all(self) -> list[PriceWatch]:
+        return await self._run(self._list)
+    
+    async def claim_due(self, now: float, limit: int, lease: float) -> list[PriceWatch]:
+        return await self._run(self._claim_due, now, limit, lease)
+    
+    async def next_due(self) -> float | None:
+        return await self._run(self._next_due)
+    
+    async def record(self, watch: PriceWatch, point: PricePoint):
+        await self._run(self._record, watch, point)
+    
+    async def history(self, watch_id: str, limit: int) -> list[PricePoint]:
+        return await self._run(self._history, watch_id, limit)
+    
+    def stats(self) -> dict:
+        return {"claimed": self.claimed, "recorded": self.recorded}
+    
+    def close(self):
+        """Closes the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    async def _run(self, operation, *args):
+        return await asyncio.to_thread(self._locked, operation, *args)
+    
+    def _locked(self, operation, *args):
+        """Runs an operation on the shared connection"""
+        with self._lock:
+            try:
+                return operation(self._connect(), *args)
+            except (sqlite3.Error, OSError) as e:
+                logger.error("Price watch storage failed: %s", str(e))
+                raise FlightServiceUnavailableException("Price watch storage is unavailable") from e
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, timeout=self._busy_timeout, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+    
+    def _add(self, connection: sqlite3.Connection, watch: PriceWatch):
+        connection.execute(
+            "INSERT INTO watches (id, params, departure_date, created_at, next_check_at, state) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                watch.id,
+                json.dumps(watch.params.to_dict(), separators=(",", ":")),
+                watch.params.departure_date.isoformat(),
+                watch.created_at,
+                watch.next_check_at,
+                _state_to_json(watch)
+            )
+        )
+    
+    def _remove(self, connection: sqlite3.Connection, watch_id: str) -> bool:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            removed = connection.execute("DELETE FROM watches WHERE id = ?", (watch_id,)).rowcount
+            connection.execute("DELETE FROM price_history WHERE watch_id = ?", (watch_id,))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return removed > 0
+    
+    def _get(self, connection: sqlite3.Connection, watch_id: str) -> PriceWatch | None:
+        row = connection.execute("SELECT * FROM watches WHERE id = ?", (watch_id,)).fetchone()
+        return _watch_from_row(row) if row else None
+    
+    def _list(self, connection: sqlite3.Connection) -> list[PriceWatch]:
+        return [_watch_from_row(row) for row in connection.execute("SELECT * FROM watches ORDER BY created_at")]
+    
+    def _claim_due(self, connection: sqlite3.Connection, now: float, limit: int, lease: float) -> list[PriceWatch]:
+        if limit <= 0:
+            return []
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                "SELECT * FROM watches WHERE next_check_at <= ? AND departure_date >= ? ORDER BY next_check_at LIMIT ?",
+                (now, date.fromtimestamp(now).isoformat(), limit)
+            ).fetchall()
+            connection.executemany(
+                "UPDATE watches SET next_check_at = ? WHERE id = ?",
+                [(now + lease, row[0]) for row in rows]
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self.claimed += len(rows)
+        return [_watch_from_row(row) for row in rows]
+    
+    def _next_due(self, connection: sqlite3.Connection) -> float | None:
+        return connection.execute(
+            "SELECT MIN(next_check_at) FROM watches WHERE departure_date >= ?",
+            (date.today().isoformat(),)
+        ).fetchone()[0]
+    
+    def _record(self, connection: sqlite3.Connection, watch: PriceWatch, point: PricePoint):
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            updated = connection.execute(
+                "UPDATE watches SET next_check_at = ?, state = ? WHERE id = ?",
+                (watch.next_check_at, _state_to_json(watch), watch.id)
+            ).rowcount
+            # The watch may have been removed while it was being checked
+            if updated:
+                connection.execute(
+                    "INSERT OR REPLACE INTO price_history (watch_id, checked_at, point) VALUES (?, ?, ?)",
+                    (watch.id, point.checked_at, _point_to_json(point))
+                )
+                connection.execute(
+                    "DELETE FROM price_history WHERE watch_id = ? AND checked_at <= ("
+                    "SELECT checked_at FROM price_history WHERE watch_id = ? ORDER BY checked_at DESC LIMIT 1 OFFSET ?)",
+                    (watch.id, watch.id, self._history_limit)
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self.recorded += 1
+    
+    def _history(self, connection: sqlite3.Connection, watch_id: str, limit: int) -> list[PricePoint]:
+        rows = connection.execute(
+            "SELECT point FROM price_history WHERE watch_id = ? ORDER BY checked_at DESC LIMIT ?",
+            (watch_id, limit)
+        )
+        return [_point_from_json(row[0]) for row in rows]
+
+
+def _state_to_json(watch: PriceWatch) -> str:
+    return json.dumps({
+        "interval": watch.interval,
+        "last_checked_at": watch.last_checked_at,
+        "checks": watch.checks,
+        "failures": watch.failures,
+        "last_error": watch.last_error,
+        "currency": watch.currency,
+        "snapshot": watch.snapshot
+    }, separators=(",", ":"))
+
+
+def _watch_from_row(row: tuple) -> PriceWatch:
+    watch_id, params, _, created_at, next_check_at, state = row
+    return PriceWatch(
+        id=watch_id,
+        params=FlightSearchParams.from_dict(json.loads(params)),
+        created_at=created_at,
+        next_check_at=next_check_at,
+        **json.loads(state)
+    )
+
+
+def _point_to_json(point: PricePoint) -> str:
+    # Empty members are left out to keep unchanged checks small
+    document = {"t": point.checked_at, "min": point.min_price, "n": point.offers}
+    if point.previous_min_price is not None:
+        document["prev"] = point.previous_min_price
+    if point.currency:
+        document["cur"] = point.currency
+    if point.new_offers:
+        document["new"] = point.new_offers
+    if point.removed_offers:
+        document["gone"] = point.removed_offers
+    if point.price_changes:
+        document["chg"] = point.price_changes
+    if point.error:
+        document["err"] = point.error
+    return json.dumps(document, separators=(",", ":"))
+
+
+def _point_from_json(encoded: str) -> PricePoint:
+    document = json.loads(encoded)
+    return PricePoint(
+        checked_at=document["t"],
+        min_price=document["min"],
+        previous_min_price=document.get("prev"),
+        currency=document.get("cur"),
+        offers=document["n"],
+        new_offers=document.get("new", {}),
+        removed_offers=document.get("gone", {}),
+        price_changes={signature: tuple(prices) for signature, prices in document.get("chg", {}).items()},
+        error=document.get("err")
+    )
@@ -1,18 +1,22 @@
 import logging
+from functools import lru_cache
 from mcp.server.fastmcp import FastMCP
-from jinja2 import Environment, FileSystemLoader
 
-from src.infrastructure.config.settings import config
+from src.infrastructure.config.settings import get_config
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _jinja_env():
+    """Jinja2 environment, created on first render to keep startup light"""
+    from jinja2 import Environment, FileSystemLoader
+    return Environment(loader=FileSystemLoader(get_config().templates_dir))
+
+
 def register_prompts(mcp: FastMCP):
     """Registers MCP prompts"""
     
-    # Jinja2 configuration
-    jinja_env = Environment(loader=FileSystemLoader(config.templates_dir))
-    
     @mcp.prompt()
     async def vacation_prompt(
         destination: str,
@@ -24,7 +28,7 @@ def register_prompts(mcp: FastMCP):
     ) -> str:
         """Guides the vacation flight search process using Jinja2 template"""
         try:
-            template = jinja_env.get_template('vacation_prompt.j2')
+            template = _jinja_env().get_template('vacation_prompt.j2')
             return template.render(
                 destination=destination,
                 origin=origin,
@@ -61,7 +65,7 @@ def register_prompts(mcp: FastMCP):
     ) -> str:
         """Guides specific flight search using Jinja2 template"""
         try:
-            template = jinja_env.get_template('flight_search_prompt.j2')
+            template = _jinja_env().get_template('flight_search_prompt.j2')
             return template.render(
                 origin=origin,
                 destination=destination,
@@ -1,7 +1,10 @@
+import json
 import logging
-import aiofiles
-from pathlib import Path
+from typing import Callable
 from mcp.server.fastmcp import FastMCP
+from src.infrastructure.config.settings import get_config
+from src.infrastructure.container import container
+from src.infrastructure.reference.travel_guides import UnknownGuideKeyException
 
 
 logger = logging.getLogger(__name__)
@@ -14,11 +17,7 @@ def register_resources(mcp: FastMCP):
     async def read_seasons_guide() -> str:
         """Reads the travel seasons guide file."""
         try:
-            data_dir = Path(__file__).parent.parent.parent.parent / "data"
-            file_path = data_dir / "seasons_guide.txt"
-            async with aiofiles.open(file_path, mode="r", encoding="utf-8") as f:
-                content = await f.read()
-            return content
+            return container.seasons_guide.text()
         except FileNotFoundError:
             return "Seasons guide file not found."
         except (OSError, UnicodeDecodeError) as e:
@@ -29,13 +28,47 @@ def register_resources(mcp: FastMCP):
     async def read_documents_checklist() -> str:
         """Reads the travel documents checklist file."""
         try:
-            data_dir = Path(__file__).parent.parent.parent.parent / "data"
-            file_path = data_dir / "documents_checklist.txt"
-            async with aiofiles.open(file_path, mode="r", encoding="utf-8") as f:
-                content = await f.read()
-            return content
+            return container.documents_checklist.text()
         except FileNotFoundError:
             return "Documents checklist file not found."
         except (OSError, UnicodeDecodeError) as e:
             logger.error("Error reading documents checklist: %s", str(e))
             return "Error loading documents data."
+    
+    @mcp.resource("seasons://regions", mime_type="application/json")
+    async def read_season_regions() -> str:
+        """Regions covered by the seasons guide."""
+        return _guide_slice(lambda: container.seasons_guide.regions())
+    
+    @mcp.resource("seasons://{region}", mime_type="application/json")
+    async def read_region_seasons(region: str) -> str:
+        """High, shoulder and low seasons, weather, prices and crowd levels of a region."""
+        return _guide_slice(lambda: container.seasons_guide.region(region))
+    
+    @mcp.resource("seasons://{region}/{month}", mime_type="application/json")
+    async def read_month_season(region: str, month: str) -> str:
+        """Season, crowd level, weather and price outlook of one month (name or 1-12) in a region."""
+        return _guide_slice(lambda: container.seasons_guide.month(region, month))
+    
+    @mcp.resource("documents://{region}", mime_type="application/json")
+    async def read_region_documents(region: str) -> str:
+        """Travel documents required for a region, or a general section: essential_documents, recommended_documents, important_tips."""
+        return _guide_slice(lambda: container.documents_checklist.region(region))
+    
+    @mcp.resource("metrics://server", mime_type="application/json")
+    async def read_server_metrics() -> str:
+        """Per-stage latency histograms, upstream status and payload metrics, and cache, pool and rate limiter stats."""
+        if not get_config().observability.metrics_enabled:
+            return json.dumps({"enabled": False, "hint": "Set METRICS_ENABLED=true to record metrics."})
+        return json.dumps({"enabled": True, **container.metrics.snapshot()})
+
+
+def _guide_slice(lookup: Callable[[], str]) -> str:
+    """Returns a pre-encoded travel guide slice, or a JSON error"""
+    try:
+        return lookup()
+    except UnknownGuideKeyException as e:
+        return json.dumps({"error": str(e)})
+    except (OSError, UnicodeDecodeError) as e:
+        logger.error("Error loading travel guide: %s", str(e))
+        return json.dumps({"error": "Error loading travel guide data."})
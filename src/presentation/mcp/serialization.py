@@ -0,0 +1,138 @@
+"""Compact JSON encoding of tool results
+
+Tool results returned as dicts are pretty-printed by FastMCP; results encoded
+here are returned as ready-made text instead, serialized once with orjson when
+it is installed (`pip install mcp-flight[fast-json]`) or the standard library.
+"""
+import json
+from dataclasses import is_dataclass, fields as dataclass_fields
+from typing import Any
+from src.application.dto.flight_dto import FlightOfferDTO, FlightResultPageDTO
+from src.domain.exceptions.flight_exceptions import InvalidSearchParametersException
+
+FORMAT_OBJECTS = "objects"
+FORMAT_TABLE = "table"
+OUTPUT_FORMATS = (FORMAT_OBJECTS, FORMAT_TABLE)
+
+FLIGHT_FIELDS = tuple(field.name for field in dataclass_fields(FlightOfferDTO))
+
+# Smallest budget that still fits the page envelope, table columns included
+MIN_OUTPUT_BYTES = 512
+
+_orjson = None
+_orjson_checked = False
+
+
+def _load_orjson():
+    global _orjson, _orjson_checked
+    if not _orjson_checked:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = None
+        _orjson_checked = True
+    return _orjson
+
+
+def dumps(value: Any) -> bytes:
+    """Encodes `value` (dataclasses included) as compact UTF-8 JSON"""
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_encode_default).encode()
+
+
+def _encode_default(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        # Shallow: nested dataclasses come back through this hook
+        return {field.name: getattr(value, field.name) for field in dataclass_fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode(value: Any) -> str:
+    """Encodes `value` as compact JSON text"""
+    return dumps(value).decode()
+
+
+def encode_flight_page(
+    page: FlightResultPageDTO,
+    fields: list[str] | None = None,
+    output_format: str = FORMAT_OBJECTS,
+    max_bytes: int | None = None
+) -> str:
+    """Encodes a page of offers, optionally projected, tabular and size-bounded
+    
+    `fields` keeps only the named offer fields. The "table" format lists the
+    field names once in `columns` and each offer as a row of values. With
+    `max_bytes`, only the best-ranked offers that fit are kept; `truncated` is
+    set and `next_offset` points at the first offer left out.
+    """
+    columns = validate_output_options(fields, output_format, max_bytes)
+    if output_format == FORMAT_TABLE:
+        rows = [dumps([getattr(flight, name) for name in columns]) for flight in page.flights]
+    elif columns == FLIGHT_FIELDS:
+        rows = [dumps(flight) for flight in page.flights]
+    else:
+        rows = [dumps({name: getattr(flight, name) for name in columns}) for flight in page.flights]
+    
+    kept = len(rows)
+    envelope = _envelope(page, columns, output_format, kept, truncated=False)
+    if max_bytes is not None and len(envelope) + _rows_size(rows) > max_bytes:
+        # Sized with the longest possible next_offset so the final envelope never overshoots
+        longest = _envelope(page, columns, output_format, len(rows), truncated=True)
+        kept = _rows_within(rows, max_bytes - len(longest))
+        envelope = _envelope(page, columns, output_format, kept, truncated=True)
+    
+    # The row list is the envelope's last member, so rows are spliced in without re-encoding
+    return (envelope[:-2] + b",".join(rows[:kept]) + b"]}").decode()
+
+
+def validate_output_options(fields: list[str] | None, output_format: str, max_bytes: int | None) -> tuple[str, ...]:
+    """Checks the output options, returning the offer fields to encode
+    
+    Tools call this before searching, so a bad option never costs an API call.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise InvalidSearchParametersException(f"Invalid output_format: {output_format}. Use one of: {', '.join(OUTPUT_FORMATS)}")
+    if max_bytes is not None and max_bytes < MIN_OUTPUT_BYTES:
+        raise InvalidSearchParametersException(f"max_bytes must be at least {MIN_OUTPUT_BYTES}")
+    if not fields:
+        return FLIGHT_FIELDS
+    unknown = [name for name in fields if name not in FLIGHT_FIELDS]
+    if unknown:
+        raise InvalidSearchParametersException(
+            f"Unknown fields: {', '.join(unknown)}. Available fields: {', '.join(FLIGHT_FIELDS)}"
+        )
+    return tuple(dict.fromkeys(fields))
+
+
+def _envelope(page: FlightResultPageDTO, columns: tuple[str, ...], output_format: str, kept: int, truncated: bool) -> bytes:
+    """Encodes the page metadata, ending with an empty row list"""
+    if truncated:
+        next_offset = page.offset + kept if page.cursor else None
+    else:
+        next_offset = page.next_offset
+    envelope: dict[str, Any] = {"cursor": page.cursor, "total": page.total, "offset": page.offset, "next_offset": next_offset}
+    if truncated:
+        envelope["truncated"] = True
+    if output_format == FORMAT_TABLE:
+        envelope["columns"] = columns
+        envelope["rows"] = []
+    else:
+        envelope["flights"] = []
+    return dumps(envelope)
+
+
+def _rows_size(rows: list[bytes]) -> int:
+    return sum(len(row) for row in rows) + max(len(rows) - 1, 0)
+
+
+def _rows_within(rows: list[bytes], budget: int) -> int:
+    """Number of leading rows whose comma-joined size fits in `budget`"""
+    used = -1
+    for index, row in enumerate(rows):
+        used += len(row) + 1
+        if used > budget:
+            return index
+    return len(rows)
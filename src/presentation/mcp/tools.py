@@ -1,22 +1,63 @@
+import functools
+import json
 import logging
-from mcp.server.fastmcp import FastMCP
+from dataclasses import asdict
+from mcp.server.fastmcp import FastMCP, Context
 
-from src.application.dto.flight_dto import FlightSearchRequestDTO
-from src.domain.vo.search_params import CitySearchParams
+from src.application.dto.flight_dto import FlightSearchRequestDTO, BatchFlightSearchRequestDTO, ResultPageRequestDTO
+from src.application.dto.city_dto import CitySearchRequestDTO
+from src.application.dto.fare_calendar_dto import FareCalendarRequestDTO
+from src.application.dto.price_watch_dto import WatchRouteRequestDTO
+from src.application.services.progress import ProgressCallback
 from src.domain.exceptions.flight_exceptions import (
     InvalidSearchParametersException,
     FlightServiceUnavailableException,
-    FlightApiException
+    FlightApiException,
+    ResultSetNotFoundException,
+    WatchNotFoundException
 )
+from src.infrastructure.config.settings import get_config
 from src.infrastructure.container import container
+from src.presentation.mcp.serialization import FORMAT_OBJECTS, encode, encode_flight_page, validate_output_options
 
 logger = logging.getLogger(__name__)
 
 
+def _progress_reporter(ctx: Context | None) -> ProgressCallback | None:
+    """Streams progress and partial results through MCP notifications"""
+    if ctx is None:
+        return None
+    
+    async def report(completed: int, total: int, message: str, partial: dict | None = None):
+        try:
+            await ctx.report_progress(completed, total, message)
+            if partial is not None:
+                await ctx.info(json.dumps({"progress": f"{completed}/{total}", "message": message, "partial": partial}))
+            else:
+                await ctx.info(message)
+        except Exception as e:
+            # Notifications are best effort and must never fail the search
+            logger.debug("Progress notification failed: %s", str(e))
+    
+    return report
+
+
+def _timed(tool):
+    """Records the tool's total latency in the `tool` stage"""
+    
+    @functools.wraps(tool)
+    async def wrapper(*args, **kwargs):
+        with container.metrics.timer("tool", tool=tool.__name__):
+            return await tool(*args, **kwargs)
+    
+    return wrapper
+
+
 def register_tools(mcp: FastMCP):
     """Registers MCP tools"""
     
     @mcp.tool()
+    @_timed
     async def search_flights(
         origin_location_code: str,
         destination_location_code: str,
@@ -31,10 +72,34 @@ def register_tools(mcp: FastMCP):
         non_stop: bool = False,
         currency_code: str | None = None,
         max_price: int | None = None,
-        max_results: int = 20
-    ) -> dict:
-        """Searches flight offers using Amadeus API."""
+        max_results: int = 20,
+        sort_by: str = "best_value",
+        weights: dict[str, float] | None = None,
+        departure_window: str | None = None,
+        result_mode: str = "all",
+        pareto_criteria: list[str] | None = None,
+        page_size: int | None = None,
+        fields: list[str] | None = None,
+        output_format: str = FORMAT_OBJECTS,
+        max_bytes: int | None = None,
+        ctx: Context = None
+    ) -> str:
+        """Searches flight offers using Amadeus API.
+        
+        sort_by: best_value (direct first, then price), price, duration, stops,
+        departure (closest to departure_window, e.g. "06-12") or weighted, which
+        combines the criteria in weights (price, duration, stops, departure, seats),
+        e.g. {"price": 0.7, "duration": 0.3}.
+        result_mode "pareto" returns only offers that no other offer beats on all of
+        pareto_criteria (default: price, duration, stops).
+        page_size limits the offers returned now; the response's cursor and
+        next_offset fetch more (or re-ranked) offers with get_results.
+        fields keeps only the named offer fields (e.g. ["price", "airline",
+        "departure_time"]); output_format "table" returns columns once and one
+        row of values per offer; max_bytes keeps only the best offers that fit.
+        """
         try:
+            validate_output_options(fields, output_format, max_bytes)
             request = FlightSearchRequestDTO(
                 origin_location_code=origin_location_code,
                 destination_location_code=destination_location_code,
@@ -49,14 +114,187 @@ def register_tools(mcp: FastMCP):
                 non_stop=non_stop,
                 currency_code=currency_code,
                 max_price=max_price,
-                max_results=max_results
+                max_results=max_results,
+                sort_by=sort_by,
+                weights=weights,
+                departure_window=departure_window,
+                result_mode=result_mode,
+                pareto_criteria=pareto_criteria,
+                page_size=page_size
             )
             
-            flights = await container.flight_app_service.search_flights(request)
-            return {"flights": [flight.__dict__ for flight in flights]}
+            page = await container.flight_app_service.search_flights(request, _progress_reporter(ctx))
+            with container.metrics.timer("serialize", tool="search_flights"):
+                return encode_flight_page(page, fields, output_format, max_bytes)
             
         except InvalidSearchParametersException as e:
             logger.warning("Invalid parameters for flight search: %s", str(e))
+            return encode({"error": str(e)})
+        except FlightServiceUnavailableException as e:
+            logger.error("Flight service unavailable: %s", str(e))
+            return encode({"error": str(e)})
+        except FlightApiException as e:
+            logger.error("Flight API error: %s", str(e))
+            return encode({"error": str(e)})
+    
+    @mcp.tool()
+    @_timed
+    async def get_results(
+        cursor: str,
+        offset: int = 0,
+        limit: int = 20,
+        sort_by: str | None = None,
+        weights: dict[str, float] | None = None,
+        departure_window: str | None = None,
+        result_mode: str | None = None,
+        pareto_criteria: list[str] | None = None,
+        fields: list[str] | None = None,
+        output_format: str = FORMAT_OBJECTS,
+        max_bytes: int | None = None
+    ) -> str:
+        """Returns more offers from a previous search_flights result without searching again.
+        
+        Use the cursor and next_offset from search_flights. Ranking options left
+        empty keep the original search's ranking; set them to re-sort the same offers.
+        fields, output_format and max_bytes shape the output as in search_flights.
+        """
+        try:
+            validate_output_options(fields, output_format, max_bytes)
+            request = ResultPageRequestDTO(
+                cursor=cursor,
+                offset=offset,
+                limit=limit,
+                sort_by=sort_by,
+                weights=weights,
+                departure_window=departure_window,
+                result_mode=result_mode,
+                pareto_criteria=pareto_criteria
+            )
+            
+            page = await container.flight_app_service.get_results(request)
+            with container.metrics.timer("serialize", tool="get_results"):
+                return encode_flight_page(page, fields, output_format, max_bytes)
+            
+        except InvalidSearchParametersException as e:
+            logger.warning("Invalid parameters for results page: %s", str(e))
+            return encode({"error": str(e)})
+        except ResultSetNotFoundException as e:
+            logger.info("Results page requested for unknown cursor: %s", str(e))
+            return encode({"error": str(e)})
+        except FlightServiceUnavailableException as e:
+            logger.error("Flight service unavailable: %s", str(e))
+            return encode({"error": str(e)})
+        except FlightApiException as e:
+            logger.error("Flight API error: %s", str(e))
+            return encode({"error": str(e)})
+    
+    @mcp.tool()
+    @_timed
+    async def batch_search_flights(
+        origin_location_codes: list[str],
+        destination_location_codes: list[str],
+        departure_date: str,
+        adults: int = 1,
+        return_date: str | None = None,
+        children: int = 0,
+        infants: int = 0,
+        travel_class: str | None = None,
+        included_airline_codes: str | None = None,
+        excluded_airline_codes: str | None = None,
+        non_stop: bool = False,
+        currency_code: str | None = None,
+        max_price: int | None = None,
+        max_results_per_pair: int = 5,
+        max_ranked_results: int = 10,
+        ctx: Context = None
+    ) -> dict:
+        """
+        Searches every origin x destination combination in one call.
+        
+        Returns the best offers per route pair (with per-pair errors instead of
+        failing the whole batch) plus a global ranking across all pairs.
+        """
+        try:
+            request = BatchFlightSearchRequestDTO(
+                origin_location_codes=origin_location_codes,
+                destination_location_codes=destination_location_codes,
+                departure_date=departure_date,
+                adults=adults,
+                return_date=return_date,
+                children=children,
+                infants=infants,
+                travel_class=travel_class,
+                included_airline_codes=included_airline_codes,
+                excluded_airline_codes=excluded_airline_codes,
+                non_stop=non_stop,
+                currency_code=currency_code,
+                max_price=max_price,
+                max_results_per_pair=max_results_per_pair,
+                max_ranked_results=max_ranked_results
+            )
+            
+            result = await container.flight_app_service.search_route_matrix(request, _progress_reporter(ctx))
+            with container.metrics.timer("serialize", tool="batch_search_flights"):
+                return asdict(result)
+            
+        except InvalidSearchParametersException as e:
+            logger.warning("Invalid parameters for batch flight search: %s", str(e))
+            return {"error": str(e)}
+        except FlightServiceUnavailableException as e:
+            logger.error("Flight service unavailable: %s", str(e))
+            return {"error": str(e)}
+        except FlightApiException as e:
+            logger.error("Flight API error: %s", str(e))
+            return {"error": str(e)}
+    
+    @mcp.tool()
+    @_timed
+    async def search_fare_calendar(
+        origin_location_code: str,
+        destination_location_code: str,
+        start_date: str,
+        end_date: str,
+        adults: int = 1,
+        min_stay_days: int | None = None,
+        max_stay_days: int | None = None,
+        children: int = 0,
+        infants: int = 0,
+        travel_class: str | None = None,
+        non_stop: bool = False,
+        currency_code: str | None = None,
+        max_price: int | None = None,
+        ctx: Context = None
+    ) -> dict:
+        """
+        Finds the cheapest day to fly within a date window.
+        
+        Searches every departure date between start_date and end_date (and every
+        stay length between min_stay_days and max_stay_days for round trips)
+        concurrently, returning a date x price matrix with the cheapest offer per cell.
+        """
+        try:
+            request = FareCalendarRequestDTO(
+                origin_location_code=origin_location_code,
+                destination_location_code=destination_location_code,
+                start_date=start_date,
+                end_date=end_date,
+                adults=adults,
+                min_stay_days=min_stay_days,
+                max_stay_days=max_stay_days,
+                children=children,
+                infants=infants,
+                travel_class=travel_class,
+                non_stop=non_stop,
+                currency_code=currency_code,
+                max_price=max_price
+            )
+            
+            calendar = await container.fare_calendar_service.search_calendar(request, _progress_reporter(ctx))
+            with container.metrics.timer("serialize", tool="search_fare_calendar"):
+                return asdict(calendar)
+            
+        except InvalidSearchParametersException as e:
+            logger.warning("Invalid parameters for fare calendar: %s", str(e))
             return {"error": str(e)}
         except FlightServiceUnavailableException as e:
             logger.error("Flight service unavailable: %s", str(e))
@@ -66,6 +304,116 @@ def register_tools(mcp: FastMCP):
             return {"error": str(e)}
     
     @mcp.tool()
+    @_timed
+    async def watch_route(
+        origin_location_code: str,
+        destination_location_code: str,
+        departure_date: str,
+        adults: int = 1,
+        return_date: str | None = None,
+        children: int = 0,
+        infants: int = 0,
+        travel_class: str | None = None,
+        non_stop: bool = False,
+        currency_code: str | None = None,
+        max_price: int | None = None,
+        interval_minutes: int | None = None
+    ) -> dict:
+        """
+        Watches a route's prices in the background.
+        
+        The server re-searches the route every interval_minutes (default 60,
+        jittered) within a request budget and records new, removed and repriced
+        offers. Read the changes with list_watches or get_price_history instead
+        of searching again; stop with unwatch_route.
+        """
+        if not get_config().price_watch.enabled:
+            return {"error": "Price watches are disabled. Set PRICE_WATCH_ENABLED=true to watch routes."}
+        try:
+            request = WatchRouteRequestDTO(
+                origin_location_code=origin_location_code,
+                destination_location_code=destination_location_code,
+                departure_date=departure_date,
+                adults=adults,
+                return_date=return_date,
+                children=children,
+                infants=infants,
+                travel_class=travel_class,
+                non_stop=non_stop,
+                currency_code=currency_code,
+                max_price=max_price,
+                interval_minutes=interval_minutes
+            )
+            
+            watch = await container.price_watch_service.watch_route(request)
+            with container.metrics.timer("serialize", tool="watch_route"):
+                return asdict(watch)
+            
+        except InvalidSearchParametersException as e:
+            logger.warning("Invalid parameters for price watch: %s", str(e))
+            return {"error": str(e)}
+        except FlightServiceUnavailableException as e:
+            logger.error("Price watch unavailable: %s", str(e))
+            return {"error": str(e)}
+    
+    @mcp.tool()
+    @_timed
+    async def unwatch_route(watch_id: str) -> dict:
+        """Stops a price watch and deletes its history."""
+        try:
+            await container.price_watch_service.unwatch_route(watch_id)
+            return {"watch_id": watch_id, "removed": True}
+            
+        except WatchNotFoundException as e:
+            logger.info("Unwatch requested for unknown watch: %s", str(e))
+            return {"error": str(e)}
+        except FlightServiceUnavailableException as e:
+            logger.error("Price watch unavailable: %s", str(e))
+            return {"error": str(e)}
+    
+    @mcp.tool()
+    @_timed
+    async def list_watches() -> dict:
+        """
+        Lists price watches with their cheapest current price and latest check:
+        change in the cheapest price and new, removed and repriced offers.
+        """
+        try:
+            watches = await container.price_watch_service.list_watches()
+            with container.metrics.timer("serialize", tool="list_watches"):
+                return {"watches": [asdict(watch) for watch in watches]}
+            
+        except FlightServiceUnavailableException as e:
+            logger.error("Price watch unavailable: %s", str(e))
+            return {"error": str(e)}
+    
+    @mcp.tool()
+    @_timed
+    async def get_price_history(watch_id: str, limit: int = 20, changes_only: bool = False) -> dict:
+        """
+        Returns a watched route's latest checks, newest first, without searching.
+        
+        Each check has the cheapest price and its change since the previous
+        check, plus the offers that appeared, disappeared or changed price.
+        changes_only skips checks where nothing changed.
+        """
+        try:
+            history = await container.price_watch_service.get_price_history(watch_id, limit, changes_only)
+            with container.metrics.timer("serialize", tool="get_price_history"):
+                return asdict(history)
+            
+        except InvalidSearchParametersException as e:
+            logger.warning("Invalid parameters for price history: %s", str(e))
+            return {"error": str(e)}
+        except WatchNotFoundException as e:
+            logger.info("Price history requested for unknown watch: %s", str(e))
+            return {"error": str(e)}
+        except FlightServiceUnavailableException as e:
+            logger.error("Price watch unavailable: %s", str(e))
+            return {"error": str(e)}
+    
+    @mcp.tool()
+    @_timed
     async def search_cities(
         keyword: str,
         country_code: str | None = None,
@@ -73,18 +421,21 @@ def register_tools(mcp: FastMCP):
         include: str = "AIRPORTS"
     ) -> dict:
         """
-        Searches city and airport data using Amadeus API.
+        Searches city and airport data, answering from the local IATA index and
+        falling back to the Amadeus API for unknown locations.
         """
-        params = CitySearchParams(
-            keyword=keyword,
-            country_code=country_code,
-            max_results=max_results,
-            include=include
-        )
-
         try:
-            result = await container.city_gateway.search_cities(params)
-            return result
+            request = CitySearchRequestDTO(
+                keyword=keyword,
+                country_code=country_code,
+                max_results=max_results,
+                include_airports=(include or "").upper() == "AIRPORTS"
+            )
+            
+            cities = await container.city_app_service.search_cities(request)
+            with container.metrics.timer("serialize", tool="search_cities"):
+                return {"cities": [city.__dict__ for city in cities]}
+            
         except InvalidSearchParametersException as e:
             logger.warning("Invalid parameters for city search: %s", str(e))
             return {"error": str(e)}
@@ -0,0 +1,28 @@
+import asyncio
+import pytest
+from src.application.dto.city_dto import CitySearchRequestDTO
+from src.application.services.city_application_service import CityApplicationService
+from src.domain.entities.city import City
+from src.domain.exceptions.flight_exceptions import InvalidSearchParametersException
+from src.infrastructure.gateways.indexed_city_gateway import IndexedCityGateway
+from src.infrastructure.reference.city_index import CityIndex
+
+
+class UnreachableCityGateway:
+    async def search_cities(self, params):
+        raise AssertionError("the local index should have answered")
+
+
+def service() -> CityApplicationService:
+    index = CityIndex([City(name="Lisbon", iata_code="LIS", country_code="PT", country_name="Portugal")])
+    return CityApplicationService(IndexedCityGateway(index, UnreachableCityGateway()))
+
+
+def test_maps_cities_to_dtos():
+    cities = asyncio.run(service().search_cities(CitySearchRequestDTO(keyword="lis")))
+    assert [(city.name, city.iata_code, city.country_code) for city in cities] == [("Lisbon", "LIS", "PT")]
+
+
+def test_short_keyword_is_a_parameter_error():
+    with pytest.raises(InvalidSearchParametersException):
+        asyncio.run(service().search_cities(CitySearchRequestDTO(keyword="l")))
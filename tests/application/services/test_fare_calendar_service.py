@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+from src.application.dto.fare_calendar_dto import FareCalendarRequestDTO
+from src.application.services.fare_calendar_service import FareCalendarApplicationService, MAX_CALENDAR_SEARCHES
+from src.domain.exceptions.flight_exceptions import FlightServiceUnavailableException, InvalidSearchParametersException
+from src.domain.services.flight_search_service import FlightSearchService
+from tests.factories import FakeFlightGateway, flight_offer
+
+
+class DatedGateway(FakeFlightGateway):
+    """Prices offers by departure day and tracks how many calls overlap"""
+    
+    def __init__(self, failing_day: int | None = None):
+        super().__init__(delay=0.01)
+        self.failing_day = failing_day
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def search_flights(self, params):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            self.calls += 1
+            day = params.departure_date.day
+            if day == self.failing_day:
+                raise FlightServiceUnavailableException("down")
+            stay = (params.return_date - params.departure_date).days if params.return_date else 0
+            return [
+                flight_offer(id=f"{day}-{stay}-a", price=100 + day * 10 + stay),
+                flight_offer(id=f"{day}-{stay}-b", price=50 + day * 10 + stay)
+            ]
+        finally:
+            self.in_flight -= 1
+
+
+def request(**kwargs) -> FareCalendarRequestDTO:
+    defaults = {
+        "origin_location_code": "GRU",
+        "destination_location_code": "LIS",
+        "start_date": "2030-03-01",
+        "end_date": "2030-03-03"
+    }
+    return FareCalendarRequestDTO(**{**defaults, **kwargs})
+
+
+def test_cheapest_offer_per_departure_date():
+    async def scenario():
+        gateway = DatedGateway()
+        calendar = await FareCalendarApplicationService(FlightSearchService(gateway)).search_calendar(request())
+        assert calendar.departure_dates == ["2030-03-01", "2030-03-02", "2030-03-03"]
+        assert calendar.stay_days == []
+        assert calendar.prices == [[60.0], [70.0], [80.0]]
+        assert calendar.cheapest.offer_id == "1-0-b"
+        assert gateway.calls == 3
+    
+    asyncio.run(scenario())
+
+
+def test_round_trip_matrix_by_stay_length():
+    async def scenario():
+        service = FareCalendarApplicationService(FlightSearchService(DatedGateway()))
+        calendar = await service.search_calendar(request(end_date="2030-03-02", min_stay_days=3, max_stay_days=4))
+        assert calendar.stay_days == [3, 4]
+        assert calendar.prices == [[63.0, 64.0], [73.0, 74.0]]
+        assert calendar.cells[1].return_date == "2030-03-05"
+    
+    asyncio.run(scenario())
+
+
+def test_fan_out_is_bounded():
+    async def scenario():
+        gateway = DatedGateway()
+        service = FareCalendarApplicationService(FlightSearchService(gateway), max_concurrency=2)
+        await service.search_calendar(request(end_date="2030-03-08"))
+        assert gateway.calls == 8
+        assert gateway.max_in_flight == 2
+    
+    asyncio.run(scenario())
+
+
+def test_failed_days_are_reported_without_failing_the_calendar():
+    async def scenario():
+        service = FareCalendarApplicationService(FlightSearchService(DatedGateway(failing_day=2)))
+        reports = []
+        
+        async def progress(*report):
+            reports.append(report)
+        
+        calendar = await service.search_calendar(request(), progress)
+        assert calendar.prices == [[60.0], [None], [80.0]]
+        assert [error["departure_date"] for error in calendar.errors] == ["2030-03-02"]
+        assert sorted(report[0] for report in reports) == [1, 2, 3]
+        assert {report[1] for report in reports} == {3}
+    
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"start_date": "2030-02-30"},
+    {"end_date": "2030-02-01"},
+    {"min_stay_days": 5, "max_stay_days": 2},
+    {"origin_location_code": "G1"},
+    {"end_date": "2030-12-31"}
+])
+def test_invalid_calendar_requests(kwargs):
+    async def scenario():
+        gateway = DatedGateway()
+        with pytest.raises(InvalidSearchParametersException):
+            await FareCalendarApplicationService(FlightSearchService(gateway)).search_calendar(request(**kwargs))
+        assert gateway.calls == 0
+    
+    asyncio.run(scenario())
+
+
+def test_window_limit_counts_stay_combinations():
+    days = MAX_CALENDAR_SEARCHES // 2
+    
+    async def scenario():
+        service = FareCalendarApplicationService(FlightSearchService(DatedGateway()))
+        with pytest.raises(InvalidSearchParametersException):
+            await service.search_calendar(request(start_date="2030-01-01", end_date=f"2030-01-{days:02d}", min_stay_days=1, max_stay_days=3))
+    
+    asyncio.run(scenario())
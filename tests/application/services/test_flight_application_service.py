@@ -0,0 +1,251 @@
+import asyncio
+import pytest
+from src.application.dto.flight_dto import BatchFlightSearchRequestDTO, FlightSearchRequestDTO, ResultPageRequestDTO
+from src.application.services.flight_application_service import FlightApplicationService, MAX_BATCH_PAIRS
+from src.domain.exceptions.flight_exceptions import (
+    FlightServiceUnavailableException,
+    InvalidSearchParametersException,
+    ResultSetNotFoundException
+)
+from src.domain.services.flight_search_service import FlightSearchService
+from src.domain.services.ranking import RankingEngine
+from src.infrastructure.cache.result_store import InMemoryResultStore
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from tests.factories import FakeFlightGateway, flight_offer
+
+
+class CountingRankingEngine(RankingEngine):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+    
+    def rank(self, flights, options=None, top_k=None):
+        self.calls += 1
+        return super().rank(flights, options, top_k)
+
+
+def offers() -> list:
+    return [
+        flight_offer(id=str(index), price=price, stops=stops, hours=hours)
+        for index, (price, stops, hours) in enumerate([
+            (500, 0, 10), (300, 1, 14), (100, 2, 22), (400, 0, 9), (200, 1, 16)
+        ])
+    ]
+
+
+def service(gateway=None) -> tuple[FlightApplicationService, CountingRankingEngine, FakeFlightGateway]:
+    gateway = gateway or FakeFlightGateway(offers())
+    engine = CountingRankingEngine()
+    store = InMemoryResultStore(TTLLRUCache(max_entries=10, max_bytes=10_000_000, ttl=60))
+    return FlightApplicationService(FlightSearchService(gateway, ranking_engine=engine), store), engine, gateway
+
+
+def request(**kwargs) -> FlightSearchRequestDTO:
+    return FlightSearchRequestDTO(
+        origin_location_code="GRU",
+        destination_location_code="LIS",
+        departure_date="2030-03-01",
+        **kwargs
+    )
+
+
+def ids(page) -> list[str]:
+    return [flight.id for flight in page.flights]
+
+
+def test_pages_through_a_search_without_searching_again():
+    async def scenario():
+        app, engine, gateway = service()
+        first = await app.search_flights(request(sort_by="price", page_size=2))
+        assert ids(first) == ["2", "4"]
+        assert (first.total, first.offset, first.next_offset) == (5, 0, 2)
+        assert engine.calls == 1
+        
+        second = await app.get_results(ResultPageRequestDTO(cursor=first.cursor, offset=2, limit=2))
+        last = await app.get_results(ResultPageRequestDTO(cursor=first.cursor, offset=4, limit=2))
+        assert ids(second) == ["1", "3"]
+        assert ids(last) == ["0"]
+        assert last.next_offset is None
+        assert gateway.calls == 1
+    
+    asyncio.run(scenario())
+
+
+def test_re_ranks_a_stored_search():
+    async def scenario():
+        app, _, gateway = service()
+        first = await app.search_flights(request(sort_by="price"))
+        by_duration = await app.get_results(ResultPageRequestDTO(cursor=first.cursor, sort_by="duration"))
+        assert ids(by_duration) == ["3", "0", "1", "4", "2"]
+        assert gateway.calls == 1
+    
+    asyncio.run(scenario())
+
+
+def test_pareto_cursor_keeps_offers_outside_the_front():
+    async def scenario():
+        app, _, _ = service(FakeFlightGateway(offers() + [flight_offer(id="dominated", price=600, stops=2, hours=30)]))
+        front = await app.search_flights(request(result_mode="pareto"))
+        assert "dominated" not in ids(front)
+        
+        everything = await app.get_results(ResultPageRequestDTO(cursor=front.cursor, result_mode="all"))
+        assert everything.total == 6
+    
+    asyncio.run(scenario())
+
+
+def test_unknown_cursor():
+    async def scenario():
+        app, _, _ = service()
+        with pytest.raises(ResultSetNotFoundException):
+            await app.get_results(ResultPageRequestDTO(cursor="unknown"))
+    
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"sort_by": "cheapest"},
+    {"weights": {"comfort": 1.0}},
+    {"departure_window": "morning"},
+    {"page_size": 0}
+])
+def test_invalid_search_options(kwargs):
+    async def scenario():
+        app, _, gateway = service()
+        reports = []
+        
+        async def progress(*report):
+            reports.append(report)
+        
+        with pytest.raises(InvalidSearchParametersException):
+            await app.search_flights(request(**kwargs), progress)
+        assert gateway.calls == 0
+        assert reports == []
+    
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"offset": -1},
+    {"limit": 0},
+    {"sort_by": "cheapest"},
+    {"departure_window": "25-26"}
+])
+def test_invalid_page_requests(kwargs):
+    async def scenario():
+        app, _, _ = service()
+        cursor = (await app.search_flights(request())).cursor
+        with pytest.raises(InvalidSearchParametersException):
+            await app.get_results(ResultPageRequestDTO(cursor=cursor, **kwargs))
+    
+    asyncio.run(scenario())
+
+
+class RouteGateway(FakeFlightGateway):
+    """Prices offers by destination; searches to `failing` raise"""
+    
+    PRICES = {"LIS": 300.0, "MAD": 200.0, "OPO": 250.0}
+    
+    def __init__(self, failing: str | None = None):
+        super().__init__()
+        self.failing = failing
+        self.routes = []
+    
+    async def search_flights(self, params):
+        self.calls += 1
+        self.routes.append((str(params.origin), str(params.destination)))
+        if str(params.destination) == self.failing:
+            raise FlightServiceUnavailableException("down")
+        price = self.PRICES[str(params.destination)]
+        return [
+            flight_offer(id=f"{params.origin}-{params.destination}-{index}", price=price + index * 10)
+            for index in range(2)
+        ]
+
+
+def matrix_request(origins, destinations, **kwargs) -> BatchFlightSearchRequestDTO:
+    return BatchFlightSearchRequestDTO(
+        origin_location_codes=origins,
+        destination_location_codes=destinations,
+        departure_date="2030-03-01",
+        **kwargs
+    )
+
+
+def test_route_matrix_searches_every_pair_once():
+    async def scenario():
+        gateway = RouteGateway()
+        app, _, _ = service(gateway)
+        result = await app.search_route_matrix(matrix_request(["gru", "GIG", "GRU"], ["LIS", "MAD"], max_ranked_results=3))
+        assert [(pair.origin, pair.destination) for pair in result.pairs] == [
+            ("GRU", "LIS"), ("GRU", "MAD"), ("GIG", "LIS"), ("GIG", "MAD")
+        ]
+        assert sorted(gateway.routes) == sorted((pair.origin, pair.destination) for pair in result.pairs)
+        assert [pair.best.price for pair in result.pairs] == [300.0, 200.0, 300.0, 200.0]
+        assert [flight.price for flight in result.ranking] == [200.0, 200.0, 210.0]
+    
+    asyncio.run(scenario())
+
+
+def test_route_matrix_reports_failed_pairs_without_failing_the_batch():
+    async def scenario():
+        gateway = RouteGateway(failing="MAD")
+        app, _, _ = service(gateway)
+        result = await app.search_route_matrix(matrix_request(["GRU", "LIS"], ["LIS", "MAD", "OPO"]))
+        errors = {(pair.origin, pair.destination): pair.error for pair in result.pairs if pair.error}
+        assert set(errors) == {("GRU", "MAD"), ("LIS", "LIS"), ("LIS", "MAD")}
+        assert errors[("LIS", "LIS")] == "Origin and destination are the same"
+        # Identical origin and destination are never sent to the gateway
+        assert gateway.calls == 5
+        assert {flight.id.split("-")[1] for flight in result.ranking} == {"LIS", "OPO"}
+    
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("origins, destinations", [
+    ([], ["LIS"]),
+    ([f"A{index:02d}" for index in range(MAX_BATCH_PAIRS + 1)], ["LIS"])
+])
+def test_invalid_route_matrix(origins, destinations):
+    async def scenario():
+        app, _, gateway = service()
+        with pytest.raises(InvalidSearchParametersException):
+            await app.search_route_matrix(matrix_request(origins, destinations))
+        assert gateway.calls == 0
+    
+    asyncio.run(scenario())
+
+
+def test_search_reports_start_and_best_offer():
+    async def scenario():
+        app, _, _ = service()
+        reports = []
+        
+        async def progress(*report):
+            reports.append(report)
+        
+        await app.search_flights(request(sort_by="price"), progress)
+        assert [report[:2] for report in reports] == [(0, 1), (1, 1)]
+        assert reports[0][3] is None
+        assert reports[1][2] == "Found 5 offers"
+        assert reports[1][3]["id"] == "2"
+    
+    asyncio.run(scenario())
+
+
+def test_route_matrix_streams_each_pair():
+    async def scenario():
+        app, _, _ = service(RouteGateway(failing="MAD"))
+        reports = []
+        
+        async def progress(*report):
+            reports.append(report)
+        
+        await app.search_route_matrix(matrix_request(["GRU"], ["LIS", "MAD"]), progress)
+        assert sorted(report[0] for report in reports) == [1, 2]
+        assert {report[1] for report in reports} == {2}
+        by_route = {report[2].split(":")[0]: report for report in reports}
+        assert by_route["GRU -> LIS"][3]["price"] == 300.0
+        assert by_route["GRU -> MAD"][3] is None
+    
+    asyncio.run(scenario())
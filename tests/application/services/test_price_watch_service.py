@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime
+import pytest
+from src.application.dto.price_watch_dto import WatchRouteRequestDTO
+from src.application.services.price_watch_service import PriceWatchApplicationService
+from src.application.services.request_budget import RequestBudget
+from src.domain.exceptions.flight_exceptions import FlightServiceUnavailableException, InvalidSearchParametersException
+from src.domain.services.flight_search_service import FlightSearchService
+from src.infrastructure.watch.sqlite_watch_store import SQLiteWatchStore
+from tests.factories import FakeClock, FakeFlightGateway, flight_offer
+
+NOW = datetime(2030, 1, 1).timestamp()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteWatchStore(tmp_path / "watches.db", history_limit=10)
+    yield store
+    store.close()
+
+
+def service(store, gateway, budget_per_hour: float = 3600, burst: int = 2, clock: FakeClock | None = None) -> PriceWatchApplicationService:
+    clock = clock or FakeClock(NOW)
+    return PriceWatchApplicationService(
+        FlightSearchService(gateway),
+        store,
+        RequestBudget(budget_per_hour, burst=burst, clock=clock),
+        jitter=0.0,
+        tracked_offers=2,
+        clock=clock
+    )
+
+
+def request(**kwargs) -> WatchRouteRequestDTO:
+    return WatchRouteRequestDTO(**{
+        "origin_location_code": "gru ",
+        "destination_location_code": "lis",
+        "departure_date": "2030-03-01",
+        **kwargs
+    })
+
+
+def test_first_check_then_diff(store):
+    async def scenario():
+        clock = FakeClock(NOW)
+        gateway = FakeFlightGateway([
+            flight_offer(id="1", number="82", price=300),
+            flight_offer(id="2", number="90", price=200),
+            flight_offer(id="3", number="99", price=900)
+        ])
+        watches = service(store, gateway, clock=clock)
+        
+        created = await watches.watch_route(request(interval_minutes=60))
+        assert created.route == "GRU-LIS"
+        assert created.min_price == 200
+        # Only the cheapest `tracked_offers` offers are kept
+        assert created.last_check.offers == 2
+        
+        gateway.offers = [flight_offer(id="1", number="82", price=250), flight_offer(id="4", number="77", price=150)]
+        clock.advance(3600)
+        assert await watches.run_due() == 3600
+        
+        history = await watches.get_price_history(created.watch_id)
+        latest = history.checks[0]
+        assert len(history.checks) == 2
+        assert latest.min_price_delta == -50
+        assert list(latest.new_offers.values()) == [150]
+        assert list(latest.removed_offers.values()) == [200]
+        assert [(change["old"], change["new"]) for change in latest.price_changes] == [(300, 250)]
+        assert gateway.calls == 2
+    
+    asyncio.run(scenario())
+
+
+def test_watch_waits_for_budget(store):
+    async def scenario():
+        clock = FakeClock(NOW)
+        gateway = FakeFlightGateway()
+        watches = service(store, gateway, budget_per_hour=1, burst=1, clock=clock)
+        
+        first = await watches.watch_route(request())
+        second = await watches.watch_route(request())
+        assert first.last_check is not None
+        assert second.last_check is None
+        assert gateway.calls == 1
+        
+        # The second watch stays due until the budget refills
+        assert await watches.run_due() == pytest.approx(3600)
+        clock.advance(3600)
+        await watches.run_due()
+        assert gateway.calls == 2
+        assert (await watches.get_price_history(second.watch_id)).watch.checks == 1
+    
+    asyncio.run(scenario())
+
+
+def test_failed_check_is_recorded(store):
+    async def scenario():
+        gateway = FakeFlightGateway()
+        gateway.error = FlightServiceUnavailableException("Amadeus is down")
+        watches = service(store, gateway)
+        
+        created = await watches.watch_route(request())
+        assert created.last_error == "Amadeus is down"
+        assert created.last_check.error == "Amadeus is down"
+        assert watches.stats()["failures"] == 1
+    
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("kwargs", [{"interval_minutes": 1}, {"departure_date": "2000-01-01"}, {"adults": 0}])
+def test_invalid_watches(store, kwargs):
+    async def scenario():
+        watches = service(store, FakeFlightGateway())
+        with pytest.raises(InvalidSearchParametersException):
+            await watches.watch_route(request(**kwargs))
+    
+    asyncio.run(scenario())
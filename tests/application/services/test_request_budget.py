@@ -0,0 +1,31 @@
+from src.application.services.request_budget import RequestBudget
+from tests.factories import FakeClock
+
+
+def test_burst_then_refill():
+    clock = FakeClock()
+    budget = RequestBudget(per_hour=40, clock=clock)
+    assert budget.available() == 10
+    assert all(budget.try_acquire() for _ in range(10))
+    assert not budget.try_acquire()
+    assert budget.wait_time() == 90.0
+    
+    clock.advance(90)
+    assert budget.try_acquire()
+    assert budget.stats() == {"available": 0, "burst": 10, "spent": 11, "denied": 1}
+
+
+def test_refill_is_capped_at_burst():
+    clock = FakeClock()
+    budget = RequestBudget(per_hour=3600, burst=5, clock=clock)
+    budget.try_acquire()
+    clock.advance(3600)
+    assert budget.available() == 5
+
+
+def test_zero_budget_never_allows_requests():
+    clock = FakeClock()
+    budget = RequestBudget(per_hour=0, clock=clock)
+    clock.advance(86400)
+    assert not budget.try_acquire()
+    assert budget.wait_time() == float("inf")
@@ -0,0 +1,82 @@
+import asyncio
+import httpx
+from benchmarks.fake_amadeus import FakeOptions, create_app
+from src.domain.vo.search_params import CitySearchParams
+from src.infrastructure.config.settings import HttpClientConfig
+from src.infrastructure.external.amadeus_auth import AmadeusAuthService
+from src.infrastructure.external.amadeus_client import AmadeusClient
+from src.infrastructure.external.http_client import SharedHttpClient
+from src.infrastructure.gateways.amadeus_city_gateway import AmadeusCityGateway
+from src.infrastructure.gateways.amadeus_flight_gateway import AmadeusFlightGateway
+from tests.factories import search_params
+
+FAKE_BASE = "http://fake-amadeus"
+
+
+class InProcessHttpClient(SharedHttpClient):
+    """Shared client that serves requests from an ASGI application"""
+    
+    def __init__(self, app):
+        super().__init__(HttpClientConfig())
+        self._app = app
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.ASGITransport(self._app), base_url=FAKE_BASE)
+
+
+def fake(**options) -> InProcessHttpClient:
+    return InProcessHttpClient(create_app(FakeOptions(**{"latency_ms": 0, "jitter_ms": 0, **options})))
+
+
+def test_real_gateways_run_against_the_fake(monkeypatch):
+    monkeypatch.setenv("AMADEUS_API_BASE", FAKE_BASE)
+    
+    async def scenario():
+        http_client = fake(offers=30)
+        client = AmadeusClient(http_client, AmadeusAuthService(http_client))
+        flights = await AmadeusFlightGateway(client).search_flights(search_params(max_results=20))
+        cities = await AmadeusCityGateway(client).search_cities(CitySearchParams(keyword="Gotham"))
+        
+        assert len(flights) == 20
+        assert all(str(flight.segments[0].departure) == "GRU" for flight in flights)
+        assert [city.iata_code for city in cities] == ["GOT"]
+        
+        stats = (await http_client.client.get("/_stats")).json()
+        assert stats == {"token 200": 1, "flight-offers 200": 1, "cities 200": 1}
+        await http_client.client.post("/_reset")
+        assert (await http_client.client.get("/_stats")).json() == {}
+        await http_client.aclose()
+    
+    asyncio.run(scenario())
+
+
+def test_payloads_are_deterministic_per_route():
+    async def scenario():
+        http_client = fake(offers=5)
+        
+        async def offers(destination: str) -> bytes:
+            query = {"originLocationCode": "GRU", "destinationLocationCode": destination, "departureDate": "2030-03-01"}
+            return (await http_client.client.get("/v2/shopping/flight-offers", params=query)).content
+        
+        assert await offers("LIS") == await offers("LIS")
+        assert await offers("LIS") != await offers("MAD")
+        await http_client.aclose()
+    
+    asyncio.run(scenario())
+
+
+def test_injects_throttling_and_errors():
+    async def scenario():
+        throttled = fake(throttle_rate=1.0, retry_after=0.5)
+        response = await throttled.client.get("/v1/reference-data/locations/cities", params={"keyword": "Paris"})
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "0.5"
+        
+        failing = fake(error_rate=1.0)
+        response = await failing.client.get("/v1/reference-data/locations/cities", params={"keyword": "Paris"})
+        assert response.status_code == 500
+        assert (await failing.client.get("/_stats")).json() == {"cities 500": 1}
+        await throttled.aclose()
+        await failing.aclose()
+    
+    asyncio.run(scenario())
@@ -0,0 +1,18 @@
+import pytest
+from src.infrastructure.config import settings
+
+
+@pytest.fixture(autouse=True)
+def app_config(monkeypatch, tmp_path):
+    """Isolates each test's configuration: fake credentials and data files under tmp_path
+    
+    The configuration is read on first use, so tests may set more variables
+    before building anything that calls `get_config`.
+    """
+    monkeypatch.setenv("AMADEUS_API_KEY", "test-key")
+    monkeypatch.setenv("AMADEUS_API_SECRET", "test-secret")
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(settings, "_config", None)
+    yield
+    monkeypatch.setattr(settings, "_config", None)
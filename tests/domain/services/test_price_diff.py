@@ -0,0 +1,39 @@
+from src.domain.services.price_diff import diff_snapshots, offer_signature, snapshot_offers
+from tests.factories import flight_offer
+
+
+def test_signature_names_flights_and_departures():
+    offer = flight_offer(stops=1, hours=10, carrier="TP", number="82")
+    assert offer_signature(offer) == "TP82 2030-03-01T10:00 / TP82 2030-03-01T15:00"
+
+
+def test_signature_ignores_offer_id():
+    assert offer_signature(flight_offer(id="1", number="82")) == offer_signature(flight_offer(id="2", number="82"))
+
+
+def test_snapshot_keeps_lowest_price_per_itinerary():
+    flights = [
+        flight_offer(id="1", number="82", price=300),
+        flight_offer(id="2", number="82", price=250),
+        flight_offer(id="3", number="90", price=400)
+    ]
+    assert sorted(snapshot_offers(flights).values()) == [250, 400]
+
+
+def test_diff():
+    previous = {"kept": 100.0, "repriced": 200.0, "gone": 300.0}
+    current = {"kept": 100.0, "repriced": 180.0, "new": 90.0}
+    point = diff_snapshots(previous, current, checked_at=5.0, currency="EUR")
+    assert point.checked_at == 5.0
+    assert (point.min_price, point.previous_min_price) == (90.0, 100.0)
+    assert point.offers == 3
+    assert point.new_offers == {"new": 90.0}
+    assert point.removed_offers == {"gone": 300.0}
+    assert point.price_changes == {"repriced": (200.0, 180.0)}
+    assert point.changed
+
+
+def test_unchanged_and_empty_snapshots():
+    assert not diff_snapshots({"a": 1.0}, {"a": 1.0}, 0.0, None).changed
+    point = diff_snapshots({}, {}, 0.0, None)
+    assert (point.min_price, point.previous_min_price, point.offers) == (None, None, 0)
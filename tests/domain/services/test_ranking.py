@@ -0,0 +1,151 @@
+import random
+import pytest
+from src.domain.services import ranking
+from src.domain.services.ranking import RankingEngine, duration_minutes, total_minutes
+from src.domain.vo.ranking_options import RankingOptions, SORT_OPTIONS
+from tests.factories import flight_offer
+
+
+def ids(flights) -> list[str]:
+    return [flight.id for flight in flights]
+
+
+def random_offers(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        flight_offer(
+            id=str(index),
+            # Coarse prices so that ties exercise the secondary keys
+            price=float(rng.randint(1, 20) * 50),
+            stops=rng.randint(0, 2),
+            hours=rng.randint(6, 20),
+            departure_hour=rng.randint(0, 23),
+            seats=rng.randint(1, 9)
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("value, minutes", [
+    ("PT10H30M", 630),
+    ("PT45M", 45),
+    ("PT2H", 120),
+    ("P1DT1H", 1500),
+    ("bogus", 0)
+])
+def test_duration_minutes(value, minutes):
+    assert duration_minutes(value) == minutes
+
+
+def test_total_minutes_falls_back_to_arrival_minus_departure():
+    assert total_minutes(flight_offer(stops=1, hours=12)) == 720.0
+
+
+def test_best_value_puts_direct_flights_first():
+    flights = [
+        flight_offer(id="cheap-stop", price=100, stops=1),
+        flight_offer(id="direct", price=300),
+        flight_offer(id="cheaper-direct", price=200)
+    ]
+    assert ids(RankingEngine().rank(flights)) == ["cheaper-direct", "direct", "cheap-stop"]
+
+
+@pytest.mark.parametrize("sort_by, expected", [
+    ("price", ["a", "b", "c"]),
+    ("duration", ["c", "b", "a"]),
+    ("stops", ["b", "c", "a"]),
+    ("departure", ["b", "a", "c"])
+])
+def test_sort_modes(sort_by, expected):
+    flights = [
+        flight_offer(id="a", price=100, stops=2, hours=20, departure_hour=5),
+        flight_offer(id="b", price=200, stops=0, hours=12, departure_hour=9),
+        flight_offer(id="c", price=300, stops=1, hours=8, departure_hour=20)
+    ]
+    options = RankingOptions(sort_by=sort_by, departure_window=(8, 12))
+    assert ids(RankingEngine().rank(flights, options)) == expected
+
+
+def test_ties_break_on_price():
+    flights = [
+        flight_offer(id="expensive", price=300, hours=8),
+        flight_offer(id="cheap", price=100, hours=8)
+    ]
+    assert ids(RankingEngine().rank(flights, RankingOptions(sort_by="duration"))) == ["cheap", "expensive"]
+
+
+def test_departure_window_wraps_midnight():
+    flights = [
+        flight_offer(id="noon", departure_hour=12),
+        flight_offer(id="late", departure_hour=23),
+        flight_offer(id="early", departure_hour=3)
+    ]
+    options = RankingOptions(sort_by="departure", departure_window=(22, 2))
+    assert ids(RankingEngine().rank(flights, options))[:2] == ["late", "early"]
+
+
+def test_weighted_follows_weights():
+    flights = [
+        flight_offer(id="cheap-slow", price=100, hours=20),
+        flight_offer(id="pricey-fast", price=400, hours=6)
+    ]
+    engine = RankingEngine()
+    by_price = RankingOptions(sort_by="weighted", weights={"price": 1.0, "duration": 0.1})
+    by_duration = RankingOptions(sort_by="weighted", weights={"price": 0.1, "duration": 1.0})
+    assert ids(engine.rank(flights, by_price)) == ["cheap-slow", "pricey-fast"]
+    assert ids(engine.rank(flights, by_duration)) == ["pricey-fast", "cheap-slow"]
+
+
+def test_weighted_prefers_more_seats():
+    flights = [flight_offer(id="few", seats=1), flight_offer(id="many", seats=9)]
+    options = RankingOptions(sort_by="weighted", weights={"seats": 1.0})
+    assert ids(RankingEngine().rank(flights, options)) == ["many", "few"]
+
+
+def test_top_k_matches_the_full_ranking():
+    flights = random_offers(40)
+    engine = RankingEngine(vectorize=False)
+    for sort_by in SORT_OPTIONS:
+        options = RankingOptions(sort_by=sort_by, departure_window=(6, 12))
+        full = engine.rank(flights, options)
+        for top_k in (1, 5, 39, 40, 100):
+            assert engine.rank(flights, options, top_k=top_k) == full[:top_k]
+
+
+@pytest.mark.parametrize("sort_by", SORT_OPTIONS)
+def test_vectorized_and_python_paths_agree(sort_by):
+    pytest.importorskip("numpy")
+    flights = random_offers(3 * ranking.VECTORIZE_THRESHOLD)
+    options = RankingOptions(
+        sort_by=sort_by,
+        weights={"price": 1.0, "duration": 0.5, "stops": 0.25, "seats": 0.125},
+        departure_window=(6, 12)
+    )
+    vectorized, python = RankingEngine(vectorize=True), RankingEngine(vectorize=False)
+    assert ids(vectorized.rank(flights, options)) == ids(python.rank(flights, options))
+    for top_k in (1, 10, 100):
+        assert ids(vectorized.rank(flights, options, top_k=top_k)) == ids(python.rank(flights, options, top_k=top_k))
+
+
+def test_falls_back_without_numpy(monkeypatch):
+    monkeypatch.setattr(ranking, "load_numpy", lambda: None)
+    flights = random_offers(2 * ranking.VECTORIZE_THRESHOLD)
+    assert RankingEngine(vectorize=True).rank(flights) == RankingEngine(vectorize=False).rank(flights)
+
+
+@pytest.mark.parametrize("sort_by", [sort_by for sort_by in SORT_OPTIONS if sort_by != "weighted"])
+def test_row_key_orders_like_rank(sort_by):
+    flights = random_offers(30)
+    engine = RankingEngine()
+    options = RankingOptions(sort_by=sort_by, departure_window=(18, 22))
+    assert sorted(flights, key=engine.row_key(options)) == engine.rank(flights, options)
+
+
+def test_row_key_is_none_when_order_depends_on_the_set():
+    engine = RankingEngine()
+    assert engine.row_key(RankingOptions(sort_by="weighted")) is None
+    assert engine.row_key(RankingOptions(result_mode="pareto")) is None
+
+
+def test_empty():
+    assert RankingEngine().rank([]) == []
@@ -0,0 +1,48 @@
+import random
+import pytest
+from src.domain.services.ranking import RankingEngine
+from src.domain.vo.ranking_options import RankingOptions
+from src.domain.services.skyline import skyline
+from tests.factories import flight_offer
+
+
+def brute_force(points) -> list[int]:
+    def dominates(a, b):
+        return a != b and all(x <= y for x, y in zip(a, b))
+    return [i for i, point in enumerate(points) if not any(dominates(other, point) for other in points)]
+
+
+@pytest.mark.parametrize("dimensions", [1, 2, 3, 4, 5])
+def test_matches_brute_force(dimensions):
+    rng = random.Random(dimensions)
+    for _ in range(50):
+        # Small integer ranges produce plenty of ties and duplicates
+        points = [tuple(float(rng.randint(0, 6)) for _ in range(dimensions)) for _ in range(rng.randint(1, 40))]
+        assert skyline(points) == brute_force(points), points
+
+
+def test_keeps_identical_points():
+    assert skyline([(1.0, 2.0), (1.0, 2.0), (2.0, 3.0)]) == [0, 1]
+
+
+def test_equal_on_one_dimension():
+    assert skyline([(1.0, 5.0), (1.0, 3.0), (2.0, 3.0)]) == [1]
+
+
+def test_empty():
+    assert skyline([]) == []
+
+
+def test_pareto_front_of_offers():
+    flights = [
+        flight_offer(id="cheap", price=100, stops=2, hours=20),
+        flight_offer(id="fast", price=400, stops=0, hours=8),
+        flight_offer(id="balanced", price=200, stops=1, hours=12),
+        flight_offer(id="dominated", price=250, stops=1, hours=14)
+    ]
+    engine = RankingEngine()
+    options = RankingOptions(sort_by="price", result_mode="pareto")
+    assert [flight.id for flight in engine.rank(flights, options)] == ["cheap", "balanced", "fast"]
+    
+    by_price = RankingOptions(result_mode="pareto", pareto_criteria=("price",))
+    assert [flight.id for flight in engine.pareto_front(flights, by_price)] == ["cheap"]
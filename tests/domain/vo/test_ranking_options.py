@@ -0,0 +1,38 @@
+import pytest
+from src.domain.vo.ranking_options import RankingOptions
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"sort_by": "cheapest"},
+    {"weights": {"comfort": 1.0}},
+    {"weights": {"price": -1.0}},
+    {"result_mode": "best"},
+    {"pareto_criteria": ()},
+    {"pareto_criteria": ("price", "legroom")},
+    {"departure_window": (6, 25)},
+    {"departure_window": (-1, 12)}
+])
+def test_invalid_options(kwargs):
+    with pytest.raises(ValueError):
+        RankingOptions(**kwargs)
+
+
+@pytest.mark.parametrize("value, window", [
+    ("06-12", (6, 12)),
+    ("22-2", (22, 2)),
+    ("", None),
+    (None, None)
+])
+def test_parse_window(value, window):
+    assert RankingOptions.parse_window(value) == window
+
+
+@pytest.mark.parametrize("value", ["6", "6-12-18", "morning"])
+def test_parse_invalid_window(value):
+    with pytest.raises(ValueError):
+        RankingOptions.parse_window(value)
+
+
+def test_effective_weights():
+    assert RankingOptions().effective_weights() == {"price": 1.0}
+    assert RankingOptions(weights={"price": 0.0, "stops": 2.0}).effective_weights() == {"stops": 2.0}
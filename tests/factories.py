@@ -0,0 +1,99 @@
+"""Builders and fakes shared by the unit tests"""
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import List
+import httpx
+from src.domain.entities.flight import FlightOffer, FlightSegment
+from src.domain.gateways.flight_gateway import FlightGateway
+from src.domain.vo.location_code import LocationCode
+from src.domain.vo.search_params import FlightSearchParams
+from src.infrastructure.config.settings import HttpClientConfig
+from src.infrastructure.external.http_client import SharedHttpClient
+
+
+def search_params(origin: str = "GRU", destination: str = "LIS", departure_date: date = date(2030, 3, 1), **kwargs) -> FlightSearchParams:
+    return FlightSearchParams(
+        origin=LocationCode.of(origin),
+        destination=LocationCode.of(destination),
+        departure_date=departure_date,
+        **kwargs
+    )
+
+
+def flight_offer(
+    id: str = "1",
+    price: float = 100.0,
+    stops: int = 0,
+    hours: int = 10,
+    departure_hour: int = 10,
+    seats: int = 5,
+    carrier: str = "TP",
+    number: str | None = None,
+    currency: str = "EUR"
+) -> FlightOffer:
+    """An offer with `stops` connections whose whole trip takes `hours`"""
+    departure = datetime(2030, 3, 1, departure_hour)
+    legs = stops + 1
+    leg = timedelta(hours=hours) / legs
+    segments = [
+        FlightSegment(
+            departure=LocationCode.of("GRU" if index == 0 else "MAD"),
+            arrival=LocationCode.of("LIS" if index == legs - 1 else "MAD"),
+            departure_time=departure + leg * index,
+            arrival_time=departure + leg * (index + 1),
+            carrier_code=carrier,
+            flight_number=number or f"{id}{index}"
+        )
+        for index in range(legs)
+    ]
+    return FlightOffer(
+        id=id,
+        segments=segments,
+        price=price,
+        currency=currency,
+        seats_available=seats,
+        travel_class="ECONOMY",
+        validating_airline_codes=[carrier]
+    )
+
+
+class FakeFlightGateway(FlightGateway):
+    """Returns canned offers, counting calls; `delay` keeps calls in flight"""
+    
+    def __init__(self, offers: List[FlightOffer] | None = None, delay: float = 0.0):
+        self.offers = offers if offers is not None else [flight_offer()]
+        self.delay = delay
+        self.error: Exception | None = None
+        self.calls = 0
+    
+    async def search_flights(self, params: FlightSearchParams) -> List[FlightOffer]:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return list(self.offers)
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic / time.time"""
+    
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class MockHttpClient(SharedHttpClient):
+    """Shared client whose requests are answered by `handler` (sync or async)"""
+    
+    def __init__(self, handler):
+        super().__init__(HttpClientConfig())
+        self._handler = handler
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._handler))
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from src.application.services.request_budget import RequestBudget
+from src.domain.exceptions.flight_exceptions import FlightServiceUnavailableException
+from src.infrastructure.cache import query_log
+from src.infrastructure.cache.cache_warmer import CacheWarmer
+from src.infrastructure.cache.query_log import SQLiteQueryLog
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from src.infrastructure.gateways.cached_flight_gateway import CachedFlightGateway
+from tests.factories import FakeClock, FakeFlightGateway, search_params
+
+NOW = datetime(2030, 1, 1).timestamp()
+POPULAR = ("LIS", "MAD", "OPO")
+
+
+@pytest.fixture
+def monotonic(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(query_log, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture
+def log(tmp_path, monotonic):
+    log = SQLiteQueryLog(tmp_path / "queries.db", half_life=3600, max_entries=100, clock=FakeClock(NOW))
+    for destination in POPULAR:
+        log.record(search_params(destination=destination))
+    yield log
+    log.close()
+
+
+class Upstream:
+    """Counts how often the warmer builds the gateway"""
+    
+    def __init__(self, ttl: float = 600):
+        self.gateway = FakeFlightGateway()
+        self.cached = CachedFlightGateway(self.gateway, TTLLRUCache(max_entries=100, max_bytes=10_000_000, ttl=ttl))
+        self.builds = 0
+    
+    def __call__(self) -> CachedFlightGateway:
+        self.builds += 1
+        return self.cached
+
+
+def warmer(log: SQLiteQueryLog, upstream: Upstream, per_hour: float = 100, interval: float = 60) -> CacheWarmer:
+    return CacheWarmer(log, upstream, RequestBudget(per_hour, clock=FakeClock()), interval=interval, idle_seconds=5)
+
+
+def test_waits_until_idle(log, monotonic):
+    async def scenario():
+        upstream = Upstream()
+        cache_warmer = warmer(log, upstream)
+        assert await cache_warmer.warm() == 0
+        assert cache_warmer.skipped_busy == 1
+        assert upstream.builds == 0
+        
+        monotonic.advance(5)
+        assert await cache_warmer.warm() == 3
+        assert upstream.gateway.calls == 3
+    
+    asyncio.run(scenario())
+
+
+def test_prefetched_searches_are_served_from_cache(log, monotonic):
+    async def scenario():
+        upstream = Upstream()
+        cache_warmer = warmer(log, upstream)
+        monotonic.advance(5)
+        await cache_warmer.warm()
+        
+        # Fresh entries are not fetched again
+        assert await cache_warmer.warm() == 0
+        for destination in POPULAR:
+            await upstream.cached.search_flights(search_params(destination=destination))
+        assert upstream.gateway.calls == 3
+    
+    asyncio.run(scenario())
+
+
+def test_refreshes_entries_going_stale_before_next_pass(log, monotonic):
+    async def scenario():
+        upstream = Upstream(ttl=30)
+        cache_warmer = warmer(log, upstream, interval=60)
+        monotonic.advance(5)
+        await cache_warmer.warm()
+        assert await cache_warmer.warm() == 3
+    
+    asyncio.run(scenario())
+
+
+def test_spends_the_budget(log, monotonic):
+    async def scenario():
+        upstream = Upstream()
+        # A budget of 4 per hour allows one request at once
+        cache_warmer = warmer(log, upstream, per_hour=4)
+        monotonic.advance(5)
+        assert await cache_warmer.warm() == 1
+        assert cache_warmer.stats()["budget"]["denied"] == 1
+    
+    asyncio.run(scenario())
+
+
+def test_failures_do_not_stop_a_pass(log, monotonic):
+    async def scenario():
+        upstream = Upstream()
+        upstream.gateway.error = FlightServiceUnavailableException("Amadeus is down")
+        cache_warmer = warmer(log, upstream)
+        monotonic.advance(5)
+        assert await cache_warmer.warm() == 0
+        assert cache_warmer.errors == 3
+        assert upstream.gateway.calls == 3
+    
+    asyncio.run(scenario())
+
+
+def test_aclose_saves_recorded_searches(log, monotonic):
+    async def scenario():
+        cache_warmer = warmer(log, Upstream())
+        await cache_warmer.aclose()
+        assert len(await log.hottest(10)) == 3
+    
+    asyncio.run(scenario())
@@ -0,0 +1,111 @@
+import asyncio
+import math
+from datetime import date, datetime
+from types import SimpleNamespace
+from src.infrastructure.cache import query_log
+from src.infrastructure.cache.query_log import SQLiteQueryLog
+from tests.factories import FakeClock, search_params
+
+NOW = datetime(2030, 1, 1).timestamp()
+HALF_LIFE = 3600.0
+
+
+def open_log(tmp_path, clock: FakeClock, max_entries: int = 100) -> SQLiteQueryLog:
+    return SQLiteQueryLog(tmp_path / "queries.db", half_life=HALF_LIFE, max_entries=max_entries, clock=clock)
+
+
+def destinations(params_list) -> list[str]:
+    return [str(params.destination) for params in params_list]
+
+
+def test_ranks_by_decayed_popularity(tmp_path):
+    async def scenario():
+        clock = FakeClock(NOW)
+        log = open_log(tmp_path, clock)
+        for _ in range(3):
+            log.record(search_params(destination="LIS"))
+        log.record(search_params(destination="MAD"))
+        await log.flush()
+        assert destinations(await log.hottest(10)) == ["LIS", "MAD"]
+        
+        # Two half-lives later LIS is worth 0.75 searches and MAD 0.25 + 2
+        clock.advance(2 * HALF_LIFE)
+        log.record(search_params(destination="MAD"))
+        log.record(search_params(destination="MAD"))
+        await log.flush()
+        assert destinations(await log.hottest(10, min_score=0)) == ["MAD", "LIS"]
+        assert destinations(await log.hottest(10, min_score=1.0)) == ["MAD"]
+        assert destinations(await log.hottest(1, min_score=0)) == ["MAD"]
+        log.close()
+    
+    asyncio.run(scenario())
+
+
+def test_scores_add_up_across_flushes(tmp_path):
+    async def scenario():
+        clock = FakeClock(NOW)
+        log = open_log(tmp_path, clock)
+        log.record(search_params())
+        await log.flush()
+        log.record(search_params())
+        await log.flush()
+        assert len(await log.hottest(10, min_score=1.99)) == 1
+        assert await log.hottest(10, min_score=2.01) == []
+        assert log.stats() == {"recorded": 2, "pending": 0, "flushes": 2, "errors": 0}
+        log.close()
+    
+    asyncio.run(scenario())
+
+
+def test_prunes_to_max_entries_and_past_departures(tmp_path):
+    async def scenario():
+        clock = FakeClock(NOW)
+        log = open_log(tmp_path, clock, max_entries=2)
+        for destination, searches in (("LIS", 3), ("MAD", 2), ("OPO", 1)):
+            for _ in range(searches):
+                log.record(search_params(destination=destination))
+        await log.flush()
+        assert destinations(await log.hottest(10, min_score=0)) == ["LIS", "MAD"]
+        
+        log.record(search_params(destination="MAD", departure_date=date(2030, 6, 1)))
+        clock.now = datetime(2030, 4, 1).timestamp()
+        await log.flush()
+        assert [params.departure_date for params in await log.hottest(10, min_score=0)] == [date(2030, 6, 1)]
+        log.close()
+    
+    asyncio.run(scenario())
+
+
+def test_survives_restarts(tmp_path):
+    async def scenario():
+        clock = FakeClock(NOW)
+        log = open_log(tmp_path, clock)
+        params = search_params(return_date=date(2030, 3, 8), adults=2, non_stop=True)
+        log.record(params)
+        await log.flush()
+        log.close()
+        assert await open_log(tmp_path, clock).hottest(10) == [params]
+    
+    asyncio.run(scenario())
+
+
+def test_idle_for(tmp_path, monkeypatch):
+    monotonic = FakeClock()
+    monkeypatch.setattr(query_log, "time", SimpleNamespace(monotonic=monotonic))
+    log = open_log(tmp_path, FakeClock(NOW))
+    assert log.idle_for() == math.inf
+    log.record(search_params())
+    monotonic.advance(7)
+    assert log.idle_for() == 7
+
+
+def test_storage_failures_only_lose_popularity(tmp_path):
+    async def scenario():
+        (tmp_path / "queries.db").mkdir()
+        log = open_log(tmp_path, FakeClock(NOW))
+        log.record(search_params())
+        await log.flush()
+        assert await log.hottest(10) == []
+        assert log.stats()["errors"] == 2
+    
+    asyncio.run(scenario())
@@ -0,0 +1,66 @@
+import asyncio
+from dataclasses import replace
+from src.domain.vo.ranking_options import RankingOptions
+from src.infrastructure.cache.result_store import InMemoryResultStore, SharedResultStore
+from src.infrastructure.cache.sqlite_cache import SQLiteCache
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from tests.factories import flight_offer, search_params
+
+
+def local_store() -> InMemoryResultStore:
+    return InMemoryResultStore(TTLLRUCache(max_entries=10, max_bytes=10_000_000, ttl=60))
+
+
+def test_in_memory_round_trip():
+    async def scenario():
+        store = local_store()
+        flights = [flight_offer(id="1"), flight_offer(id="2", price=50)]
+        saved = await store.save(search_params(), flights, RankingOptions())
+        loaded = await store.load(saved.cursor)
+        assert loaded.flights == flights
+        assert loaded.params == search_params()
+        assert await store.load("unknown") is None
+    
+    asyncio.run(scenario())
+
+
+def test_cursors_are_unique():
+    async def scenario():
+        store = local_store()
+        cursors = {(await store.save(search_params(), [], RankingOptions())).cursor for _ in range(20)}
+        assert len(cursors) == 20
+    
+    asyncio.run(scenario())
+
+
+def test_shared_store_adopts_offers_from_another_worker(tmp_path):
+    async def scenario():
+        cache = SQLiteCache(tmp_path / "cache.db", max_bytes=10_000_000)
+        first = SharedResultStore(local_store(), cache, ttl=60)
+        second = SharedResultStore(local_store(), cache, ttl=60)
+        
+        offer = flight_offer(id="1", stops=1)
+        offer = replace(offer, segments=[replace(offer.segments[0], aircraft="333", duration="PT5H")] + offer.segments[1:])
+        params = search_params(return_date=search_params().departure_date, adults=2, max_price=900)
+        ranking = RankingOptions(
+            sort_by="weighted",
+            weights={"price": 1.0},
+            departure_window=(6, 12),
+            result_mode="pareto",
+            pareto_criteria=("price", "stops")
+        )
+        saved = await first.save(params, [offer, flight_offer(id="2")], ranking)
+        
+        loaded = await second.load(saved.cursor)
+        assert loaded.flights == saved.flights
+        assert loaded.params == params
+        assert loaded.ranking == ranking
+        assert second.stats()["adopted"] == 1
+        
+        # Adopted sets are then served from memory
+        await second.load(saved.cursor)
+        assert second.stats()["adopted"] == 1
+        assert await second.load("unknown") is None
+        cache.close()
+    
+    asyncio.run(scenario())
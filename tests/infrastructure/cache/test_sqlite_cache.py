@@ -0,0 +1,98 @@
+import asyncio
+import os
+import sqlite3
+import stat
+from types import SimpleNamespace
+from src.infrastructure.cache import sqlite_cache
+from src.infrastructure.cache.sqlite_cache import SQLiteCache
+from tests.factories import FakeClock
+
+
+def test_round_trip_and_invalidate(tmp_path):
+    async def scenario():
+        cache = SQLiteCache(tmp_path / "cache.db", max_bytes=10_000)
+        await cache.put("offers", "GRU-LIS", {"data": [1, 2.5, "x"], "meta": None}, ttl=60)
+        assert await cache.get("offers", "GRU-LIS") == {"data": [1, 2.5, "x"], "meta": None}
+        assert await cache.get("cities", "GRU-LIS") is None
+        
+        await cache.invalidate("offers", "GRU-LIS")
+        assert await cache.get("offers", "GRU-LIS") is None
+        assert (cache.hits, cache.misses, cache.writes) == (1, 2, 1)
+        cache.close()
+    
+    asyncio.run(scenario())
+
+
+def test_entries_expire(monkeypatch, tmp_path):
+    clock = FakeClock(1_000_000.0)
+    monkeypatch.setattr(sqlite_cache, "time", SimpleNamespace(time=clock))
+    
+    async def scenario():
+        cache = SQLiteCache(tmp_path / "cache.db", max_bytes=10_000)
+        await cache.put("offers", "short", 1, ttl=10)
+        await cache.put("offers", "long", 2, ttl=100)
+        clock.advance(11)
+        assert await cache.get("offers", "short") is None
+        assert await cache.get("offers", "long") == 2
+        
+        # Expired rows are purged by the next write
+        await cache.put("offers", "other", 3, ttl=100)
+        assert cache.evictions == 1
+        cache.close()
+    
+    asyncio.run(scenario())
+
+
+def test_evicts_entries_closest_to_expiry_when_over_budget(tmp_path):
+    async def scenario():
+        cache = SQLiteCache(tmp_path / "cache.db", max_bytes=250)
+        value = "x" * 98
+        await cache.put("offers", "soonest", value, ttl=10)
+        await cache.put("offers", "latest", value, ttl=1000)
+        await cache.put("offers", "middle", value, ttl=100)
+        assert await cache.get("offers", "soonest") is None
+        assert await cache.get("offers", "latest") == value
+        assert await cache.get("offers", "middle") == value
+        assert cache.evictions == 1
+        
+        # Values larger than the whole budget are never stored
+        await cache.put("offers", "huge", "x" * 300, ttl=1000)
+        assert await cache.get("offers", "huge") is None
+        assert await cache.get("offers", "latest") == value
+        cache.close()
+    
+    asyncio.run(scenario())
+
+
+def test_shared_between_instances_in_wal_mode(tmp_path):
+    path = tmp_path / "nested" / "cache.db"
+    
+    async def scenario():
+        writer = SQLiteCache(path, max_bytes=10_000)
+        reader = SQLiteCache(path, max_bytes=10_000)
+        await writer.put("oauth-token", "key", {"access_token": "abc"}, ttl=60)
+        assert await reader.get("oauth-token", "key") == {"access_token": "abc"}
+        
+        await asyncio.gather(*(writer.put("offers", str(index), index, ttl=60) for index in range(20)))
+        assert await asyncio.gather(*(reader.get("offers", str(index)) for index in range(20))) == list(range(20))
+        writer.close()
+        reader.close()
+    
+    asyncio.run(scenario())
+    
+    connection = sqlite3.connect(path)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    connection.close()
+    # The file may hold the OAuth token
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_failures_are_misses(tmp_path):
+    async def scenario():
+        (tmp_path / "directory.db").mkdir()
+        broken = SQLiteCache(tmp_path / "directory.db", max_bytes=10_000)
+        assert await broken.get("offers", "key") is None
+        await broken.put("offers", "key", 1, ttl=60)
+        assert broken.stats()["errors"] == 2
+    
+    asyncio.run(scenario())
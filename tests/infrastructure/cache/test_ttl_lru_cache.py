@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+import pytest
+from src.infrastructure.cache import ttl_lru_cache
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache, approximate_size
+from tests.factories import FakeClock
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(ttl_lru_cache, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLLRUCache(max_entries=10, max_bytes=10_000, ttl=60)
+    cache.put("a", 1, size=1)
+    
+    clock.advance(59)
+    assert cache.get("a").value == 1
+    clock.advance(1)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_stale_entries_stay_usable_for_stale_ttl(clock):
+    cache = TTLLRUCache(max_entries=10, max_bytes=10_000, ttl=60, stale_ttl=30)
+    cache.put("a", 1, size=1)
+    
+    clock.advance(70)
+    entry = cache.get("a")
+    assert entry is not None and not entry.is_fresh()
+    clock.advance(20)
+    assert cache.get("a") is None
+    
+    stats = cache.stats()
+    assert (stats["stale_hits"], stats["misses"]) == (1, 1)
+
+
+def test_per_entry_ttl(clock):
+    cache = TTLLRUCache(max_entries=10, max_bytes=10_000, ttl=60)
+    cache.put("short", 1, size=1, ttl=5)
+    cache.put("long", 2, size=1)
+    
+    clock.advance(10)
+    assert "short" not in cache
+    assert "long" in cache
+
+
+def test_least_recently_used_entry_is_evicted_by_count(clock):
+    cache = TTLLRUCache(max_entries=2, max_bytes=10_000, ttl=60)
+    cache.put("a", 1, size=1)
+    cache.put("b", 2, size=1)
+    cache.get("a")
+    cache.put("c", 3, size=1)
+    
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_are_evicted_by_size(clock):
+    cache = TTLLRUCache(max_entries=10, max_bytes=100, ttl=60)
+    cache.put("a", 1, size=60)
+    cache.put("b", 2, size=30)
+    cache.put("c", 3, size=30)
+    
+    assert "a" not in cache
+    assert cache.stats()["bytes"] == 60
+
+
+def test_oversized_values_are_not_cached(clock):
+    cache = TTLLRUCache(max_entries=10, max_bytes=100, ttl=60)
+    cache.put("a", 1, size=101)
+    
+    assert len(cache) == 0
+
+
+def test_replacing_an_entry_keeps_the_byte_count(clock):
+    cache = TTLLRUCache(max_entries=10, max_bytes=100, ttl=60)
+    cache.put("a", 1, size=40)
+    cache.put("a", 2, size=10)
+    
+    assert cache.get("a").value == 2
+    assert cache.stats()["bytes"] == 10
+
+
+def test_peek_does_not_count_or_reorder(clock):
+    cache = TTLLRUCache(max_entries=2, max_bytes=10_000, ttl=60)
+    cache.put("a", 1, size=1)
+    cache.put("b", 2, size=1)
+    
+    assert cache.peek("a").value == 1
+    cache.put("c", 3, size=1)
+    assert "a" not in cache
+    assert cache.stats()["hits"] + cache.stats()["misses"] == 0
+
+
+def test_approximate_size_counts_shared_objects_once():
+    shared = "x" * 1000
+    
+    assert approximate_size([shared, shared]) < 2 * approximate_size(shared)
+    assert approximate_size({"a": [1, 2, 3]}) > approximate_size({})
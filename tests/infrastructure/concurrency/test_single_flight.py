@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+from src.infrastructure.concurrency.single_flight import SingleFlight
+
+
+class Upstream:
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+    
+    async def fetch(self, value="result"):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def test_concurrent_calls_with_the_same_key_share_one_call():
+    async def run():
+        single_flight, upstream = SingleFlight(), Upstream()
+        callers = [asyncio.create_task(single_flight.do("key", upstream.fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return await asyncio.gather(*callers), upstream, single_flight
+    
+    results, upstream, single_flight = asyncio.run(run())
+    assert results == ["result"] * 5
+    assert upstream.calls == 1
+    assert single_flight.stats() == {"calls": 5, "coalesced": 4, "in_flight": 0}
+
+
+def test_different_keys_are_not_coalesced():
+    async def run():
+        single_flight, upstream = SingleFlight(), Upstream()
+        upstream.release.set()
+        await asyncio.gather(single_flight.do("a", upstream.fetch), single_flight.do("b", upstream.fetch))
+        return upstream
+    
+    assert asyncio.run(run()).calls == 2
+
+
+def test_finished_calls_are_not_reused():
+    async def run():
+        single_flight, upstream = SingleFlight(), Upstream()
+        upstream.release.set()
+        await single_flight.do("key", upstream.fetch)
+        await single_flight.do("key", upstream.fetch)
+        return upstream
+    
+    assert asyncio.run(run()).calls == 2
+
+
+def test_errors_reach_every_caller():
+    async def run():
+        single_flight, upstream = SingleFlight(), Upstream()
+        error = ValueError("boom")
+        callers = [asyncio.create_task(single_flight.do("key", lambda: upstream.fetch(error))) for _ in range(3)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return await asyncio.gather(*callers, return_exceptions=True)
+    
+    assert [str(result) for result in asyncio.run(run())] == ["boom"] * 3
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    async def run():
+        single_flight, upstream = SingleFlight(), Upstream()
+        first = asyncio.create_task(single_flight.do("key", upstream.fetch))
+        second = asyncio.create_task(single_flight.do("key", upstream.fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        upstream.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+    
+    assert asyncio.run(run()) == "result"
+
+
+def test_shared_call_is_cancelled_when_every_caller_is_gone():
+    async def run():
+        single_flight, upstream = SingleFlight(), Upstream()
+        caller = asyncio.create_task(single_flight.do("key", upstream.fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+        await asyncio.sleep(0)
+        return single_flight
+    
+    assert asyncio.run(run()).stats()["in_flight"] == 0
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from src.infrastructure.config import settings
+from src.infrastructure.config.settings import get_config
+
+ROOT_DIR = Path(__file__).parents[3]
+
+
+def test_configuration_is_built_on_first_use(monkeypatch):
+    assert settings._config is None
+    monkeypatch.setenv("AMADEUS_TOKEN_REFRESH_MARGIN", "5")
+    config = get_config()
+    assert config.amadeus.token_refresh_margin == 5.0
+    
+    # Later changes are not picked up by the built configuration
+    monkeypatch.setenv("AMADEUS_TOKEN_REFRESH_MARGIN", "30")
+    assert get_config() is config
+    assert settings.config is config
+
+
+def test_missing_credentials_fail_on_first_use(monkeypatch):
+    monkeypatch.delenv("AMADEUS_API_SECRET")
+    with pytest.raises(ValueError):
+        get_config()
+    with pytest.raises(AttributeError):
+        settings.unknown_setting
+
+
+def test_registering_the_tools_stays_lightweight():
+    # A fresh interpreter without credentials, as the MCP client spawns it
+    env = {name: value for name, value in os.environ.items() if not name.startswith("AMADEUS_")}
+    script = (
+        "import sys\n"
+        "from mcp.server.fastmcp import FastMCP\n"
+        "from src.presentation.mcp.tools import register_tools\n"
+        "from src.infrastructure.config import settings\n"
+        "register_tools(FastMCP('test'))\n"
+        "heavy = ['numpy', 'jinja2', 'src.infrastructure.gateways.amadeus_flight_gateway', 'src.infrastructure.reference.city_index']\n"
+        "print([name for name in heavy if name in sys.modules], settings._config)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[] None"
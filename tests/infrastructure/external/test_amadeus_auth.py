@@ -0,0 +1,131 @@
+import asyncio
+import httpx
+import pytest
+from types import SimpleNamespace
+from src.domain.exceptions.flight_exceptions import (
+    FlightApiException,
+    FlightServiceUnavailableException,
+    InvalidSearchParametersException
+)
+from src.infrastructure.cache.sqlite_cache import SQLiteCache
+from src.infrastructure.external import amadeus_auth
+from src.infrastructure.external.amadeus_auth import AmadeusAuthService
+from tests.factories import FakeClock, MockHttpClient
+
+
+class TokenEndpoint:
+    def __init__(self, expires_in: float = 100.0, status: int = 200, delay: float = 0.0, prefix: str = "token"):
+        self.prefix = prefix
+        self.expires_in = expires_in
+        self.status = status
+        self.delay = delay
+        self.calls = 0
+    
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.status != 200:
+            return httpx.Response(self.status)
+        return httpx.Response(200, json={"access_token": f"{self.prefix}-{self.calls}", "expires_in": self.expires_in})
+
+
+def patch_time(monkeypatch, clock: FakeClock):
+    monkeypatch.setattr(amadeus_auth, "time", SimpleNamespace(monotonic=clock, time=clock, perf_counter=clock))
+
+
+def test_concurrent_callers_share_one_refresh():
+    async def scenario():
+        endpoint = TokenEndpoint(delay=0.01)
+        auth = AmadeusAuthService(MockHttpClient(endpoint), refresh_margin=10)
+        tokens = await asyncio.gather(*(auth.get_access_token() for _ in range(10)))
+        assert set(tokens) == {"token-1"}
+        assert endpoint.calls == 1
+        assert auth.stats()["refresh_count"] == 1
+    
+    asyncio.run(scenario())
+
+
+def test_refreshes_once_the_token_enters_the_margin(monkeypatch):
+    clock = FakeClock(1000.0)
+    patch_time(monkeypatch, clock)
+    
+    async def scenario():
+        endpoint = TokenEndpoint(expires_in=100)
+        auth = AmadeusAuthService(MockHttpClient(endpoint), refresh_margin=10)
+        assert await auth.get_access_token() == "token-1"
+        
+        clock.advance(89)
+        assert await auth.get_access_token() == "token-1"
+        
+        clock.advance(2)
+        assert await auth.get_access_token() == "token-2"
+        assert endpoint.calls == 2
+    
+    asyncio.run(scenario())
+
+
+def test_invalidating_a_replaced_token_keeps_the_fresh_one():
+    async def scenario():
+        endpoint = TokenEndpoint()
+        auth = AmadeusAuthService(MockHttpClient(endpoint), refresh_margin=10)
+        stale = await auth.get_access_token()
+        auth.invalidate_token(stale)
+        fresh = await auth.get_access_token()
+        assert fresh == "token-2"
+        
+        # A late 401 for the stale token must not discard the fresh one
+        auth.invalidate_token(stale)
+        assert await auth.get_access_token() == fresh
+        assert endpoint.calls == 2
+    
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("status, exception", [
+    (400, InvalidSearchParametersException),
+    (401, FlightApiException),
+    (503, FlightServiceUnavailableException)
+])
+def test_maps_token_endpoint_errors(status, exception):
+    async def scenario():
+        auth = AmadeusAuthService(MockHttpClient(TokenEndpoint(status=status)))
+        with pytest.raises(exception):
+            await auth.get_access_token()
+        assert auth.stats()["refresh_failures"] == 1
+        assert auth.stats()["has_token"] is False
+    
+    asyncio.run(scenario())
+
+
+def test_connectivity_errors_are_unavailable():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+    
+    async def scenario():
+        auth = AmadeusAuthService(MockHttpClient(handler))
+        with pytest.raises(FlightServiceUnavailableException):
+            await auth.get_access_token()
+    
+    asyncio.run(scenario())
+
+
+def test_processes_share_a_persistent_token(tmp_path):
+    async def scenario():
+        cache = SQLiteCache(tmp_path / "cache.db", max_bytes=1_000_000)
+        first_endpoint = TokenEndpoint(expires_in=1000)
+        second_endpoint = TokenEndpoint(expires_in=1000, prefix="second")
+        first = AmadeusAuthService(MockHttpClient(first_endpoint), refresh_margin=10, persistent_cache=cache)
+        second = AmadeusAuthService(MockHttpClient(second_endpoint), refresh_margin=10, persistent_cache=cache)
+        
+        assert await first.get_access_token() == "token-1"
+        assert await second.get_access_token() == "token-1"
+        assert second_endpoint.calls == 0
+        assert second.stats()["shared_token_reuses"] == 1
+        
+        # A rejected shared token is not adopted again
+        second.invalidate_token("token-1")
+        assert await second.get_access_token() == "second-1"
+        assert second_endpoint.calls == 1
+        cache.close()
+    
+    asyncio.run(scenario())
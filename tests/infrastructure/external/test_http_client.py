@@ -0,0 +1,87 @@
+import asyncio
+from src.infrastructure.config.settings import HttpClientConfig
+from src.infrastructure.container import Container
+from src.infrastructure.external.http_client import SharedHttpClient
+
+
+class KeepAliveServer:
+    """Minimal HTTP/1.1 server counting the TCP connections it accepts"""
+    
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+    
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/"
+    
+    async def __aenter__(self) -> 'KeepAliveServer':
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                self.requests += 1
+                await asyncio.sleep(self.delay)
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def test_client_is_opened_once_and_reopened_after_close():
+    async def scenario():
+        shared = SharedHttpClient(HttpClientConfig())
+        assert shared.stats() == {"open": False}
+        client = shared.client
+        assert shared.client is client and shared.is_open
+        
+        await shared.aclose()
+        assert not shared.is_open
+        assert shared.client is not client
+        await shared.aclose()
+    
+    asyncio.run(scenario())
+
+
+def test_sequential_requests_reuse_one_connection():
+    async def scenario():
+        shared = SharedHttpClient(HttpClientConfig())
+        async with KeepAliveServer() as server:
+            for _ in range(5):
+                response = await shared.client.get(server.url)
+                assert response.json() == {}
+            stats = shared.stats()
+            await shared.aclose()
+        assert (server.requests, server.connections) == (5, 1)
+        assert (stats["connections"], stats["idle"]) == (1, 1)
+    
+    asyncio.run(scenario())
+
+
+def test_concurrent_requests_are_capped_by_the_pool():
+    async def scenario():
+        shared = SharedHttpClient(HttpClientConfig(max_connections=2, max_keepalive_connections=2))
+        async with KeepAliveServer(delay=0.02) as server:
+            await asyncio.gather(*(shared.client.get(server.url) for _ in range(6)))
+            await shared.aclose()
+        assert server.requests == 6
+        assert server.connections == 2
+    
+    asyncio.run(scenario())
+
+
+def test_amadeus_services_share_the_pool():
+    container = Container()
+    assert container.auth_service._http_client is container.http_client
+    assert container.amadeus_client._http_client is container.http_client
@@ -0,0 +1,62 @@
+import json
+import pytest
+from src.infrastructure.external.json_stream import JsonArrayStream
+
+DOCUMENTS = [
+    b'{"data":[1.5,2],"x":1}',
+    b'{"x":7.25,"data":[]}',
+    b'{"data":[{"a":1}],"x":1e10}',
+    b'{"meta": {"count": 3}, "data": [{"id": "1", "price": -12.5E-1}, [true, false], null, "a\\u00e9"], "y": -0.0}',
+    '{"data":["ação","東京"],"n":0}'.encode()
+]
+
+
+def decode(*chunks: bytes) -> dict:
+    stream = JsonArrayStream()
+    items = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    items.extend(stream.close())
+    return {**stream.members, "data": items}
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_whole_document(document):
+    assert decode(document) == json.loads(document)
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_every_split(document):
+    expected = json.loads(document)
+    for first in range(len(document) + 1):
+        for second in range(first, len(document) + 1):
+            chunks = (document[:first], document[first:second], document[second:])
+            assert decode(*chunks) == expected, chunks
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_byte_by_byte(document):
+    assert decode(*(document[index:index + 1] for index in range(len(document)))) == json.loads(document)
+
+
+def test_elements_are_returned_as_they_complete():
+    stream = JsonArrayStream()
+    assert stream.feed(b'{"data":[{"id":1},{"i') == [{"id": 1}]
+    assert stream.feed(b'd":2}]}') == [{"id": 2}]
+    assert stream.close() == []
+    assert stream.items == 2
+
+
+def test_other_field():
+    stream = JsonArrayStream(field="rows")
+    items = stream.feed(b'{"data":[1],"rows":[2,3]}') + stream.close()
+    assert items == [2, 3]
+    assert stream.members == {"data": [1]}
+
+
+@pytest.mark.parametrize("document", [b'{"data":[1,2', b'{"data":[1.', b'[1,2]', b'{"data":[1]} x', b''])
+def test_truncated_or_malformed(document):
+    stream = JsonArrayStream()
+    with pytest.raises(ValueError):
+        stream.feed(document)
+        stream.close()
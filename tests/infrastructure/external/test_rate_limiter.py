@@ -0,0 +1,130 @@
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+import pytest
+from src.infrastructure.config.settings import RateLimitConfig
+from src.infrastructure.external.rate_limiter import (
+    TokenBucket,
+    AdaptiveConcurrencyLimiter,
+    EndpointRateLimiter,
+    RateLimiterRegistry,
+    parse_retry_after
+)
+
+
+def elapsed(coroutine_factory) -> float:
+    async def run():
+        started = time.monotonic()
+        await coroutine_factory()
+        return time.monotonic() - started
+    return asyncio.run(run())
+
+
+def test_token_bucket_allows_a_burst_then_paces():
+    bucket = TokenBucket(rate=10, burst=3)
+    
+    async def acquire(count: int):
+        for _ in range(count):
+            await bucket.acquire()
+    
+    assert elapsed(lambda: acquire(3)) < 0.05
+    # Two more tokens at 10/s take about 200 ms
+    assert 0.18 <= elapsed(lambda: acquire(2)) < 1.0
+
+
+def test_token_bucket_block_for_pauses_acquisitions():
+    bucket = TokenBucket(rate=1000, burst=5)
+    bucket.block_for(0.05)
+    
+    assert elapsed(bucket.acquire) >= 0.045
+
+
+def test_concurrency_limiter_queues_in_fifo_order():
+    async def run():
+        limiter = AdaptiveConcurrencyLimiter(initial=1, minimum=1, maximum=4)
+        order = []
+        
+        async def worker(name: str):
+            await limiter.acquire()
+            order.append(name)
+            await asyncio.sleep(0)
+            limiter.release()
+        
+        await asyncio.gather(*(worker(name) for name in "abc"))
+        return order, limiter
+    
+    order, limiter = asyncio.run(run())
+    assert order == ["a", "b", "c"]
+    assert (limiter.in_flight, limiter.queued) == (0, 0)
+
+
+def test_concurrency_limit_grows_additively_and_shrinks_multiplicatively():
+    limiter = AdaptiveConcurrencyLimiter(initial=4, minimum=1, maximum=8)
+    for _ in range(4):
+        limiter.on_success()
+    assert limiter.limit == 4
+    for _ in range(4):
+        limiter.on_success()
+    assert limiter.limit >= 5
+    
+    limiter.on_overload()
+    assert limiter.limit == 2
+    for _ in range(5):
+        limiter.on_overload()
+    assert limiter.limit == 1
+
+
+def test_concurrency_limit_is_capped():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, minimum=1, maximum=2)
+    for _ in range(50):
+        limiter.on_success()
+    
+    assert limiter.limit == 2
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def run():
+        limiter = AdaptiveConcurrencyLimiter(initial=1, minimum=1, maximum=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        limiter.release()
+        return limiter
+    
+    limiter = asyncio.run(run())
+    assert (limiter.in_flight, limiter.queued) == (0, 0)
+
+
+def test_throttling_shrinks_concurrency_and_is_counted():
+    limiter = EndpointRateLimiter("flights", RateLimitConfig(rate=100, burst=1, max_concurrency=8))
+    limiter.on_throttled(0.0)
+    limiter.on_overload()
+    
+    stats = limiter.stats()
+    assert (stats["throttled"], stats["overloads"]) == (1, 1)
+    assert stats["concurrency_limit"] == 2
+
+
+def test_registry_picks_limiters_by_path_prefix():
+    registry = RateLimiterRegistry(
+        {"/v2/shopping/flight-offers": RateLimitConfig(), "/v1/reference-data/locations": RateLimitConfig()},
+        default=RateLimitConfig()
+    )
+    
+    assert registry.for_endpoint("/v2/shopping/flight-offers?x=1").name == "/v2/shopping/flight-offers"
+    assert registry.for_endpoint("/v1/other").name == "default"
+
+
+@pytest.mark.parametrize("value, expected", [(None, 1.0), ("", 1.0), ("3", 3.0), ("-2", 0.0), ("soon", 1.0)])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    
+    assert 25 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
@@ -0,0 +1,131 @@
+import asyncio
+from types import SimpleNamespace
+import httpx
+import pytest
+from src.domain.exceptions.flight_exceptions import FlightServiceUnavailableException, InvalidSearchParametersException
+from src.infrastructure.external import resilience
+from src.infrastructure.external.amadeus_client import AmadeusClient
+from src.infrastructure.external.resilience import CircuitBreaker, RetryPolicy, CLOSED, OPEN, HALF_OPEN
+from tests.factories import FakeClock, MockHttpClient
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(resilience, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(max_retries=5, base_delay=0.1, max_delay=0.5)
+    
+    for attempt in range(6):
+        delays = [policy.backoff(attempt) for _ in range(50)]
+        assert all(0 <= delay <= min(0.5, 0.1 * 2 ** attempt) for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("flights", failure_threshold=3, recovery_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    for _ in range(3):
+        breaker.record_failure()
+    
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_breaker_lets_one_probe_through_when_half_open(clock):
+    breaker = CircuitBreaker("flights", failure_threshold=1, recovery_timeout=30)
+    breaker.record_failure()
+    
+    clock.advance(30)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens_the_breaker(clock):
+    breaker = CircuitBreaker("flights", failure_threshold=1, recovery_timeout=30)
+    breaker.record_failure()
+    clock.advance(30)
+    breaker.allow_request()
+    breaker.record_failure()
+    
+    assert breaker.state == OPEN
+    assert breaker.stats()["times_opened"] == 2
+
+
+def test_lost_probe_is_replaced(clock):
+    breaker = CircuitBreaker("flights", failure_threshold=1, recovery_timeout=30)
+    breaker.record_failure()
+    clock.advance(30)
+    assert breaker.allow_request()
+    
+    clock.advance(30)
+    assert breaker.allow_request()
+
+
+class StaticTokenAuth:
+    async def get_access_token(self) -> str:
+        return "token"
+    
+    def invalidate_token(self, token: str):
+        pass
+
+
+def amadeus_client(monkeypatch, responses: list) -> tuple[AmadeusClient, list]:
+    monkeypatch.setenv("AMADEUS_MAX_RETRIES", "2")
+    monkeypatch.setenv("AMADEUS_RETRY_BASE_DELAY", "0.001")
+    monkeypatch.setenv("AMADEUS_BREAKER_FAILURE_THRESHOLD", "2")
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
+    return AmadeusClient(MockHttpClient(handler), StaticTokenAuth()), requests
+
+
+def test_transient_failures_are_retried(monkeypatch):
+    client, requests = amadeus_client(monkeypatch, [
+        httpx.Response(503),
+        httpx.ConnectError("reset"),
+        httpx.Response(200, json={"data": []})
+    ])
+    
+    assert asyncio.run(client.get("/v1/test")) == {"data": []}
+    assert len(requests) == 3
+    assert client.stats()["retries"] == 2
+
+
+def test_client_errors_are_not_retried(monkeypatch):
+    client, requests = amadeus_client(monkeypatch, [httpx.Response(400, json={"errors": []})])
+    
+    with pytest.raises(InvalidSearchParametersException):
+        asyncio.run(client.get("/v1/test"))
+    assert len(requests) == 1
+
+
+def test_open_breaker_fails_fast(monkeypatch):
+    client, requests = amadeus_client(monkeypatch, [httpx.Response(500)])
+    
+    async def run():
+        for _ in range(3):
+            with pytest.raises(FlightServiceUnavailableException):
+                await client.get("/v1/test")
+    
+    asyncio.run(run())
+    # Two calls of three attempts each open the breaker; the third is rejected without a request
+    assert len(requests) == 6
+    assert client.stats()["circuit_breakers"]["default"]["state"] == OPEN
@@ -0,0 +1,145 @@
+import asyncio
+from src.domain.services.flight_search_service import FlightSearchService
+from src.domain.vo.ranking_options import RankingOptions
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from src.infrastructure.gateways.cached_flight_gateway import CachedFlightGateway
+from tests.factories import FakeFlightGateway, flight_offer, search_params
+
+
+def cached(upstream: FakeFlightGateway, ttl: float = 60, stale_ttl: float = 0) -> CachedFlightGateway:
+    return CachedFlightGateway(upstream, TTLLRUCache(max_entries=10, max_bytes=1_000_000, ttl=ttl, stale_ttl=stale_ttl))
+
+
+def test_equivalent_searches_are_served_from_cache():
+    upstream = FakeFlightGateway()
+    gateway = cached(upstream)
+    
+    async def run():
+        first = await gateway.search_flights(search_params(included_airline_codes="TP,IB"))
+        second = await gateway.search_flights(search_params(included_airline_codes="ib, tp"))
+        return first, second
+    
+    first, second = asyncio.run(run())
+    assert first == second
+    assert upstream.calls == 1
+
+
+def test_results_are_copies():
+    gateway = cached(FakeFlightGateway())
+    
+    async def run():
+        (await gateway.search_flights(search_params())).clear()
+        return await gateway.search_flights(search_params())
+    
+    assert len(asyncio.run(run())) == 1
+
+
+def test_stale_entries_are_served_while_refreshing():
+    upstream = FakeFlightGateway([flight_offer(price=100)])
+    gateway = cached(upstream, ttl=0, stale_ttl=60)
+    
+    async def run():
+        await gateway.search_flights(search_params())
+        upstream.offers = [flight_offer(price=80)]
+        stale = await gateway.search_flights(search_params())
+        assert gateway.stats()["refreshing"] == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return stale
+    
+    stale = asyncio.run(run())
+    assert stale[0].price == 100
+    assert upstream.calls == 2
+    assert gateway.stats()["background_refreshes"] == 1
+
+
+def test_failed_refresh_keeps_the_stale_entry():
+    upstream = FakeFlightGateway()
+    gateway = cached(upstream, ttl=0, stale_ttl=60)
+    
+    async def run():
+        await gateway.search_flights(search_params())
+        upstream.error = RuntimeError("upstream down")
+        await gateway.search_flights(search_params())
+        await asyncio.sleep(0)
+        return await gateway.search_flights(search_params())
+    
+    assert len(asyncio.run(run())) == 1
+
+
+def test_is_cached_and_prefetch():
+    upstream = FakeFlightGateway()
+    gateway = cached(upstream, ttl=60)
+    params = search_params()
+    
+    async def run():
+        assert not gateway.is_cached(params)
+        await gateway.prefetch(params)
+        assert gateway.is_cached(params, min_fresh=30)
+        assert not gateway.is_cached(params, min_fresh=120)
+        await gateway.search_flights(params)
+    
+    asyncio.run(run())
+    assert upstream.calls == 1
+    assert gateway.stats()["prefetches"] == 1
+    assert gateway.stats()["hits"] == 1
+
+
+class StreamingGateway(FakeFlightGateway):
+    """Only answers streamed searches, counting the offers read"""
+    
+    def __init__(self, offers):
+        super().__init__(offers)
+        self.yielded = 0
+    
+    async def search_flights(self, params):
+        raise AssertionError("the whole response was requested")
+    
+    async def iter_flights(self, params):
+        self.calls += 1
+        for flight in self.offers:
+            self.yielded += 1
+            yield flight
+
+
+def test_streamed_misses_are_cached_once_read_to_the_end():
+    upstream = StreamingGateway([flight_offer(id=str(i), price=100 + i) for i in range(5)])
+    gateway = cached(upstream)
+    
+    async def run():
+        first = [flight async for flight in gateway.iter_flights(search_params())]
+        second = [flight async for flight in gateway.iter_flights(search_params())]
+        return first, second
+    
+    first, second = asyncio.run(run())
+    assert first == second == upstream.offers
+    assert upstream.calls == 1
+
+
+def test_abandoned_streams_are_not_cached():
+    upstream = StreamingGateway([flight_offer(id=str(i)) for i in range(5)])
+    gateway = cached(upstream)
+    
+    async def run():
+        flights = gateway.iter_flights(search_params())
+        await anext(flights)
+        await flights.aclose()
+        return gateway.is_cached(search_params())
+    
+    assert not asyncio.run(run())
+    assert upstream.yielded == 1
+
+
+def test_top_flights_stream_through_the_cache():
+    upstream = StreamingGateway([flight_offer(id=str(i), price=500 - i) for i in range(5)])
+    service = FlightSearchService(cached(upstream))
+    
+    async def run():
+        ranking = RankingOptions(sort_by="price")
+        first = await service.search_top_flights(search_params(), ranking, top_k=2)
+        second = await service.search_top_flights(search_params(), ranking, top_k=2)
+        return first, second
+    
+    first, second = asyncio.run(run())
+    assert [flight.id for flight in first] == [flight.id for flight in second] == ["4", "3"]
+    assert upstream.calls == 1
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import pytest
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+from src.domain.vo.location_code import LocationCode
+from src.infrastructure.gateways.flight_offer_mapper import FlightOfferMapper
+
+
+def raw_segment(departure: str, arrival: str, departs: str, arrives: str, number: str = "101") -> dict:
+    return {
+        "departure": {"iataCode": departure, "at": departs},
+        "arrival": {"iataCode": arrival, "at": arrives},
+        "carrierCode": "TP",
+        "number": number,
+        "aircraft": {"code": "332"},
+        "duration": "PT5H"
+    }
+
+
+def raw_offer(id: str = "1", total: str = "512.30", inbound_number: str = "202") -> dict:
+    return {
+        "type": "flight-offer",
+        "id": id,
+        "numberOfBookableSeats": 4,
+        "oneWay": False,
+        "lastTicketingDate": "2030-02-20",
+        "itineraries": [
+            {"segments": [
+                raw_segment("GRU", "MAD", "2030-03-01T10:00:00", "2030-03-01T20:00:00"),
+                raw_segment("MAD", "LIS", "2030-03-01T22:00:00", "2030-03-01T23:15:00", "303")
+            ]},
+            {"segments": [raw_segment("LIS", "GRU", "2030-03-08T09:00:00", "2030-03-08T18:00:00", inbound_number)]}
+        ],
+        "price": {"currency": "EUR", "total": total, "base": "400.00"},
+        "validatingAirlineCodes": ["TP"],
+        "travelerPricings": [{"fareDetailsBySegment": [{"segmentId": "1", "class": "ECONOMY"}]}]
+    }
+
+
+def test_maps_an_offer():
+    offer = FlightOfferMapper().map_offer(raw_offer())
+    assert offer.id == "1"
+    assert offer.price == 512.30
+    assert offer.currency == "EUR"
+    assert offer.seats_available == 4
+    assert offer.travel_class == "ECONOMY"
+    assert offer.validating_airline_codes == ["TP"]
+    assert offer.last_ticketing_date == "2030-02-20"
+    assert [str(segment.departure) for segment in offer.segments] == ["GRU", "MAD", "LIS"]
+    
+    first = offer.segments[0]
+    assert first.departure is LocationCode.of("GRU")
+    assert first.departure_time == datetime(2030, 3, 1, 10)
+    assert (first.carrier_code, first.flight_number, first.aircraft, first.duration) == ("TP", "101", "332", "PT5H")
+
+
+def test_tolerates_missing_optional_fields():
+    data = raw_offer()
+    del data["travelerPricings"], data["numberOfBookableSeats"], data["validatingAirlineCodes"]
+    for itinerary in data["itineraries"]:
+        for segment in itinerary["segments"]:
+            del segment["aircraft"], segment["duration"]
+    
+    offer = FlightOfferMapper().map_offer(data)
+    assert offer.travel_class == ""
+    assert offer.seats_available == 0
+    assert offer.validating_airline_codes == []
+    assert offer.segments[0].aircraft is None
+
+
+def test_response_and_stream_agree():
+    mapper = FlightOfferMapper()
+    response = {"data": [raw_offer(str(index), f"{100 + index}.00") for index in range(3)], "dictionaries": {}}
+    
+    async def stream():
+        for offer in response["data"]:
+            yield offer
+    
+    async def collect():
+        return [offer async for offer in mapper.map_offer_stream(stream())]
+    
+    assert asyncio.run(collect()) == mapper.map_response(response)
+    assert mapper.map_response({}) == []
+
+
+def test_offers_of_one_response_share_identical_segments():
+    offers = FlightOfferMapper().map_response({"data": [raw_offer("1"), raw_offer("2", inbound_number="404")]})
+    first, second = offers
+    assert all(a is b for a, b in zip(first.segments[:2], second.segments[:2]))
+    assert first.segments[2] is not second.segments[2]
+    assert second.segments[2].flight_number == "404"
+
+
+def test_segments_are_not_shared_across_responses():
+    mapper = FlightOfferMapper()
+    first = mapper.map_offer(raw_offer())
+    second = mapper.map_offer(raw_offer())
+    assert first == second
+    assert first.segments[0] is not second.segments[0]
+
+
+def test_entities_are_slotted_and_segments_immutable():
+    offer = FlightOfferMapper().map_offer(raw_offer())
+    assert not hasattr(offer, "__dict__")
+    assert not hasattr(offer.segments[0], "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        offer.segments[0].flight_number = "999"
+
+
+def test_repeated_strings_are_interned():
+    # Decoded separately, equal values start out as distinct string objects
+    decoded = [json.loads(json.dumps(raw_offer())) for _ in range(2)]
+    assert decoded[0]["price"]["currency"] is not decoded[1]["price"]["currency"]
+    first, second = (FlightOfferMapper().map_offer(data) for data in decoded)
+    assert first.segments[0].carrier_code is second.segments[0].carrier_code
+    assert first.segments[0].duration is second.segments[0].duration
+    assert first.currency is second.currency
@@ -0,0 +1,96 @@
+import asyncio
+from typing import List
+import pytest
+from src.domain.entities.city import City
+from src.domain.exceptions.flight_exceptions import FlightServiceUnavailableException
+from src.domain.gateways.city_gateway import CityGateway
+from src.domain.vo.search_params import CitySearchParams
+from src.infrastructure.gateways.indexed_city_gateway import IndexedCityGateway
+from src.infrastructure.reference.city_index import CityIndex
+
+
+class FakeCityGateway(CityGateway):
+    def __init__(self, cities: List[City]):
+        self.cities = cities
+        self.calls = 0
+        self.error: Exception | None = None
+    
+    async def search_cities(self, params: CitySearchParams) -> List[City]:
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.cities
+
+
+def city(name: str, code: str, country: str = "XX") -> City:
+    return City(name=name, iata_code=code, country_code=country, country_name="")
+
+
+INDEX = CityIndex([
+    city("Paris", "PAR", "FR"),
+    city("Parma", "PMF", "IT"),
+    city("Berlin", "BER", "DE"),
+    city("Santiago", "SCL", "CL")
+])
+
+
+def search(gateway: IndexedCityGateway, keyword: str, max_results: int | None = 10) -> List[str]:
+    cities = asyncio.run(gateway.search_cities(CitySearchParams(keyword, max_results=max_results)))
+    return [city.iata_code for city in cities]
+
+
+def test_exact_name_is_answered_locally():
+    fallback = FakeCityGateway([])
+    gateway = IndexedCityGateway(INDEX, fallback)
+    
+    assert search(gateway, "paris") == ["PAR"]
+    assert fallback.calls == 0
+
+
+def test_iata_code_is_answered_locally():
+    fallback = FakeCityGateway([])
+    gateway = IndexedCityGateway(INDEX, fallback)
+    
+    assert search(gateway, "ber") == ["BER"]
+    assert fallback.calls == 0
+
+
+def test_full_page_of_prefix_matches_is_answered_locally():
+    fallback = FakeCityGateway([])
+    gateway = IndexedCityGateway(INDEX, fallback)
+    
+    assert search(gateway, "Par", max_results=2) == ["PAR", "PMF"]
+    assert fallback.calls == 0
+
+
+def test_partial_prefix_is_completed_by_the_fallback():
+    fallback = FakeCityGateway([city("Paraty", "PTY", "BR"), city("Paris", "PAR", "FR")])
+    gateway = IndexedCityGateway(INDEX, fallback)
+    
+    assert search(gateway, "Pa") == ["PAR", "PMF", "PTY"]
+    assert gateway.stats()["fallbacks"] == 1
+
+
+def test_fuzzy_match_defers_to_the_fallback():
+    fallback = FakeCityGateway([city("Bern", "BRN", "CH")])
+    gateway = IndexedCityGateway(INDEX, fallback)
+    
+    assert search(gateway, "Bern") == ["BRN"]
+    assert search(gateway, "Santa") == ["BRN"]
+
+
+def test_fuzzy_match_is_used_when_the_fallback_finds_nothing():
+    gateway = IndexedCityGateway(INDEX, FakeCityGateway([]))
+    
+    assert search(gateway, "Berln") == ["BER"]
+
+
+def test_local_matches_answer_when_the_fallback_fails():
+    fallback = FakeCityGateway([])
+    fallback.error = FlightServiceUnavailableException("down")
+    gateway = IndexedCityGateway(INDEX, fallback)
+    
+    assert search(gateway, "Pa") == ["PAR", "PMF"]
+    assert gateway.stats()["local_on_error"] == 1
+    with pytest.raises(FlightServiceUnavailableException):
+        search(gateway, "Tokyo")
@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from src.infrastructure.metrics import registry as registry_module
+from src.infrastructure.metrics.exporter import start_prometheus_exporter
+from src.infrastructure.metrics.registry import Histogram, LATENCY_BUCKETS, MetricsRegistry
+from tests.factories import FakeClock
+
+
+def test_histogram_quantiles():
+    histogram = Histogram((1.0, 2.0, 4.0))
+    for value in [0.5] * 50 + [1.5] * 45 + [3.0] * 5:
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == pytest.approx(1.0)
+    assert 1.0 < histogram.quantile(0.95) <= 2.0
+    assert histogram.quantile(0.99) <= 3.0
+    assert Histogram((1.0,)).quantile(0.5) == 0.0
+    
+    summary = histogram.summary()
+    assert (summary["count"], summary["max"]) == (100, 3.0)
+    assert summary["mean"] == pytest.approx(1.075)
+
+
+def test_stage_timers(monkeypatch):
+    clock = FakeClock(0.0)
+    monkeypatch.setattr(registry_module, "time", SimpleNamespace(perf_counter=clock, time=clock))
+    metrics = MetricsRegistry()
+    with metrics.timer("http", endpoint="flight-offers"):
+        clock.advance(0.2)
+    with pytest.raises(RuntimeError):
+        with metrics.timer("http", endpoint="flight-offers"):
+            clock.advance(0.4)
+            raise RuntimeError("failed requests are timed too")
+    
+    stage = metrics.snapshot()["stages"]["stage=http,endpoint=flight-offers"]
+    assert stage["count"] == 2
+    assert stage["max"] == pytest.approx(0.4)
+
+
+def test_snapshot_reports_counters_samples_and_components():
+    metrics = MetricsRegistry()
+    metrics.increment("upstream_calls", endpoint="cities")
+    metrics.increment("upstream_calls", 2, endpoint="cities")
+    metrics.observe("response_bytes", 2000, tool="search_flights")
+    metrics.register_collector("cache", lambda: {"hits": 3, "hit_ratio": 0.75})
+    metrics.register_collector("broken", lambda: 1 / 0)
+    
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {"upstream_calls{endpoint=cities}": 3}
+    assert snapshot["histograms"]["response_bytes{tool=search_flights}"]["count"] == 1
+    # A failing collector does not hide the others
+    assert snapshot["components"] == {"cache": {"hits": 3, "hit_ratio": 0.75}}
+
+
+def test_prometheus_text_format():
+    metrics = MetricsRegistry()
+    with metrics.timer("tool", tool="search_flights"):
+        pass
+    metrics.observe("response_bytes", 2000)
+    metrics.increment("errors", kind='quote"d')
+    metrics.register_collector("http pool", lambda: {"requests": 4, "labels": {"open": 2}, "path": "/tmp/x"})
+    
+    lines = metrics.render_prometheus().splitlines()
+    assert "# TYPE mcp_flight_stage_seconds histogram" in lines
+    assert f'mcp_flight_stage_seconds_bucket{{stage="tool",tool="search_flights",le="+Inf"}} 1' in lines
+    assert len([line for line in lines if line.startswith("mcp_flight_stage_seconds_bucket")]) == len(LATENCY_BUCKETS) + 1
+    assert 'mcp_flight_response_bytes_bucket{le="4096.0"} 1' in lines
+    assert 'mcp_flight_errors{kind="quote\\"d"} 1' in lines
+    assert "mcp_flight_http_pool_requests 4.0" in lines
+    assert "mcp_flight_http_pool_labels_open 2.0" in lines
+    assert not any("path" in line for line in lines)
+
+
+def test_exporter_serves_metrics():
+    metrics = MetricsRegistry()
+    metrics.increment("upstream_calls")
+    
+    async def fetch(server, path: str) -> bytes:
+        host, port = server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+    
+    async def scenario():
+        server = await start_prometheus_exporter(metrics, "127.0.0.1", 0)
+        try:
+            ok = await fetch(server, "/metrics")
+            missing = await fetch(server, "/other")
+        finally:
+            server.close()
+            await server.wait_closed()
+        assert ok.startswith(b"HTTP/1.1 200 OK")
+        assert b"mcp_flight_upstream_calls 1" in ok
+        assert missing.startswith(b"HTTP/1.1 404")
+    
+    asyncio.run(scenario())
@@ -0,0 +1,51 @@
+from src.domain.entities.city import City, Airport
+from src.infrastructure.reference.city_index import CityIndex, normalize_keyword
+
+INDEX = CityIndex([
+    City(name="São Paulo", iata_code="SAO", country_code="BR", country_name="Brazil", airports=[
+        Airport(iata_code="GRU", name="Guarulhos", city_name="São Paulo", country_code="BR")
+    ]),
+    City(name="New York", iata_code="NYC", country_code="US", country_name="United States"),
+    City(name="Newcastle", iata_code="NCL", country_code="GB", country_name="United Kingdom"),
+    City(name="London", iata_code="LON", country_code="GB", country_name="United Kingdom")
+])
+
+
+def test_normalize_keyword_strips_accents():
+    assert normalize_keyword(" são paulo ") == "SAO PAULO"
+
+
+def test_airport_code_finds_its_city():
+    lookup = INDEX.lookup("gru", include_airports=True)
+    
+    assert [city.iata_code for city in lookup.cities] == ["SAO"]
+    assert lookup.cities[0].airports[0].iata_code == "GRU"
+    assert lookup.exact and not lookup.fuzzy
+
+
+def test_city_code_is_exact():
+    assert INDEX.lookup("LON").exact
+    assert not INDEX.lookup("Lon").fuzzy
+    assert not INDEX.lookup("New").exact
+
+
+def test_airports_are_left_out_unless_requested():
+    assert INDEX.search("sao")[0].airports == []
+
+
+def test_exact_name_and_word_prefix():
+    assert INDEX.lookup("Sao Paulo").exact
+    assert [city.iata_code for city in INDEX.search("york")] == ["NYC"]
+
+
+def test_prefix_with_country_filter_and_limit():
+    assert [city.iata_code for city in INDEX.search("new")] == ["NYC", "NCL"]
+    assert [city.iata_code for city in INDEX.search("new", country_code="gb")] == ["NCL"]
+    assert len(INDEX.search("new", max_results=1)) == 1
+
+
+def test_typos_are_matched_fuzzily():
+    lookup = INDEX.lookup("Lodon")
+    
+    assert [city.iata_code for city in lookup.cities] == ["LON"]
+    assert lookup.fuzzy and not lookup.exact
@@ -0,0 +1,114 @@
+import json
+import os
+import pytest
+from types import SimpleNamespace
+from src.infrastructure.reference import travel_guides
+from src.infrastructure.reference.travel_guides import (
+    DocumentsChecklist,
+    SeasonsGuide,
+    TravelGuide,
+    UnknownGuideKeyException,
+    parse_month,
+    parse_month_ranges
+)
+from tests.factories import FakeClock
+
+SEASONS = """# Seasons
+
+## europe
+high_season=June - August
+low_season=November - March
+notes=Busy summers.
+crowd_level_high=June-August
+
+## south_america
+high_season=December - February
+"""
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock(100.0)
+    monkeypatch.setattr(travel_guides, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def write(path, text: str, mtime_ns: int):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_month_ranges_wrap_the_year_end():
+    assert parse_month_ranges("November - March") == frozenset({11, 12, 1, 2, 3})
+    assert parse_month_ranges("April-May, September") == frozenset({4, 5, 9})
+    assert parse_month_ranges("Someday") == frozenset()
+    assert [parse_month(value) for value in ("July", "jul", " 7 ")] == [7, 7, 7]
+    with pytest.raises(UnknownGuideKeyException):
+        parse_month("13")
+
+
+def test_serves_pre_encoded_slices(tmp_path, clock):
+    path = tmp_path / "seasons.txt"
+    write(path, SEASONS, 1_000_000_000)
+    guide = SeasonsGuide(path)
+    
+    assert json.loads(guide.regions()) == ["europe", "south_america"]
+    assert json.loads(guide.region("Europe"))["high_season"] == "June - August"
+    assert json.loads(guide.month("south-america", "jan"))["season"] == "high"
+    july = json.loads(guide.month("europe", "7"))
+    assert (july["month"], july["season"], july["crowd_level"], july["notes"]) == ("July", "high", "high", "Busy summers.")
+    assert json.loads(guide.month("europe", "april"))["season"] is None
+    assert (guide.loads, guide.hits) == (1, 5)
+
+
+def test_unknown_regions_list_the_available_ones(tmp_path, clock):
+    path = tmp_path / "seasons.txt"
+    write(path, SEASONS, 1_000_000_000)
+    with pytest.raises(UnknownGuideKeyException, match="europe, south_america"):
+        SeasonsGuide(path).region("atlantis")
+
+
+def test_reloads_when_the_file_changes(tmp_path, clock):
+    path = tmp_path / "seasons.txt"
+    write(path, SEASONS, 1_000_000_000)
+    guide = SeasonsGuide(path, check_interval=5)
+    guide.regions()
+    
+    write(path, SEASONS.replace("## south_america", "## oceania"), 2_000_000_000)
+    # Edits are picked up on the next check, not on every lookup
+    clock.advance(4)
+    assert json.loads(guide.regions()) == ["europe", "south_america"]
+    clock.advance(2)
+    assert json.loads(guide.regions()) == ["europe", "oceania"]
+    assert guide.loads == 2
+    
+    # An unchanged mtime is only stat'ed again
+    clock.advance(10)
+    guide.regions()
+    assert guide.loads == 2
+
+
+def test_missing_files_raise_os_errors(tmp_path, clock):
+    with pytest.raises(OSError):
+        SeasonsGuide(tmp_path / "missing.txt").regions()
+
+
+def test_documents_checklist_regions_and_general_sections():
+    checklist = DocumentsChecklist()
+    regions = json.loads(checklist.regions())
+    assert "europe" in regions and "essential_documents" not in regions
+    assert json.loads(checklist.region("United States"))["region"] == "united_states"
+    assert json.loads(checklist.region("essential_documents"))["documents"]
+    with pytest.raises(UnknownGuideKeyException, match="general sections"):
+        checklist.region("atlantis")
+
+
+def test_bundled_seasons_guide_covers_every_month():
+    guide = SeasonsGuide()
+    for region in json.loads(guide.regions()):
+        assert [json.loads(guide.month(region, str(month)))["month"] for month in (1, 12)] == ["January", "December"]
+
+
+def test_guides_must_build_their_slices():
+    with pytest.raises(TypeError):
+        TravelGuide(travel_guides.SEASONS_GUIDE_PATH)
@@ -0,0 +1,68 @@
+import asyncio
+from src.infrastructure.config.settings import get_config
+from src.infrastructure.container import Container
+
+
+def test_background_work_is_opt_in():
+    container = Container()
+    assert not get_config().price_watch.enabled
+    assert container.query_log is None
+    assert container.cache_warmer is None
+    assert container.flight_app_service._query_log is None
+
+
+def test_cache_warming_shares_the_background_budget(monkeypatch):
+    monkeypatch.setenv("QUERY_LOG_ENABLED", "true")
+    monkeypatch.setenv("CACHE_WARM_ENABLED", "true")
+    container = Container()
+    assert container.flight_app_service._query_log is container.query_log
+    assert container.cache_warmer._budget is container.background_budget
+    assert container.price_watch_service._budget is container.background_budget
+    container.query_log.close()
+
+
+def test_price_watches_bypass_the_offer_caches(monkeypatch):
+    monkeypatch.setenv("FLIGHT_CACHE_ENABLED", "true")
+    container = Container()
+    gateway = container.price_watch_service._flight_search_service._flight_gateway
+    assert gateway is container.live_flight_gateway
+    assert gateway is not container.flight_gateway
+    assert gateway._persistent_cache is None
+
+
+class StubAuthService:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.calls = 0
+    
+    async def get_access_token(self) -> str:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return "token"
+
+
+def test_warm_up_builds_the_service_graph_and_fetches_the_token():
+    container = Container()
+    container._auth_service = StubAuthService()
+    
+    async def scenario():
+        await container.warm_up()
+        assert container._auth_service.calls == 1
+        assert container._flight_app_service is not None
+        assert container._city_index is not None
+        assert container._http_client._client is not None
+        await container.aclose()
+    
+    asyncio.run(scenario())
+
+
+def test_warm_up_failures_are_left_to_the_first_request():
+    container = Container()
+    container._auth_service = StubAuthService(ConnectionError("offline"))
+    
+    async def scenario():
+        await container.warm_up()
+        await container.aclose()
+    
+    asyncio.run(scenario())
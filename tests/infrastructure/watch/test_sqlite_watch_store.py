@@ -0,0 +1,93 @@
+import asyncio
+from datetime import date, datetime
+import pytest
+from src.domain.entities.price_watch import PricePoint, PriceWatch
+from src.infrastructure.watch.sqlite_watch_store import SQLiteWatchStore
+from tests.factories import search_params
+
+# Watches are claimed only until their departure date
+NOW = datetime(2030, 1, 1).timestamp()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteWatchStore(tmp_path / "watches.db", history_limit=3)
+    yield store
+    store.close()
+
+
+def watch(id: str, next_check_at: float = NOW, **kwargs) -> PriceWatch:
+    return PriceWatch(id=id, params=search_params(**kwargs), interval=3600, created_at=NOW, next_check_at=next_check_at)
+
+
+def test_add_get_remove(store):
+    async def scenario():
+        await store.add(watch("a", return_date=date(2030, 3, 10), max_price=900))
+        loaded = await store.get("a")
+        assert loaded == watch("a", return_date=date(2030, 3, 10), max_price=900)
+        assert [w.id for w in await store.list_all()] == ["a"]
+        
+        assert await store.remove("a")
+        assert not await store.remove("a")
+        assert await store.get("a") is None
+    
+    asyncio.run(scenario())
+
+
+def test_claim_due_leases_watches(store):
+    async def scenario():
+        await store.add(watch("late", NOW + 60))
+        await store.add(watch("due", NOW - 60))
+        await store.add(watch("departed", NOW - 120, departure_date=date(2029, 12, 1)))
+        await store.add(watch("also-due", NOW))
+        
+        claimed = await store.claim_due(NOW, limit=5, lease=300)
+        assert [w.id for w in claimed] == ["due", "also-due"]
+        # Leased watches are not handed out again until the lease expires
+        assert await store.claim_due(NOW, limit=5, lease=300) == []
+        assert [w.id for w in await store.claim_due(NOW + 300, limit=1, lease=300)] == ["late"]
+        assert await store.claim_due(NOW, limit=0, lease=300) == []
+        assert store.stats()["claimed"] == 3
+    
+    asyncio.run(scenario())
+
+
+def test_record_keeps_latest_history(store):
+    async def scenario():
+        watched = watch("a")
+        await store.add(watched)
+        for check in range(5):
+            watched.checks = check + 1
+            watched.snapshot = {"TP82": 100.0 + check}
+            point = PricePoint(
+                checked_at=NOW + check,
+                min_price=100.0 + check,
+                previous_min_price=99.0 + check,
+                currency="EUR",
+                offers=1,
+                price_changes={"TP82": (99.0 + check, 100.0 + check)}
+            )
+            await store.record(watched, point)
+        
+        history = await store.history("a", limit=10)
+        assert [p.checked_at for p in history] == [NOW + 4, NOW + 3, NOW + 2]
+        assert history[0] == point
+        assert (await store.get("a")).snapshot == {"TP82": 104.0}
+        
+        unchanged = PricePoint(checked_at=NOW + 5, min_price=104.0, offers=1)
+        await store.record(watched, unchanged)
+        assert (await store.history("a", limit=1)) == [unchanged]
+    
+    asyncio.run(scenario())
+
+
+def test_record_after_removal_is_dropped(store):
+    async def scenario():
+        watched = watch("a")
+        await store.add(watched)
+        await store.remove("a")
+        await store.record(watched, PricePoint(checked_at=NOW))
+        assert await store.history("a", limit=10) == []
+        assert await store.get("a") is None
+    
+    asyncio.run(scenario())
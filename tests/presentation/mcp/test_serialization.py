@@ -0,0 +1,116 @@
+import json
+import pytest
+from dataclasses import asdict
+from src.application.dto.flight_dto import FlightOfferDTO, FlightResultPageDTO
+from src.domain.exceptions.flight_exceptions import InvalidSearchParametersException
+from src.presentation.mcp import serialization
+from src.presentation.mcp.serialization import FLIGHT_FIELDS, MIN_OUTPUT_BYTES, encode, encode_flight_page
+
+
+@pytest.fixture(params=["orjson", "json"], autouse=True)
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(serialization, "_orjson_checked", False)
+    else:
+        monkeypatch.setattr(serialization, "_orjson", None)
+        monkeypatch.setattr(serialization, "_orjson_checked", True)
+    return request.param
+
+
+def offer(index: int) -> FlightOfferDTO:
+    return FlightOfferDTO(
+        id=str(index),
+        origin="GRU",
+        destination="LIS",
+        departure_time="2030-03-01T10:00:00",
+        arrival_time="2030-03-01T20:00:00",
+        duration="PT10H",
+        price=100.0 + index,
+        currency="EUR",
+        airline="TP",
+        flight_number=f"{index}",
+        is_direct=index % 2 == 0,
+        seats_available=4,
+        travel_class="ECONOMY"
+    )
+
+
+def page(count: int = 5, offset: int = 0, total: int | None = None, cursor: str | None = "c" * 16) -> FlightResultPageDTO:
+    total = offset + count if total is None else total
+    return FlightResultPageDTO(
+        flights=[offer(offset + index) for index in range(count)],
+        cursor=cursor,
+        total=total,
+        offset=offset,
+        next_offset=offset + count if offset + count < total and cursor else None
+    )
+
+
+def test_full_objects_match_the_dataclasses():
+    result = json.loads(encode_flight_page(page(3, total=10)))
+    assert result == {
+        "cursor": "c" * 16,
+        "total": 10,
+        "offset": 0,
+        "next_offset": 3,
+        "flights": [asdict(offer(index)) for index in range(3)]
+    }
+
+
+def test_projects_fields():
+    result = json.loads(encode_flight_page(page(2), fields=["price", "id", "price"]))
+    assert result["flights"] == [{"price": 100.0, "id": "0"}, {"price": 101.0, "id": "1"}]
+
+
+def test_table_lists_columns_once():
+    result = json.loads(encode_flight_page(page(2), fields=["id", "is_direct"], output_format="table"))
+    assert result["columns"] == ["id", "is_direct"]
+    assert result["rows"] == [["0", True], ["1", False]]
+    assert "flights" not in result
+    
+    full = json.loads(encode_flight_page(page(1), output_format="table"))
+    assert full["columns"] == list(FLIGHT_FIELDS)
+
+
+@pytest.mark.parametrize("output_format", ["objects", "table"])
+@pytest.mark.parametrize("max_bytes", [MIN_OUTPUT_BYTES, 1000, 2500])
+def test_truncates_to_max_bytes(output_format, max_bytes):
+    text = encode_flight_page(page(50, offset=40, total=100), output_format=output_format, max_bytes=max_bytes)
+    result = json.loads(text)
+    kept = len(result["rows" if output_format == "table" else "flights"])
+    assert len(text.encode()) <= max_bytes
+    assert result["truncated"] is True
+    assert result["next_offset"] == 40 + kept
+    
+    # The next offer would not have fit
+    untruncated = encode_flight_page(page(kept + 1, offset=40, total=100), output_format=output_format)
+    assert len(untruncated.encode()) > max_bytes - len(',"truncated":true')
+
+
+def test_pages_within_budget_are_untouched():
+    small = page(2, total=2)
+    assert encode_flight_page(small, max_bytes=100_000) == encode_flight_page(small)
+    assert "truncated" not in json.loads(encode_flight_page(small, max_bytes=100_000))
+
+
+def test_truncated_pages_without_a_cursor_have_no_next_offset():
+    result = json.loads(encode_flight_page(page(20, cursor=None), max_bytes=MIN_OUTPUT_BYTES))
+    assert result["truncated"] is True
+    assert result["next_offset"] is None
+
+
+@pytest.mark.parametrize("options", [
+    {"output_format": "csv"},
+    {"fields": ["price", "legroom"]},
+    {"max_bytes": MIN_OUTPUT_BYTES - 1}
+])
+def test_invalid_options(options):
+    with pytest.raises(InvalidSearchParametersException):
+        encode_flight_page(page(), **options)
+
+
+def test_compact_utf8_encoding():
+    text = encode({"city": "São Paulo", "offer": offer(1)})
+    assert text.startswith('{"city":"São Paulo","offer":{"id":"1",')
+    assert json.loads(text)["offer"] == asdict(offer(1))
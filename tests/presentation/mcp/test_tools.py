@@ -0,0 +1,86 @@
+import asyncio
+import json
+import pytest
+from mcp.server.fastmcp import FastMCP
+from src.infrastructure.container import container
+from src.presentation.mcp.tools import _progress_reporter, register_tools
+
+
+class RecordingFlightService:
+    """Stands in for the flight application service, failing the test if called"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def search_flights(self, request, progress=None):
+        self.calls += 1
+        raise AssertionError("searched despite invalid output options")
+    
+    async def get_results(self, request):
+        self.calls += 1
+        raise AssertionError("loaded results despite invalid output options")
+
+
+def call_tool(name: str, arguments: dict) -> dict:
+    mcp = FastMCP("test")
+    register_tools(mcp)
+    
+    async def call():
+        content = await mcp.call_tool(name, arguments)
+        blocks = content[0] if isinstance(content, tuple) else content
+        return json.loads(blocks[0].text)
+    
+    return asyncio.run(call())
+
+
+@pytest.mark.parametrize("options", [
+    {"output_format": "csv"},
+    {"fields": ["price", "legroom"]},
+    {"max_bytes": 10}
+])
+@pytest.mark.parametrize("tool, arguments", [
+    ("search_flights", {"origin_location_code": "GRU", "destination_location_code": "LIS", "departure_date": "2030-03-01"}),
+    ("get_results", {"cursor": "abc"})
+])
+def test_output_options_are_checked_before_searching(monkeypatch, tool, arguments, options):
+    service = RecordingFlightService()
+    monkeypatch.setattr(container, "_flight_app_service", service)
+    result = call_tool(tool, {**arguments, **options})
+    assert "error" in result
+    assert service.calls == 0
+
+
+class RecordingContext:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.progress = []
+        self.messages = []
+    
+    async def report_progress(self, completed, total, message=None):
+        if self.fail:
+            raise RuntimeError("client went away")
+        self.progress.append((completed, total, message))
+    
+    async def info(self, message):
+        self.messages.append(message)
+
+
+def test_progress_is_forwarded_as_notifications():
+    async def scenario():
+        ctx = RecordingContext()
+        report = _progress_reporter(ctx)
+        await report(1, 2, "GRU -> LIS: 300.0 EUR", {"price": 300.0})
+        await report(2, 2, "GRU -> MAD: no offers")
+        assert ctx.progress == [(1, 2, "GRU -> LIS: 300.0 EUR"), (2, 2, "GRU -> MAD: no offers")]
+        assert json.loads(ctx.messages[0])["partial"] == {"price": 300.0}
+        assert ctx.messages[1] == "GRU -> MAD: no offers"
+    
+    asyncio.run(scenario())
+
+
+def test_progress_failures_do_not_fail_the_search():
+    async def scenario():
+        await _progress_reporter(RecordingContext(fail=True))(1, 1, "done")
+    
+    assert _progress_reporter(None) is None
+    asyncio.run(scenario())
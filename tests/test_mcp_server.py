@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+import uvicorn
+import mcp_server
+from src.infrastructure.config import settings
+from src.infrastructure.config.settings import PersistentCacheConfig, ServerConfig
+
+SERVER_VARIABLES = ("MCP_TRANSPORT", "MCP_HOST", "MCP_PORT", "MCP_WORKERS", "MCP_STATELESS_HTTP", "PERSISTENT_CACHE_ENABLED")
+
+
+def test_startup_does_not_build_the_configuration(monkeypatch):
+    # Missing credentials must only fail the first tool call that needs them
+    monkeypatch.delenv("AMADEUS_API_KEY")
+    monkeypatch.setenv("MCP_PORT", "9000")
+    
+    async def start_and_stop():
+        async with mcp_server.managed_container():
+            pass
+    
+    assert mcp_server.parse_args([]).port == 9000
+    asyncio.run(start_and_stop())
+    assert settings._config is None
+
+
+def test_arguments_override_the_environment():
+    args = mcp_server.parse_args(["--transport", "streamable-http", "--workers", "2"])
+    assert (args.transport, args.workers) == ("streamable-http", 2)
+
+
+@pytest.fixture
+def server_env(monkeypatch):
+    # serve_http exports its options for the worker processes; restore them afterwards
+    for name in SERVER_VARIABLES:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.mark.parametrize("env, stateless", [
+    ({}, False),
+    ({"MCP_WORKERS": "4"}, True),
+    ({"MCP_WORKERS": "4", "MCP_STATELESS_HTTP": "false"}, False),
+    ({"MCP_STATELESS_HTTP": "true"}, True)
+])
+def test_several_workers_default_to_stateless_http(server_env, env, stateless):
+    for name, value in env.items():
+        server_env.setenv(name, value)
+    assert ServerConfig.from_env().stateless_http is stateless
+
+
+def test_sse_refuses_several_workers(server_env):
+    server_env.setattr(uvicorn, "run", lambda *args, **kwargs: pytest.fail("started uvicorn"))
+    with pytest.raises(SystemExit):
+        mcp_server.serve_http(mcp_server.parse_args(["--transport", "sse", "--workers", "2"]))
+
+
+def test_workers_share_state_through_the_persistent_cache(server_env):
+    runs = []
+    server_env.setattr(uvicorn, "run", lambda app, **kwargs: runs.append((app, kwargs)))
+    mcp_server.serve_http(mcp_server.parse_args(["--transport", "streamable-http", "--port", "9001", "--workers", "3"]))
+    
+    app, options = runs[0]
+    assert app == "mcp_server:create_http_app"
+    assert (options["factory"], options["port"], options["workers"]) == (True, 9001, 3)
+    # Worker processes rebuild the same configuration from the environment
+    server = ServerConfig.from_env()
+    assert (server.transport, server.port, server.workers, server.stateless_http) == ("streamable-http", 9001, 3, True)
+    assert PersistentCacheConfig.from_env().enabled
+
+
+@pytest.mark.parametrize("transport, path", [("streamable-http", "/mcp"), ("sse", "/sse")])
+def test_http_app_per_worker(server_env, transport, path):
+    created = []
+    create_server = mcp_server.create_server
+    
+    def recording_create_server(**kwargs):
+        created.append(kwargs)
+        return create_server(**kwargs)
+    
+    server_env.setattr(mcp_server, "create_server", recording_create_server)
+    server_env.setenv("MCP_TRANSPORT", transport)
+    server_env.setenv("MCP_WORKERS", "2")
+    app = mcp_server.create_http_app()
+    assert path in [route.path for route in app.routes]
+    assert created[0]["stateless_http"] is True